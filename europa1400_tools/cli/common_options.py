@@ -1,3 +1,4 @@
+import os
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Annotated, Optional
@@ -12,6 +13,7 @@ from europa1400_tools.const import (
     ANIMATIONS_BIN,
     AOBJ_JSON,
     AOBJ_PICKLE,
+    COLUMNS_EXTENSION,
     CONVERTED_DIR,
     DATA_DIR,
     DECODED_DIR,
@@ -23,16 +25,21 @@ from europa1400_tools.const import (
     GROUPS_BIN,
     MAPPED_ANIMATONS_PICKLE,
     MISSING_PATHS_TXT,
+    OBJECTS_ANIMATION_INDEX_JSON,
     OBJECTS_BIN,
     OUTPUT_ANIMATIONS_DIR,
+    OUTPUT_ARCHIVES_DIR,
+    OUTPUT_CACHE_DIR,
     OUTPUT_GFX_DIR,
     OUTPUT_GROUPS_DIR,
+    OUTPUT_MANIFESTS_DIR,
     OUTPUT_META_DIR,
     OUTPUT_OBJECTS_DIR,
     OUTPUT_SCENES_DIR,
     OUTPUT_SFX_DIR,
     OUTPUT_TEXTURES_DIR,
     OUTPUT_TXS_DIR,
+    PICKLE_EXTENSION,
     RESOURCES_DIR,
     SCENES_BIN,
     SFX_DIR,
@@ -68,11 +75,46 @@ class CommonOptions:
         ),
     ] = str(DEFAULT_OUTPUT_PATH)
     use_cache: Annotated[
-        bool, typer.Option("--use-cache", "-c", help="Use cached files.")
+        bool,
+        typer.Option(
+            "--use-cache",
+            "-c",
+            help="Use cached files without checking them for changes.",
+        ),
+    ] = False
+    stream: Annotated[
+        bool,
+        typer.Option(
+            "--stream",
+            "-s",
+            help="Decode files from the archives without extracting them.",
+        ),
+    ] = False
+    columnar: Annotated[
+        bool,
+        typer.Option(
+            "--columnar",
+            help="Store decoded geometry as NumPy arrays instead of pickles.",
+        ),
+    ] = False
+    compiled: Annotated[
+        bool,
+        typer.Option(
+            "--compiled",
+            help="Parse fixed-layout formats with compiled parsers.",
+        ),
     ] = False
     verbose: Annotated[
         bool, typer.Option("--verbose", "-v", help="Verbose output.")
     ] = False
+    _jobs: Annotated[
+        int,
+        typer.Option(
+            "--jobs",
+            "-j",
+            help="Number of worker processes, 0 uses all CPU cores.",
+        ),
+    ] = 1
 
     ATTRNAME: str = field(default="common_params", metadata={"ignore": True})
 
@@ -90,6 +132,21 @@ class CommonOptions:
         """Return the path to the output directory."""
         return Path(self._output_path).resolve()
 
+    @property
+    def jobs(self) -> int:
+        """Return the number of worker processes."""
+
+        if self._jobs <= 0:
+            return os.cpu_count() or 1
+
+        return self._jobs
+
+    @property
+    def decoded_extension(self) -> str:
+        """Return the extension of decoded files."""
+
+        return COLUMNS_EXTENSION if self.columnar else PICKLE_EXTENSION
+
     @classmethod
     def from_context(cls, ctx: typer.Context) -> "CommonOptions":
         if (common_params_dict := getattr(ctx, "common_params", None)) is None:
@@ -117,6 +174,16 @@ class CommonOptions:
         """Return the path to the decoded directory."""
         return self.output_path / DECODED_DIR
 
+    @property
+    def archive_indexes_path(self) -> Path:
+        """Return the path to the archive indexes directory."""
+        return self.output_path / OUTPUT_ARCHIVES_DIR
+
+    @property
+    def decoded_manifests_path(self) -> Path:
+        """Return the path to the decode manifests directory."""
+        return self.decoded_path / OUTPUT_MANIFESTS_DIR
+
     @property
     def converted_path(self) -> Path:
         """Return the path to the converted directory."""
@@ -247,6 +314,11 @@ class CommonOptions:
         """Return the path to the mapped animations directory."""
         return self.output_path / MAPPED_ANIMATONS_PICKLE
 
+    @property
+    def objects_animation_index_path(self) -> Path:
+        """Return the path to the index matching objects to animations."""
+        return self.decoded_manifests_path / OBJECTS_ANIMATION_INDEX_JSON
+
     @property
     def missing_paths_path(self) -> Path:
         """Return the path to the missing paths file."""
@@ -287,6 +359,11 @@ class CommonOptions:
         """Return the path to the converted sfx directory."""
         return self.converted_path / OUTPUT_SFX_DIR
 
+    @property
+    def cached_sfx_path(self) -> Path:
+        """Return the path to the cache of transcoded sounds."""
+        return self.output_path / OUTPUT_CACHE_DIR / OUTPUT_SFX_DIR
+
     @property
     def game_scenes_path(self) -> Path:
         """Return the path to the game scenes directory."""
@@ -42,4 +42,6 @@ class Building(DataclassMixin):
 class AGeb(BaseConstruct):
     """Structure of A_Geb file."""
 
+    compilable = True
+
     buildings: list[Building] = csfield(cs.Array(88, DataclassStruct(Building)))
@@ -31,4 +31,6 @@ class Object(DataclassMixin):
 class AObj(BaseConstruct):
     """Structure of A_Obj file."""
 
+    compilable = True
+
     objects: list[Object] = csfield(cs.Array(732, DataclassStruct(Object)))
@@ -5,6 +5,7 @@ from pathlib import Path
 import construct as cs
 import numpy as np
 from construct_typed import DataclassMixin, DataclassStruct, csfield
+from numpy.lib.recfunctions import structured_to_unstructured
 
 from europa1400_tools.const import (
     BAF_INI_FILE_KEYS,
@@ -12,10 +13,16 @@ from europa1400_tools.const import (
     BAF_INI_FILE_LOOP_OUT,
     BAF_INI_FILE_NUM_KEYS,
     BAF_INI_FILE_SECTION,
+    OBJECTS_STRING_ENCODING,
     SourceFormat,
 )
 from europa1400_tools.construct.base_construct import BaseConstruct
-from europa1400_tools.construct.common import Vector3
+from europa1400_tools.construct.common import (
+    VECTOR3_DTYPE,
+    NumpyArray,
+    Vector3,
+    to_record_array,
+)
 
 
 @dataclass
@@ -87,7 +94,7 @@ class PointContainer(DataclassMixin):
     const_19: bytes = csfield(cs.Const(b"\x19"))
     count: int = csfield(cs.Int32ul)
     const_21: bytes = csfield(cs.Const(b"\x21"))
-    vertices: list[Vector3] = csfield(cs.Array(cs.this.count, DataclassStruct(Vector3)))
+    vertices: np.recarray = csfield(NumpyArray(cs.this.count, VECTOR3_DTYPE))
     const_28: bytes = csfield(cs.Const(b"\x28"))
     skeleton_container_flag: bytes | None = csfield(cs.Optional(cs.Const(b"\x31")))
     skeleton_container: SkeletonContainer | None = csfield(
@@ -126,13 +133,21 @@ class BafIni:
         if not file.exists():
             raise FileNotFoundError(f"File {file} does not exist.")
 
+        return cls.from_bytes(file.read_bytes(), file)
+
+    @classmethod
+    def from_bytes(cls, data: bytes, path: Path):
+        """Parse the settings of an animation from the bytes of its INI file."""
+
         baf_ini_file = cls.__new__(cls)
 
         config = configparser.ConfigParser()
-        config.read(file)
+        config.read_string(data.decode(OBJECTS_STRING_ENCODING), source=str(path))
 
         if not config.has_section(BAF_INI_FILE_SECTION):
-            raise KeyError(f"Section {BAF_INI_FILE_SECTION} not found in config file.")
+            raise KeyError(
+                f"Section {BAF_INI_FILE_SECTION} not found in config file {path}."
+            )
 
         baf_ini_file.num_keys = config.getint(
             BAF_INI_FILE_SECTION, BAF_INI_FILE_NUM_KEYS
@@ -170,19 +185,51 @@ class Baf(BaseConstruct):
     def keyframe_count(self) -> int:
         return self.header.num_keys
 
+    @property
+    def vertex_count(self) -> int:
+        """Return the number of vertices of each key."""
+
+        if len(self.body.keys) == 0:
+            return 0
+
+        return sum(model.count for model in self.body.keys[0].models)
+
+    def get_key_vertices(self, key_index: int) -> np.ndarray:
+        """Return the vertices of all models of a key as a (vertices, 3) array."""
+
+        return self._get_vertices(self.body.keys[key_index].models).reshape(-1, 3)
+
     def get_vertices_per_key(self) -> np.ndarray:
-        vertices_per_key: list = []
+        """Return the vertices of all keys as a (keys, vertices, 3) array."""
 
-        for key in self.body.keys:
-            vertices: list = []
+        return self._get_vertices(
+            [model for key in self.body.keys for model in key.models]
+        ).reshape(len(self.body.keys), self.vertex_count, 3)
 
-            for model in key.models:
-                for vertex in model.vertices:
-                    vertices.append([vertex.x, vertex.y, vertex.z])
+    @staticmethod
+    def _get_vertices(models: list[PointContainer]) -> np.ndarray:
+        """Concatenate the vertices of point containers into a float32 array."""
 
-            vertices_per_key.append(vertices)
+        if len(models) == 0:
+            return np.empty((0, 3), dtype=np.float32)
 
-        return np.array(vertices_per_key, dtype=np.float32)
+        return structured_to_unstructured(
+            np.concatenate(
+                [to_record_array(model.vertices, VECTOR3_DTYPE) for model in models]
+            ),
+            dtype=np.float32,
+        )
+
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """Return the vertices of each point container as arrays."""
+
+        return {
+            f"body.keys.{key_index}.models.{model_index}.vertices": to_record_array(
+                model.vertices, VECTOR3_DTYPE
+            )
+            for key_index, key in enumerate(self.body.keys)
+            for model_index, model in enumerate(key.models)
+        }
 
     @property
     def format(self) -> SourceFormat:
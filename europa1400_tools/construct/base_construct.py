@@ -1,33 +1,97 @@
+import io
 import json
+import mmap
+import os
 from abc import ABC
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Type, TypeVar
+from typing import Any, ClassVar, Type, TypeVar
 
 import construct as cs
+import numpy as np
 from construct_typed import DataclassMixin, DataclassStruct, csfield
 
 from europa1400_tools.construct.common import asdict
+from europa1400_tools.construct.compiled import get_compiled_struct
 
 T = TypeVar("T", bound="BaseConstruct")
 
 
+class MappedFile(mmap.mmap):
+    """Read-only memory map of a file that knows the name of the file."""
+
+    name: str
+
+
 @dataclass
 class BaseConstruct(ABC, DataclassMixin):
     """Base construct class."""
 
     path: Path = csfield(cs.Computed(lambda ctx: Path(ctx._io.name)))
 
+    compilable: ClassVar[bool] = False
+    """Whether the construct may be parsed with a compiled parser."""
+
     @classmethod
-    def from_file(cls: Type[T], file_path: Path) -> T:
-        """Read the file and return the construct."""
+    def get_struct(cls, compiled: bool = False) -> Any:
+        """Return the parser of the construct.
+
+        The compiled parser is only returned for compilable constructs.
+        """
+
+        if compiled and cls.compilable:
+            return get_compiled_struct(cls)
+
+        return DataclassStruct(cls)
+
+    @classmethod
+    def from_file(
+        cls: Type[T], file_path: Path, mapped: bool = False, compiled: bool = False
+    ) -> T:
+        """Read the file and return the construct.
+
+        If mapped, the file is parsed from a memory map and MappedBytes fields are
+        memoryviews into it instead of copies. Such constructs cannot be pickled.
+        If compiled, compilable constructs are parsed with a compiled parser.
+        """
+
+        if mapped:
+            with open(file_path, "rb") as file:
+                if os.fstat(file.fileno()).st_size > 0:
+                    stream = MappedFile(file.fileno(), 0, access=mmap.ACCESS_READ)
+                    stream.name = str(file_path)
 
-        obj: T = DataclassStruct(cls).parse_file(
+                    return cls.get_struct(compiled).parse_stream(stream)
+
+        obj: T = cls.get_struct(compiled).parse_file(
             file_path,
         )
 
         return obj
 
+    @classmethod
+    def from_bytes(
+        cls: Type[T], data: bytes, file_path: Path, compiled: bool = False
+    ) -> T:
+        """Parse the bytes of a file and return the construct."""
+
+        stream = io.BytesIO(data)
+        stream.name = str(file_path)
+
+        obj: T = cls.get_struct(compiled).parse_stream(stream)
+
+        return obj
+
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """Return the geometry of the construct as arrays keyed by field path.
+
+        Field paths are attribute names and list indices separated by dots, for
+        example `game_objects.0.model.vertices`. The columnar decoded store keeps
+        these arrays outside of the pickled construct.
+        """
+
+        return {}
+
     def to_dict(self) -> dict:
         """Return the dict representation of the construct."""
 
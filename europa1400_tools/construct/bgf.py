@@ -2,26 +2,30 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import construct as cs
+import numpy as np
 from construct_typed import DataclassMixin, DataclassStruct, csfield
+from numpy.lib.recfunctions import structured_to_unstructured
 
 from europa1400_tools.const import OBJECTS_STRING_ENCODING, SourceFormat
 from europa1400_tools.construct.baf import Vector3
 from europa1400_tools.construct.base_construct import BaseConstruct
-from europa1400_tools.construct.common import Skip0, SkipNonLatin1, ignoredcsfield
+from europa1400_tools.construct.common import (
+    VECTOR3_DTYPE,
+    NumpyArray,
+    Skip0,
+    SkipBytes,
+    SkipNonLatin1,
+    ignoredcsfield,
+    to_record_array,
+)
 from europa1400_tools.helpers import strip_non_ascii
 
 
-def skip_until(obj, ctx):
-    if obj in ctx.acceptable_values:
-        raise cs.CancelParsing
-
-
 @dataclass
 class SkipUntil28(DataclassMixin):
     """Structure of a skip_until_28 block."""
 
-    acceptable_values: list[int] = csfield(cs.Computed(lambda ctx: [0x28]))
-    skipped: list[int] = csfield(cs.GreedyRange(cs.Byte * skip_until))
+    skipped: bytes = csfield(SkipBytes(set(range(256)) - {0x28}))
     const_28: bytes = csfield(cs.Const(b"\x28"))
 
 
@@ -43,6 +47,16 @@ class TextureCoordinate(DataclassMixin):
     w: float = csfield(cs.Float32l)
 
 
+FACE_DTYPE = np.dtype([("a", "<u4"), ("b", "<u4"), ("c", "<u4")])
+TEXTURE_MAPPING_DTYPE = np.dtype(
+    [
+        ("vertex_u", VECTOR3_DTYPE),
+        ("vertex_v", VECTOR3_DTYPE),
+        ("vertex_w", VECTOR3_DTYPE),
+    ]
+)
+
+
 @dataclass
 class TextureMapping(DataclassMixin):
     """Structure of texture mapping."""
@@ -119,8 +133,8 @@ class BgfModel(DataclassMixin):
     polygon_count: int = csfield(cs.Int16ul)
     skip_zero_2_2: bytes = csfield(cs.Const(b"\x00\x00"))
     skip_required_1B: bytes = csfield(cs.Const(b"\x1B"))
-    vertices: list[Vector3] = csfield(
-        cs.Array(lambda ctx: ctx.vertex_count, DataclassStruct(Vector3))
+    vertices: np.recarray = csfield(
+        NumpyArray(lambda ctx: ctx.vertex_count, VECTOR3_DTYPE)
     )
     skip_required_1C_1D: bytes = csfield(cs.Const(b"\x1C\x1D"))
     polygons: list[Polygon] = csfield(
@@ -185,6 +199,11 @@ class VertexMapping(DataclassMixin):
     vertex2: Vector3 = csfield(DataclassStruct(Vector3))
 
 
+VERTEX_MAPPING_DTYPE = np.dtype(
+    [("vertex1", VECTOR3_DTYPE), ("vertex2", VECTOR3_DTYPE)]
+)
+
+
 @dataclass
 class PolygonMapping(DataclassMixin):
     """Construct for PolygonMapping."""
@@ -194,6 +213,30 @@ class PolygonMapping(DataclassMixin):
     texture_index: int = csfield(cs.Byte)
 
 
+POLYGON_MAPPING_DTYPE = np.dtype(
+    [
+        ("face", FACE_DTYPE),
+        ("texture_mapping", TEXTURE_MAPPING_DTYPE),
+        ("texture_index", "u1"),
+    ]
+)
+
+
+@dataclass
+class BgfMesh:
+    """Geometry of a BGF mapping object.
+
+    Faces index the vertices with their corners a, b and c. The texture
+    coordinates hold the u and v values of each corner of each face.
+    """
+
+    vertices: np.ndarray
+    normals: np.ndarray
+    faces: np.ndarray
+    uvs: np.ndarray
+    texture_indices: np.ndarray
+
+
 @dataclass
 class BgfMappingObject(DataclassMixin):
     """Construct for BgfMappingObject."""
@@ -207,17 +250,43 @@ class BgfMappingObject(DataclassMixin):
     texture_count: int = csfield(cs.Int32ul)
     vertex_mapping_count: int = csfield(cs.Int32ul)
     polygon_mapping_count: int = csfield(cs.Int32ul)
-    vertex_mappings: list[VertexMapping] = csfield(
-        cs.Array(lambda ctx: ctx.vertex_mapping_count, DataclassStruct(VertexMapping))
-    )
-    box_vertex_mappings: list[VertexMapping] = csfield(
-        cs.Array(8, DataclassStruct(VertexMapping))
+    vertex_mappings: np.recarray = csfield(
+        NumpyArray(lambda ctx: ctx.vertex_mapping_count, VERTEX_MAPPING_DTYPE)
     )
+    box_vertex_mappings: np.recarray = csfield(NumpyArray(8, VERTEX_MAPPING_DTYPE))
     some_float: float = csfield(cs.Float32l)
-    polygons: list[PolygonMapping] = csfield(
-        cs.Array(lambda ctx: ctx.polygon_mapping_count, DataclassStruct(PolygonMapping))
+    polygons: np.recarray = csfield(
+        NumpyArray(lambda ctx: ctx.polygon_mapping_count, POLYGON_MAPPING_DTYPE)
     )
 
+    def get_mesh(self) -> BgfMesh:
+        """Return the vertices, faces and texture coordinates as plain arrays."""
+
+        vertex_mappings = to_record_array(self.vertex_mappings, VERTEX_MAPPING_DTYPE)
+        polygons = to_record_array(self.polygons, POLYGON_MAPPING_DTYPE)
+
+        return BgfMesh(
+            vertices=structured_to_unstructured(
+                vertex_mappings.vertex1, dtype=np.float32
+            ),
+            normals=structured_to_unstructured(
+                vertex_mappings.vertex2, dtype=np.float32
+            ),
+            faces=structured_to_unstructured(polygons.face, dtype=np.uint32),
+            uvs=np.stack(
+                [
+                    structured_to_unstructured(
+                        polygons.texture_mapping.vertex_u, dtype=np.float32
+                    ),
+                    structured_to_unstructured(
+                        polygons.texture_mapping.vertex_v, dtype=np.float32
+                    ),
+                ],
+                axis=-1,
+            ),
+            texture_indices=polygons.texture_index.astype(np.uint32),
+        )
+
 
 @dataclass
 class BgfTexture(DataclassMixin):
@@ -371,3 +440,23 @@ class Bgf(BaseConstruct):
         """Return the name of the construct."""
 
         return self.path.stem
+
+    def to_columns(self) -> dict[str, np.ndarray]:
+        """Return the vertices, vertex mappings and polygon mappings as arrays."""
+
+        columns = {
+            "mapping_object.vertex_mappings": to_record_array(
+                self.mapping_object.vertex_mappings, VERTEX_MAPPING_DTYPE
+            ),
+            "mapping_object.polygons": to_record_array(
+                self.mapping_object.polygons, POLYGON_MAPPING_DTYPE
+            ),
+        }
+
+        for index, game_object in enumerate(self.game_objects):
+            if game_object.model is not None:
+                columns[f"game_objects.{index}.model.vertices"] = to_record_array(
+                    game_object.model.vertices, VECTOR3_DTYPE
+                )
+
+        return columns
@@ -1,11 +1,14 @@
 import copy
 import dataclasses
+import mmap
+import os
 import textwrap
 from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Any, Callable, Optional, cast
+from typing import Any, Callable, Iterable, Optional, cast
 
 import construct as cs
+import numpy as np
 from construct_typed import DataclassMixin, DataclassStruct, csfield
 from construct_typed.generic_wrapper import Construct, Context, ParsedType
 
@@ -73,6 +76,154 @@ def ignoredcsfield(
     return metacsfield(subcon, doc=doc, parsed=parsed, metadata=metadata)
 
 
+class MappedBytes(cs.Construct):
+    """Bytes returned as a memoryview into the file when parsing from a memory map.
+
+    Parsing from any other stream returns a bytes copy like cs.Bytes.
+    """
+
+    def __init__(self, length: int | Callable[[Context], int]):
+        super().__init__()
+        self.length = length
+
+    def _parse(self, stream, context, path):
+        length = cs.evaluate(self.length, context)
+
+        if length < 0:
+            raise cs.RangeError(f"length must be non-negative, found {length}", path)
+
+        if not isinstance(stream, mmap.mmap):
+            return cs.stream_read(stream, length, path)
+
+        offset = stream.tell()
+
+        if offset + length > len(stream):
+            raise cs.StreamError(
+                "stream read less than specified amount, "
+                + f"expected {length}, found {len(stream) - offset}",
+                path=path,
+            )
+
+        stream.seek(length, os.SEEK_CUR)
+
+        return memoryview(stream)[offset : offset + length]
+
+    def _build(self, obj, stream, context, path):
+        length = cs.evaluate(self.length, context)
+        data = bytes(obj)
+        cs.stream_write(stream, data, length, path)
+        return obj
+
+    def _sizeof(self, context, path):
+        try:
+            return cs.evaluate(self.length, context)
+        except (KeyError, AttributeError):
+            raise cs.SizeofError(
+                "cannot calculate size, key not found in context", path=path
+            )
+
+
+class NumpyArray(cs.Construct):
+    """Array of fixed-size records read with a single np.frombuffer call.
+
+    Records with a structured dtype are returned as a record array, so fields can
+    be read as attributes like those of the dataclasses parsed by cs.Array.
+    """
+
+    def __init__(self, count: int | Callable[[Context], int], dtype: np.dtype):
+        super().__init__()
+        self.count = count
+        self.dtype = np.dtype(dtype)
+
+    def _parse(self, stream, context, path):
+        count = cs.evaluate(self.count, context)
+
+        if count < 0:
+            raise cs.RangeError(f"count must be non-negative, found {count}", path)
+
+        data = cs.stream_read(stream, count * self.dtype.itemsize, path)
+        array = np.frombuffer(data, dtype=self.dtype, count=count)
+
+        if self.dtype.names is not None:
+            return array.view(np.recarray)
+
+        return array
+
+    def _build(self, obj, stream, context, path):
+        count = cs.evaluate(self.count, context)
+        array = (
+            to_record_array(obj, self.dtype)
+            if self.dtype.names is not None
+            else np.asarray(obj, dtype=self.dtype)
+        )
+
+        if len(array) != count:
+            raise cs.RangeError(
+                f"expected {count} elements, found {len(array)}", path=path
+            )
+
+        cs.stream_write(stream, array.tobytes(), count * self.dtype.itemsize, path)
+        return obj
+
+    def _sizeof(self, context, path):
+        try:
+            return cs.evaluate(self.count, context) * self.dtype.itemsize
+        except (KeyError, AttributeError):
+            raise cs.SizeofError(
+                "cannot calculate size, key not found in context", path=path
+            )
+
+
+SKIP_BYTES_CHUNK_SIZE = 4096
+
+
+class SkipBytes(cs.Construct):
+    """Run of bytes with any of the given values, scanned in bulk.
+
+    Parsing stops before the first byte with another value or at the end of the
+    stream, like a GreedyRange of single bytes. The end of the run is found with a
+    single translate and find per chunk instead of parsing byte by byte.
+    """
+
+    def __init__(self, values: Iterable[int]):
+        super().__init__()
+        self.values = frozenset(values)
+        self.table = bytes(0 if value in self.values else 1 for value in range(256))
+
+    def _parse(self, stream, context, path):
+        chunks = []
+
+        while True:
+            chunk = stream.read(SKIP_BYTES_CHUNK_SIZE)
+            end = chunk.translate(self.table).find(b"\x01")
+
+            if end >= 0:
+                stream.seek(end - len(chunk), os.SEEK_CUR)
+                chunks.append(chunk[:end])
+                break
+
+            chunks.append(chunk)
+
+            if len(chunk) < SKIP_BYTES_CHUNK_SIZE:
+                break
+
+        return b"".join(chunks)
+
+    def _build(self, obj, stream, context, path):
+        obj = bytes(obj)
+
+        if obj.translate(self.table).find(b"\x01") >= 0:
+            raise cs.ValidationError(
+                f"object contains bytes other than {sorted(self.values)}", path=path
+            )
+
+        cs.stream_write(stream, obj, len(obj), path)
+        return obj
+
+    def _sizeof(self, context, path):
+        raise cs.SizeofError("skipped runs have no fixed size", path=path)
+
+
 _FIELDS = "__dataclass_fields__"
 
 
@@ -107,6 +258,10 @@ def _asdict_inner(obj, dict_factory):
         )
     if isinstance(obj, Path):
         return str(obj)
+    elif isinstance(obj, memoryview):
+        return obj.tobytes()
+    elif isinstance(obj, np.ndarray):
+        return obj.tolist()
     else:
         return copy.deepcopy(obj)
 
@@ -118,6 +273,26 @@ class Vector3(DataclassMixin):
     z: float = csfield(cs.Float32l)
 
 
+VECTOR3_DTYPE = np.dtype([("x", "<f4"), ("y", "<f4"), ("z", "<f4")])
+
+
+def to_record_array(values: list | np.ndarray, dtype: np.dtype) -> np.recarray:
+    """Pack a list of dataclasses into a record array.
+
+    The fields of the dtype must match the fields of the dataclasses in order.
+    Records support attribute access like the dataclasses they replace. Arrays,
+    such as geometry parsed straight into record arrays, are only copied if their
+    dtype differs.
+    """
+
+    if isinstance(values, np.ndarray):
+        return values.astype(dtype, copy=False).view(np.recarray)
+
+    return np.array([dataclasses.astuple(value) for value in values], dtype=dtype).view(
+        np.recarray
+    )
+
+
 @dataclass
 class Transform(DataclassMixin):
     """Structure of a transform block."""
@@ -134,52 +309,36 @@ class Latin1String(DataclassMixin):
     value: str = csfield(cs.Computed(lambda ctx: ctx._value_bytes.decode("latin-1")))
 
 
-def cancel_on_unacceptable(obj, ctx):
-    if obj not in ctx.acceptable_values:
-        raise cs.CancelParsing
+LATIN1_VALUE_SET = frozenset(LATIN1_VALUES)
 
 
 def is_valid_latin1_int(value: int) -> bool:
-    return value in LATIN1_VALUES
-
-
-def cancel_on_latin1(obj, ctx):
-    if is_valid_latin1_int(obj):
-        raise cs.CancelParsing
+    return value in LATIN1_VALUE_SET
 
 
 @dataclass
 class SkipNonLatin1(DataclassMixin):
-    """Structure of a skip0 block."""
+    """Structure of a skip_non_latin1 block."""
 
-    skipped: list[int] = ignoredcsfield(cs.GreedyRange(cs.Byte * cancel_on_latin1))
+    skipped: bytes = ignoredcsfield(SkipBytes(set(range(256)) - LATIN1_VALUE_SET))
 
 
 @dataclass
 class Skip0(DataclassMixin):
     """Structure of a skip0 block."""
 
-    acceptable_values: list[int] = ignoredcsfield(cs.Computed(lambda ctx: [0]))
-    skipped: list[int] = ignoredcsfield(
-        cs.GreedyRange(cs.Byte * cancel_on_unacceptable)
-    )
+    skipped: bytes = ignoredcsfield(SkipBytes([0]))
 
 
 @dataclass
 class Skip01(DataclassMixin):
     """Structure of a skip01 block."""
 
-    acceptable_values: list[int] = ignoredcsfield(cs.Computed(lambda ctx: [0, 1]))
-    skipped: list[int] = ignoredcsfield(
-        cs.GreedyRange(cs.Byte * cancel_on_unacceptable)
-    )
+    skipped: bytes = ignoredcsfield(SkipBytes([0, 1]))
 
 
 @dataclass
 class Skip1(DataclassMixin):
-    """Structure of a skip01 block."""
+    """Structure of a skip1 block."""
 
-    acceptable_values: list[int] = ignoredcsfield(cs.Computed(lambda ctx: [1]))
-    skipped: list[int] = ignoredcsfield(
-        cs.GreedyRange(cs.Byte * cancel_on_unacceptable)
-    )
+    skipped: bytes = ignoredcsfield(SkipBytes([1]))
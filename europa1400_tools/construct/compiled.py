@@ -0,0 +1,182 @@
+"""Compiled parsers for dataclass constructs.
+
+construct can compile a Struct into generated Python code, but it cannot emit
+code for the DataclassStruct adapters and lambdas used throughout the constructs
+of this package and links them back to the interpreter as a whole. The dataclass
+tree is therefore rewritten into plain Structs that are compiled, with the parsed
+Containers being converted into the dataclasses by the generated code. Fields
+that still cannot be compiled, such as Computed lambdas, are parsed by the
+interpreter from within the compiled code.
+"""
+
+import copy
+from functools import cache
+from typing import Type, TypeVar
+
+import construct as cs
+from construct_typed import DataclassMixin, DataclassStruct
+
+T = TypeVar("T", bound=DataclassMixin)
+
+_SUBCON_ATTRIBUTES = {
+    "subcon",
+    "subcons",
+    "thensubcon",
+    "elsesubcon",
+    "name",
+    "docs",
+    "flagbuildnone",
+}
+
+
+class CompiledDataclassStruct:
+    """Parser for a dataclass construct using compiled code."""
+
+    def __init__(self, dc_type: Type[T]):
+        self.dc_type = dc_type
+
+        self.compiled = _rewrite(DataclassStruct(dc_type)).compile()
+
+    def parse(self, data: bytes, **contextkw) -> T:
+        """Parse bytes into the dataclass."""
+
+        return self.compiled.parse(data, **contextkw)
+
+    def parse_stream(self, stream, **contextkw) -> T:
+        """Parse a stream into the dataclass."""
+
+        return self.compiled.parse_stream(stream, **contextkw)
+
+    def parse_file(self, filename: str, **contextkw) -> T:
+        """Parse a file into the dataclass."""
+
+        with open(filename, "rb") as file:
+            return self.parse_stream(file, **contextkw)
+
+
+@cache
+def get_compiled_struct(dc_type: Type[T]) -> CompiledDataclassStruct:
+    """Return the compiled parser of a dataclass construct, compiling it once."""
+
+    return CompiledDataclassStruct(dc_type)
+
+
+class _Linked(cs.Subconstruct):
+    """Subconstruct that compiled code hands back to the interpreter."""
+
+    def _parse(self, stream, context, path):
+        return self.subcon._parsereport(stream, context, path)
+
+    def _build(self, obj, stream, context, path):
+        return self.subcon._build(obj, stream, context, path)
+
+    def _emitparse(self, code):
+        raise NotImplementedError
+
+
+class _IndexedArray(cs.Array):
+    """Array whose compiled code sets `_index` in the context like the interpreter."""
+
+    def _emitparse(self, code):
+        return (
+            f"ListContainer(({self.subcon._compileparse(code)}) "
+            + f"for i in range({self.count}) "
+            + "if not this.__setitem__('_index', i))"
+        )
+
+
+class _Padded(cs.Padded):
+    """Padded whose compiled code measures the parsed size like the interpreter.
+
+    construct emits the size of the subcon as a constant, which fails for
+    subcons of variable size such as arrays with a length field.
+    """
+
+    def _emitparse(self, code):
+        code.linkedinstances[id(self)] = self
+
+        return (
+            f"linkedinstances[{id(self)}]._skip_padding("
+            + f"io, io.tell(), {self.subcon._compileparse(code)}, this)"
+        )
+
+    def _skip_padding(self, stream, start, obj, context):
+        """Skip the padding after the subcon and return its value."""
+
+        length = cs.evaluate(self.length, context)
+        pad = length - (stream.tell() - start)
+
+        if pad < 0:
+            raise cs.PaddingError(
+                f"subcon parsed {length - pad} bytes but was allowed only {length}"
+            )
+
+        cs.stream_read(stream, pad, "(compiled)")
+
+        return obj
+
+
+class _Dataclass(cs.Subconstruct):
+    """Compilable Struct whose parsed Container is converted into a dataclass."""
+
+    def __init__(self, subcon: cs.Struct, dataclass_struct: DataclassStruct):
+        super().__init__(subcon)
+        self.dataclass_struct = dataclass_struct
+
+    def _parse(self, stream, context, path):
+        return self.dataclass_struct._decode(
+            self.subcon._parsereport(stream, context, path), context, path
+        )
+
+    def _build(self, obj, stream, context, path):
+        return self.dataclass_struct._build(obj, stream, context, path)
+
+    def _emitparse(self, code):
+        code.linkedinstances[id(self)] = self
+
+        return (
+            f"linkedinstances[{id(self)}].dataclass_struct._decode("
+            + f"{self.subcon._compileparse(code)}, this, None)"
+        )
+
+
+def _has_interpreted_params(subcon: cs.Construct) -> bool:
+    """Check if a construct has parameters that compiled code cannot express."""
+
+    return any(
+        callable(value) and not isinstance(value, (cs.ExprMixin, cs.Construct, type))
+        for name, value in vars(subcon).items()
+        if name not in _SUBCON_ATTRIBUTES
+    )
+
+
+def _rewrite(subcon: cs.Construct) -> cs.Construct:
+    """Rewrite a construct into one that compiles without linking dataclasses."""
+
+    if isinstance(subcon, DataclassStruct):
+        return _Dataclass(_rewrite(subcon.subcon), subcon)
+
+    if isinstance(subcon, cs.Struct):
+        return cs.Struct(*[_rewrite(field) for field in subcon.subcons])
+
+    if _has_interpreted_params(subcon):
+        return _Linked(subcon)
+
+    if isinstance(subcon, cs.Array):
+        return _IndexedArray(subcon.count, _rewrite(subcon.subcon))
+
+    if isinstance(subcon, cs.Padded):
+        return _Padded(subcon.length, _rewrite(subcon.subcon), subcon.pattern)
+
+    if isinstance(subcon, cs.IfThenElse):
+        return cs.IfThenElse(
+            subcon.condfunc, _rewrite(subcon.thensubcon), _rewrite(subcon.elsesubcon)
+        )
+
+    if isinstance(subcon, cs.Subconstruct):
+        rewritten = copy.copy(subcon)
+        rewritten.subcon = _rewrite(subcon.subcon)
+
+        return rewritten
+
+    return subcon
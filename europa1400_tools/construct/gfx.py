@@ -1,10 +1,14 @@
 from dataclasses import dataclass
 
 import construct as cs
+import numpy as np
 from construct_typed import DataclassMixin, DataclassStruct, csfield
 
 from europa1400_tools.const import SourceFormat
 from europa1400_tools.construct.base_construct import BaseConstruct
+from europa1400_tools.construct.common import MappedBytes
+
+LAZY_SHAPEBANKS_PARAM = "lazy_shapebanks"
 
 
 @dataclass
@@ -13,7 +17,9 @@ class TransparencyBlock(DataclassMixin):
 
     size_transparent: int = csfield(cs.Int32ul)
     count_pixels: int = csfield(cs.Int32ul)
-    pixel_data: bytes = csfield(cs.Bytes(lambda ctx: ctx.count_pixels * 3))
+    pixel_data: bytes | memoryview = csfield(
+        MappedBytes(lambda ctx: ctx.count_pixels * 3)
+    )
 
 
 @dataclass
@@ -57,10 +63,10 @@ class Graphic(DataclassMixin):
     has_transparency: bool = csfield(
         cs.Computed(lambda ctx: ctx.size_without_footer > 0)
     )
-    pixel_data: bytes | None = csfield(
+    pixel_data: bytes | memoryview | None = csfield(
         cs.If(
             lambda ctx: not ctx.has_transparency,
-            cs.Bytes(lambda ctx: ctx.width * ctx.height * 3),
+            MappedBytes(lambda ctx: ctx.width * ctx.height * 3),
         )
     )
     graphic_rows: list[GraphicRow] | None = csfield(
@@ -82,10 +88,57 @@ class Graphic(DataclassMixin):
         )
     )
 
+    def get_rgba_pixels(self) -> np.ndarray:
+        """Return the pixels as a flat array of RGBA values.
+
+        Transparent runs become white pixels with zero alpha. The rows are
+        concatenated without padding, so the array may be shorter or longer than
+        width * height if the row data does not match the dimensions.
+        """
+
+        if self.pixel_data is not None:
+            rgb_pixels = np.frombuffer(self.pixel_data, dtype=np.uint8).reshape(-1, 3)
+            rgba_pixels = np.full((len(rgb_pixels), 4), 0xFF, dtype=np.uint8)
+            rgba_pixels[:, :3] = rgb_pixels
+            return rgba_pixels
+
+        transparency_blocks = [
+            transparency_block
+            for graphic_row in self.graphic_rows or []
+            for transparency_block in graphic_row.transparency_blocks
+        ]
+
+        run_lengths = np.array(
+            [
+                (
+                    transparency_block.size_transparent // 3,
+                    len(transparency_block.pixel_data) // 3,
+                )
+                for transparency_block in transparency_blocks
+            ],
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        is_opaque = np.repeat(
+            np.tile([False, True], len(run_lengths)), run_lengths.ravel()
+        )
+
+        rgba_pixels = np.empty((len(is_opaque), 4), dtype=np.uint8)
+        rgba_pixels[~is_opaque] = (0xFF, 0xFF, 0xFF, 0x00)
+        rgba_pixels[is_opaque, :3] = np.frombuffer(
+            b"".join(
+                transparency_block.pixel_data
+                for transparency_block in transparency_blocks
+            ),
+            dtype=np.uint8,
+        ).reshape(-1, 3)
+        rgba_pixels[is_opaque, 3] = 0xFF
+
+        return rgba_pixels
+
 
 @dataclass
-class Shapebank(DataclassMixin):
-    """Structure of a shapebank."""
+class ShapebankHeader(DataclassMixin):
+    """Structure of the header of a shapebank preceding its graphics."""
 
     const_shapbank: bytes = csfield(cs.Const(b"SHAPBANK"))
     magic1: int = csfield(cs.Byte)
@@ -102,6 +155,12 @@ class Shapebank(DataclassMixin):
     offsets: list[int] = csfield(
         cs.Padded(0x800, cs.Array(lambda ctx: ctx.graphics_count, cs.Int32ul))
     )
+
+
+@dataclass
+class Shapebank(ShapebankHeader):
+    """Structure of a shapebank."""
+
     graphics: list[Graphic] = csfield(
         cs.Array(lambda ctx: ctx.graphics_count, DataclassStruct(Graphic))
     )
@@ -132,7 +191,8 @@ class ShapebankDefinition(BaseConstruct):
     is_font: bool = csfield(cs.Computed(lambda ctx: ctx.width == 0 and ctx.height == 0))
     shapebank: Shapebank | None = csfield(
         cs.If(
-            lambda ctx: ctx.address != 0,
+            lambda ctx: ctx.address != 0
+            and not ctx._params.get(LAZY_SHAPEBANKS_PARAM, False),
             cs.Pointer(
                 lambda ctx: ctx.address,
                 DataclassStruct(Shapebank),
@@ -145,9 +205,11 @@ class ShapebankDefinition(BaseConstruct):
 class Gfx(BaseConstruct):
     """Structure of the gfx file."""
 
+    compilable = True
+
     shapebank_count: int = csfield(cs.Int32ul)
     shapebank_definitions: list[ShapebankDefinition] = csfield(
-        cs.Array(lambda ctx: ctx.shapebank_count, DataclassStruct(ShapebankDefinition))
+        cs.Array(cs.this.shapebank_count, DataclassStruct(ShapebankDefinition))
     )
 
     @property
@@ -7,70 +7,32 @@ from construct_typed import DataclassMixin, DataclassStruct, csfield
 
 from europa1400_tools.construct.baf import Vector3
 from europa1400_tools.construct.base_construct import BaseConstruct
-from europa1400_tools.construct.common import ignoredcsfield
+from europa1400_tools.construct.common import Skip0, Skip01, SkipBytes, ignoredcsfield
 
 
 def is_01(obj, ctx):
     return obj == 1
 
 
-def cancel_on_unacceptable(obj, ctx):
-    if obj not in ctx.acceptable_values:
-        raise cs.CancelParsing
-
-
-@dataclass
-class Skip0(DataclassMixin):
-    """Structure of a skip0 block."""
-
-    acceptable_values: list[int] = ignoredcsfield(cs.Computed(lambda ctx: [0]))
-    skipped: list[int] = ignoredcsfield(
-        cs.GreedyRange(cs.Byte * cancel_on_unacceptable)
-    )
-
-
-@dataclass
-class Skip01(DataclassMixin):
-    """Structure of a skip01 block."""
-
-    acceptable_values: list[int] = ignoredcsfield(cs.Computed(lambda ctx: [0, 1]))
-    skipped: list[int] = ignoredcsfield(
-        cs.GreedyRange(cs.Byte * cancel_on_unacceptable)
-    )
-
-
 @dataclass
 class Skip013(DataclassMixin):
     """Structure of a skip013 block."""
 
-    acceptable_values: list[int] = ignoredcsfield(cs.Computed(lambda ctx: [0, 1, 3]))
-    skipped: list[int] = ignoredcsfield(
-        cs.GreedyRange(cs.Byte * cancel_on_unacceptable)
-    )
+    skipped: bytes = ignoredcsfield(SkipBytes([0, 1, 3]))
 
 
 @dataclass
 class Skip12345678(DataclassMixin):
-    """Structure of a skip0123456 block."""
+    """Structure of a skip12345678 block."""
 
-    acceptable_values: list[int] = ignoredcsfield(
-        cs.Computed(lambda ctx: [1, 2, 3, 4, 5, 6, 7, 8])
-    )
-    skipped: list[int] = ignoredcsfield(
-        cs.GreedyRange(cs.Byte * cancel_on_unacceptable)
-    )
+    skipped: bytes = ignoredcsfield(SkipBytes(range(1, 9)))
 
 
 @dataclass
 class Skip012345678(DataclassMixin):
-    """Structure of a skip0123456 block."""
+    """Structure of a skip012345678 block."""
 
-    acceptable_values: list[int] = ignoredcsfield(
-        cs.Computed(lambda ctx: [0, 1, 2, 3, 4, 5, 6, 7, 8])
-    )
-    skipped: list[int] = ignoredcsfield(
-        cs.GreedyRange(cs.Byte * cancel_on_unacceptable)
-    )
+    skipped: bytes = ignoredcsfield(SkipBytes(range(0, 9)))
 
 
 @dataclass
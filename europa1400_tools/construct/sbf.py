@@ -1,12 +1,14 @@
 """Construct structures for SBF files."""
 
 from dataclasses import dataclass
+from typing import BinaryIO, Iterator
 
 import construct as cs
 from construct_typed import DataclassMixin, DataclassStruct, csfield
 
 from europa1400_tools.const import SoundbankType, SoundType, SourceFormat
 from europa1400_tools.construct.base_construct import BaseConstruct
+from europa1400_tools.construct.common import MappedBytes
 
 
 @dataclass
@@ -71,10 +73,10 @@ class Soundbank(DataclassMixin):
     sound_definitions: list[SoundDefinition] = csfield(
         cs.Array(cs.this.sound_count, DataclassStruct(SoundDefinition))
     )
-    sounds: list[bytes] = csfield(
+    sounds: list[bytes | memoryview] = csfield(
         cs.Array(
             cs.this.sound_count,
-            cs.Bytes(
+            MappedBytes(
                 # pylint: disable=protected-access
                 lambda this: this.sound_definitions[this._index].length
             ),
@@ -82,10 +84,35 @@ class Soundbank(DataclassMixin):
     )
 
 
+@dataclass
+class SbfHeader(DataclassMixin):
+    """Structure of the SBF file header up to the first soundbank."""
+
+    name: str = csfield(cs.PaddedString(308, "ascii"))
+    soundbank_count: int = csfield(cs.Int32ul)
+    magic: bytes = csfield(cs.Bytes(4))
+    padding: bytes = csfield(cs.Bytes(8))
+    soundbank_definitions: list[SoundbankDefinition] = csfield(
+        cs.Array(cs.this.soundbank_count, DataclassStruct(SoundbankDefinition))
+    )
+
+
+@dataclass
+class SbfSound:
+    """Position of a sound among the soundbanks of an SBF file."""
+
+    soundbank_name: str
+    index: int
+    sound_count: int
+    sound_type: SoundType
+
+
 @dataclass
 class Sbf(BaseConstruct):
     """Structure of SBF file."""
 
+    compilable = True
+
     name: str = csfield(cs.PaddedString(308, "ascii"))
     soundbank_count: int = csfield(cs.Int32ul)
     magic: bytes = csfield(cs.Bytes(4))
@@ -102,3 +129,77 @@ class Sbf(BaseConstruct):
         """Return the format of the construct."""
 
         return SourceFormat.SBF
+
+    def iter_sounds(self) -> Iterator[tuple[SbfSound, bytes | memoryview]]:
+        """Iterate over the sounds of all soundbanks."""
+
+        for soundbank in self.soundbanks:
+            for index, (sound_definition, sound) in enumerate(
+                zip(soundbank.sound_definitions, soundbank.sounds)
+            ):
+                yield SbfSound(
+                    soundbank.soundbank_definition.name,
+                    index,
+                    soundbank.sound_count,
+                    sound_definition.sound_type,
+                ), sound
+
+
+class SbfReader:
+    """Reader of the sounds of an SBF file, one sound at a time.
+
+    Only the header is parsed up front. Soundbank headers and sound definitions
+    are parsed as the soundbanks are reached, and each sound is read from its
+    offset when it is iterated, so no more than one sound is held in memory.
+    """
+
+    file: BinaryIO
+    header: SbfHeader
+
+    def __init__(self, file: BinaryIO):
+        self.file = file
+        self.header = DataclassStruct(SbfHeader).parse_stream(file)
+
+    @property
+    def name(self) -> str:
+        """Return the name of the SBF file."""
+
+        return self.header.name
+
+    def iter_sounds(self) -> Iterator[tuple[SbfSound, bytes]]:
+        """Iterate over the sounds of all soundbanks in file order."""
+
+        offset = self.file.tell()
+
+        for soundbank_definition in self.header.soundbank_definitions:
+            self.file.seek(offset)
+            sound_count = 1
+
+            if soundbank_definition.soundbank_type == SoundbankType.MULTI:
+                sound_count = (
+                    DataclassStruct(SoundbankHeader).parse_stream(self.file).sound_count
+                )
+
+            sound_definitions: list[SoundDefinition] = cs.Array(
+                sound_count, DataclassStruct(SoundDefinition)
+            ).parse_stream(self.file)
+            offset = self.file.tell()
+
+            for index, sound_definition in enumerate(sound_definitions):
+                self.file.seek(offset)
+                sound = self.file.read(sound_definition.length)
+
+                if len(sound) != sound_definition.length:
+                    raise cs.StreamError(
+                        "stream read less than specified amount, "
+                        + f"expected {sound_definition.length}, found {len(sound)}"
+                    )
+
+                offset += sound_definition.length
+
+                yield SbfSound(
+                    soundbank_definition.name,
+                    index,
+                    sound_count,
+                    sound_definition.sound_type,
+                ), sound
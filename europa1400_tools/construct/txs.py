@@ -12,12 +12,14 @@ from europa1400_tools.helpers import strip_non_ascii
 class Txs(BaseConstruct):
     """Structure of TXS file."""
 
+    compilable = True
+
     magic: int = csfield(cs.Int32ul)
     num1: int = csfield(cs.Int32ul)
     num2: int = csfield(cs.Int32ul)
 
     _texture_names: list[Latin1String] = csfield(
-        cs.Array(lambda ctx: ctx.num1 * ctx.num2, DataclassStruct(Latin1String))
+        cs.Array(cs.this.num1 * cs.this.num2, DataclassStruct(Latin1String))
     )
 
     @property
@@ -0,0 +1,78 @@
+"""Cache of transcoded sounds keyed by the hash of their payload."""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+
+from europa1400_tools.const import TargetFormat
+
+
+class AudioCache:
+    """Content-addressed store of transcoded sounds.
+
+    A transcoded sound is stored under the hash of its source payload, the target
+    format and the fingerprint of the transcoder. Identical sounds in any
+    soundbank or SBF file are transcoded once, and changing the transcoder does
+    not reuse files it wrote before.
+    """
+
+    cache_path: Path
+    fingerprint: str
+
+    def __init__(self, cache_path: Path, fingerprint: str):
+        self.cache_path = cache_path
+        self.fingerprint = fingerprint
+
+    def get_key(
+        self, audio_bytes: bytes | memoryview, target_format: TargetFormat
+    ) -> str:
+        """Return the key of a sound transcoded to the target format."""
+
+        key_hash = hashlib.sha256()
+        key_hash.update(self.fingerprint.encode())
+        key_hash.update(target_format.value[0].encode())
+        key_hash.update(audio_bytes)
+
+        return key_hash.hexdigest()
+
+    def get_path(self, key: str, target_format: TargetFormat) -> Path:
+        """Return the path a sound is cached at."""
+
+        return self.cache_path / key[:2] / f"{key}{target_format.extension}"
+
+    def get(self, key: str, target_format: TargetFormat) -> Path | None:
+        """Return the path of a cached sound, or None if it is not cached."""
+
+        cached_path = self.get_path(key, target_format)
+
+        return cached_path if cached_path.exists() else None
+
+    def store(self, key: str, target_format: TargetFormat, audio_bytes: bytes) -> Path:
+        """Store a transcoded sound and return its path.
+
+        The sound is written to a temporary file first, so workers storing the
+        same sound at the same time never expose a partially written file. Empty
+        sounds are rejected, as a cached sound is never transcoded again.
+        """
+
+        if not audio_bytes:
+            raise ValueError(f"Transcoded sound {key} is empty")
+
+        cached_path = self.get_path(key, target_format)
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
+
+        temporary_file = tempfile.NamedTemporaryFile(
+            dir=cached_path.parent, suffix=".tmp", delete=False
+        )
+
+        try:
+            with temporary_file:
+                temporary_file.write(audio_bytes)
+
+            os.replace(temporary_file.name, cached_path)
+        except BaseException:
+            Path(temporary_file.name).unlink(missing_ok=True)
+            raise
+
+        return cached_path
@@ -0,0 +1,196 @@
+"""Transcoding of SBF sounds with a shared pool of ffmpeg workers."""
+
+import io
+import os
+import wave
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import ClassVar
+
+from europa1400_tools.const import SoundType, TargetFormat
+
+PCM_SAMPLE_WIDTH = 2
+PCM_FFMPEG_FORMAT = "s16le"
+ID3V2_HEADER_SIZE = 10
+MP3_SAMPLE_RATES = {
+    3: (44100, 48000, 32000),
+    2: (22050, 24000, 16000),
+    0: (11025, 12000, 8000),
+}
+MP3_MONO_CHANNEL_MODE = 3
+
+
+def write_wav(
+    pcm_bytes: bytes,
+    channel_count: int,
+    sample_rate: int,
+    sample_width: int = PCM_SAMPLE_WIDTH,
+) -> bytes:
+    """Return interleaved little-endian PCM samples as the bytes of a WAV file."""
+
+    wav_buffer = io.BytesIO()
+
+    with wave.open(wav_buffer, "wb") as wav_file:
+        wav_file.setnchannels(channel_count)
+        wav_file.setsampwidth(sample_width)
+        wav_file.setframerate(sample_rate)
+        wav_file.writeframes(pcm_bytes)
+
+    return wav_buffer.getvalue()
+
+
+def read_mp3_format(mp3_bytes: bytes) -> tuple[int, int] | None:
+    """Return the sample rate and channel count of the first MP3 frame.
+
+    An ID3v2 tag in front of the first frame is skipped. Returns None if no
+    valid frame header is found there.
+    """
+
+    offset = 0
+
+    if mp3_bytes[:3] == b"ID3" and len(mp3_bytes) >= ID3V2_HEADER_SIZE:
+        tag_size = 0
+        for size_byte in mp3_bytes[6:10]:
+            tag_size = (tag_size << 7) | (size_byte & 0x7F)
+        offset = ID3V2_HEADER_SIZE + tag_size
+
+    header = mp3_bytes[offset : offset + 4]
+
+    if len(header) < 4 or header[0] != 0xFF or header[1] & 0xE0 != 0xE0:
+        return None
+
+    version = (header[1] >> 3) & 0x03
+    layer = (header[1] >> 1) & 0x03
+    bitrate_index = header[2] >> 4
+    sample_rate_index = (header[2] >> 2) & 0x03
+
+    if (
+        version not in MP3_SAMPLE_RATES
+        or layer == 0
+        or bitrate_index == 0x0F
+        or sample_rate_index == 0x03
+    ):
+        return None
+
+    channel_count = 1 if header[3] >> 6 == MP3_MONO_CHANNEL_MODE else 2
+
+    return MP3_SAMPLE_RATES[version][sample_rate_index], channel_count
+
+
+def run_ffmpeg(input_bytes: bytes, **output_kwargs) -> bytes:
+    """Pipe bytes through ffmpeg and return its output.
+
+    Raises a RuntimeError with the output of ffmpeg on stderr if it fails or
+    writes nothing, so a failed transcode is never taken for a sound.
+    """
+
+    # pylint: disable=import-outside-toplevel
+    import ffmpeg
+
+    process = (
+        ffmpeg.input("pipe:")
+        .output("pipe:", **output_kwargs)
+        .run_async(pipe_stdin=True, pipe_stdout=True, pipe_stderr=True)
+    )
+
+    output_bytes, error_bytes = process.communicate(input=input_bytes)
+
+    if process.returncode != 0 or not output_bytes:
+        error_message = error_bytes.decode(errors="replace").strip()
+        raise RuntimeError(
+            f"ffmpeg failed with exit code {process.returncode}: {error_message}"
+        )
+
+    return output_bytes
+
+
+def convert_mp3_to_wav(mp3_bytes: bytes) -> bytes:
+    """Convert MP3 to WAV.
+
+    ffmpeg only decodes the samples, the WAV header is written here. A WAV file
+    written by ffmpeg to a pipe has no valid sizes, as it cannot seek back.
+    """
+
+    mp3_format = read_mp3_format(mp3_bytes)
+
+    if mp3_format is None:
+        return run_ffmpeg(mp3_bytes, format="wav")
+
+    sample_rate, channel_count = mp3_format
+    pcm_bytes = run_ffmpeg(
+        mp3_bytes, format=PCM_FFMPEG_FORMAT, ar=sample_rate, ac=channel_count
+    )
+
+    return write_wav(pcm_bytes, channel_count, sample_rate)
+
+
+def convert_wav_to_mp3(wav_bytes: bytes) -> bytes:
+    """Convert WAV to MP3."""
+
+    return run_ffmpeg(wav_bytes, format="mp3")
+
+
+def needs_transcoding(sound_type: SoundType, target_format: TargetFormat) -> bool:
+    """Return whether a sound has to be transcoded to the target format."""
+
+    return (sound_type, target_format) in (
+        (SoundType.WAV, TargetFormat.MP3),
+        (SoundType.MP3, TargetFormat.WAV),
+    )
+
+
+class AudioTranscoder:
+    """Bounded pool of threads transcoding sounds with ffmpeg.
+
+    Each worker waits on one ffmpeg process at a time, so up to `max_workers`
+    sounds are transcoded concurrently while the GIL is released. The pool of a
+    process is created on first use and shared by all converters.
+    """
+
+    _shared: ClassVar["AudioTranscoder | None"] = None
+
+    max_workers: int
+    executor: ThreadPoolExecutor
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="ffmpeg"
+        )
+
+    @classmethod
+    def shared(cls, max_workers: int | None = None) -> "AudioTranscoder":
+        """Return the transcoder shared by the current process.
+
+        `max_workers` only applies when the transcoder is created.
+        """
+
+        if cls._shared is None:
+            cls._shared = cls(max_workers)
+
+        return cls._shared
+
+    def transcode(
+        self,
+        audio_bytes: bytes | memoryview,
+        sound_type: SoundType,
+        target_format: TargetFormat,
+    ) -> Future[bytes]:
+        """Transcode a sound to the target format once.
+
+        Sounds already in the target format are written as they are and must not
+        be passed here.
+        """
+
+        if not needs_transcoding(sound_type, target_format):
+            raise ValueError(
+                f"{sound_type.name} sounds are not transcoded to {target_format.name}"
+            )
+
+        return self.executor.submit(
+            (
+                convert_wav_to_mp3
+                if target_format == TargetFormat.MP3
+                else convert_mp3_to_wav
+            ),
+            bytes(audio_bytes),
+        )
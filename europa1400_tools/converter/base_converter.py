@@ -1,18 +1,24 @@
 """Base class for converters."""
 
 import logging
-import pickle
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from pathlib import Path
 from timeit import default_timer as timer
 from typing import Generic, Type, TypeVar, final
 
 from europa1400_tools.cli.common_options import CommonOptions
 from europa1400_tools.cli.convert_options import ConvertOptions
-from europa1400_tools.const import PICKLE_EXTENSION, SourceFormat, TargetFormat
+from europa1400_tools.const import SourceFormat, TargetFormat
 from europa1400_tools.construct.base_construct import BaseConstruct
 from europa1400_tools.decoder.base_decoder import BaseDecoder
+from europa1400_tools.decoder.decoded_store import (
+    DECODED_EXTENSIONS,
+    is_decoded_file,
+    load_decoded,
+)
 from europa1400_tools.helpers import normalize
+from europa1400_tools.pool import run_in_process_pool
 from europa1400_tools.rich.common import console
 from europa1400_tools.rich.progress import Progress
 
@@ -49,22 +55,22 @@ class BaseConverter(ABC, Generic[ConstructType]):
         file_paths = file_paths or ConvertOptions.instance.file_paths or []
         extracted_file_paths: list[Path] = []
         decoded_file_paths: list[Path] = []
+        source_file_paths: list[Path] = []
 
         if not any(file_paths):
-            decoded_file_paths = decoder.decode_files()
+            if self.parses_mapped_source_files:
+                source_file_paths = decoder.find_files()
+            else:
+                decoded_file_paths = decoder.decode_files()
         else:
             for file_path in file_paths:
-                if (
-                    normalize(file_path.suffix)
-                    not in [
-                        normalize(decoder.file_suffix),
-                        normalize(PICKLE_EXTENSION),
-                    ]
-                    or file_path.is_dir()
+                if file_path.is_dir() or not (
+                    normalize(file_path.suffix) == normalize(decoder.file_suffix)
+                    or is_decoded_file(file_path)
                 ):
                     console.print(
                         f"Skipping {file_path}: not a {decoder.file_suffix} "
-                        + f"or {PICKLE_EXTENSION} file"
+                        + f"or {' or '.join(DECODED_EXTENSIONS)} file"
                     )
                     continue
 
@@ -72,46 +78,138 @@ class BaseConverter(ABC, Generic[ConstructType]):
                     extracted_file_paths.append(file_path)
                     continue
 
-                if normalize(file_path.suffix) == normalize(PICKLE_EXTENSION):
-                    decoded_file_paths.append(file_path)
-                    continue
+                decoded_file_paths.append(file_path)
 
-        if any(extracted_file_paths):
+        if any(extracted_file_paths) and self.parses_mapped_source_files:
+            source_file_paths.extend(decoder.find_files(extracted_file_paths))
+        elif any(extracted_file_paths):
             decoded_extracted_file_paths = decoder.decode_files(extracted_file_paths)
             decoded_file_paths.extend(decoded_extracted_file_paths)
 
+        for file_path in decoded_file_paths:
+            if not is_decoded_file(file_path):
+                raise ValueError(f"Unknown file extension: {file_path.suffix}")
+
         self.preprocess(decoded_file_paths)
 
+        convertible_file_paths = decoded_file_paths + source_file_paths
+
         progress = Progress(
             title=f"Converting {self.construct_type.__name__}",
-            total_file_count=len(decoded_file_paths),
+            total_file_count=len(convertible_file_paths),
         )
 
+        failed_file_paths: dict[Path, Exception] = {}
+
         with progress:
-            for file_path in decoded_file_paths:
-                if normalize(file_path.suffix) != normalize(PICKLE_EXTENSION):
-                    raise ValueError(f"Unknown file extension: {file_path.suffix}")
+            if CommonOptions.instance.jobs > 1 and len(convertible_file_paths) > 1:
+                output_file_paths = self._convert_in_process_pool(
+                    convertible_file_paths, progress, failed_file_paths
+                )
+            else:
+                for file_path in convertible_file_paths:
+                    try:
+                        value_path, converted_file_paths = self.convert_file(file_path)
+                    except Exception as exception:  # pylint: disable=broad-except
+                        failed_file_paths[file_path] = exception
+                    else:
+                        progress.file_path = value_path
+                        output_file_paths.extend(converted_file_paths)
+
+                    progress.completed_file_count += 1
+
+        for file_path, exception in failed_file_paths.items():
+            console.print(f"Failed to convert {file_path}: {exception}")
+
+        if any(failed_file_paths):
+            console.print(
+                f"Failed to convert {len(failed_file_paths)}/"
+                + f"{len(convertible_file_paths)} files"
+            )
 
-                with file_path.open("rb") as file:
-                    value: BaseConstruct = pickle.load(file)
+        return output_file_paths
+
+    def _convert_in_process_pool(
+        self,
+        file_paths: list[Path],
+        progress: Progress,
+        failed_file_paths: dict[Path, Exception],
+    ) -> list[Path]:
+        """Convert decoded files in a process pool.
 
-                progress.file_path = value.path
+        Only the paths of the decoded files are sent to the workers. The
+        converter itself, including any state built in preprocess, is sent
+        once per worker.
+        """
 
-                converted_output_path = self.converted_path / value.path.parent
+        output_file_paths: list[Path] = []
 
-                if self.is_single_output_file:
-                    converted_output_path.parent.mkdir(parents=True, exist_ok=True)
-                else:
-                    converted_output_path.mkdir(parents=True, exist_ok=True)
+        def on_completed(future: Future) -> None:
+            if future.exception() is None:
+                progress.file_path, _ = future.result()
+            progress.completed_file_count += 1
 
-                converted_file_paths = self.convert(value, converted_output_path)
+        futures = run_in_process_pool(
+            self,
+            "convert_file",
+            [(file_path,) for file_path in file_paths],
+            on_completed,
+        )
 
-                output_file_paths.extend(converted_file_paths)
+        for file_path, future in zip(file_paths, futures):
+            if (exception := future.exception()) is not None:
+                failed_file_paths[file_path] = exception
+                continue
 
-                progress.completed_file_count += 1
+            _, converted_file_paths = future.result()
+            output_file_paths.extend(converted_file_paths)
 
         return output_file_paths
 
+    def convert_file(self, file_path: Path) -> tuple[Path, list[Path]]:
+        """Load a decoded file and convert it.
+
+        Source files that are not decoded files are parsed from a memory map instead.
+        Returns the path of the decoded asset and the paths of the converted files.
+        """
+
+        value: BaseConstruct
+
+        if is_decoded_file(file_path):
+            value = load_decoded(file_path)
+        else:
+            value = self.construct_type.from_file(
+                file_path, mapped=True, compiled=CommonOptions.instance.compiled
+            )
+            value.path = self.get_source_value_path(file_path)
+
+        return value.path, self.convert(
+            value, self.get_converted_output_path(value.path)
+        )
+
+    def get_source_value_path(self, file_path: Path) -> Path:
+        """Return the path of the asset in a source file as a decoder would."""
+
+        base_path = self.decoder_type().base_path
+
+        return (
+            file_path.relative_to(base_path)
+            if file_path.is_relative_to(base_path)
+            else Path(file_path.name)
+        )
+
+    def get_converted_output_path(self, value_path: Path) -> Path:
+        """Create the directory for the converted files of an asset and return it."""
+
+        converted_output_path = self.converted_path / value_path.parent
+
+        if self.is_single_output_file:
+            converted_output_path.parent.mkdir(parents=True, exist_ok=True)
+        else:
+            converted_output_path.mkdir(parents=True, exist_ok=True)
+
+        return converted_output_path
+
     @property
     def decoded_path(self) -> Path:
         """Return the decoded path."""
@@ -130,6 +228,16 @@ class BaseConverter(ABC, Generic[ConstructType]):
 
         return True
 
+    @property
+    def parses_mapped_source_files(self) -> bool:
+        """Return whether source files are parsed from a memory map.
+
+        Such converters skip decoding and convert the source files directly, so
+        large payloads are not copied into decoded files first.
+        """
+
+        return False
+
     def preprocess(
         self,
         file_paths: list[Path],
@@ -10,6 +10,7 @@ from europa1400_tools.const import TXS_EXTENSION, TargetFormat
 from europa1400_tools.construct.bgf import Bgf
 from europa1400_tools.construct.txs import Txs
 from europa1400_tools.converter.base_converter import BaseConverter, ConstructType
+from europa1400_tools.converter.metadata_registry import ObjectMetadataRegistry
 from europa1400_tools.decoder.baf_decoder import BafDecoder
 from europa1400_tools.decoder.bgf_decoder import BgfDecoder
 from europa1400_tools.decoder.txs_decoder import TxsDecoder
@@ -18,16 +19,13 @@ from europa1400_tools.helpers import rebase_path
 from europa1400_tools.preprocessor.animations_preprocessor import (
     AnimationsPreprocessor,
 )
-from europa1400_tools.preprocessor.objects_preprocessor import (
-    ObjectMetadata,
-    ObjectsPreprocessor,
-)
+from europa1400_tools.preprocessor.objects_preprocessor import ObjectsPreprocessor
 
 
 class BgfConverter(BaseConverter, ABC):
     """Converter for BGF files."""
 
-    object_metadatas: list[ObjectMetadata]
+    metadata_registry: ObjectMetadataRegistry
 
     def __init__(self):
         super().__init__(Bgf, BgfDecoder)
@@ -69,8 +67,13 @@ class BgfConverter(BaseConverter, ABC):
         txs_pickle_file_paths = txs_decoder.decode_files(txs_file_paths)
 
         objects_preprocessor = ObjectsPreprocessor()
-        self.object_metadatas = objects_preprocessor.preprocess_objects(
-            texture_paths, pickle_file_paths, txs_pickle_file_paths, animation_metadatas
+        self.metadata_registry = ObjectMetadataRegistry(
+            objects_preprocessor.preprocess_objects(
+                texture_paths,
+                pickle_file_paths,
+                txs_pickle_file_paths,
+                animation_metadatas,
+            )
         )
 
     def convert(
@@ -78,14 +81,7 @@ class BgfConverter(BaseConverter, ABC):
         value: ConstructType,
         output_path: Path,
     ) -> list[Path]:
-        object_metadata: ObjectMetadata | None = next(
-            (
-                object_metadata
-                for object_metadata in self.object_metadatas
-                if object_metadata.path == value.path
-            ),
-            None,
-        )
+        object_metadata = self.metadata_registry.get_object_metadata(value.path)
 
         if object_metadata is None:
             raise ValueError(f"no metadata found for {value.name}")
@@ -1,4 +1,3 @@
-import pickle
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -22,9 +21,6 @@ from pygltflib import (
     AnimationChannelTarget,
     AnimationSampler,
     Attributes,
-    Buffer,
-    BufferView,
-    Image,
     Material,
     Mesh,
     Node,
@@ -36,23 +32,15 @@ from pygltflib import Texture as GltfTexture
 from pygltflib import TextureInfo
 
 from europa1400_tools.cli.convert_options import ConvertOptions
-from europa1400_tools.const import (
-    GLB_EXTENSION,
-    PICKLE_EXTENSION,
-    PNG_EXTENSION,
-    TargetFormat,
-)
+from europa1400_tools.const import GLB_EXTENSION, PNG_EXTENSION, TargetFormat
 from europa1400_tools.construct.baf import Baf
 from europa1400_tools.construct.bgf import Bgf, BgfTexture
 from europa1400_tools.converter.bgf_converter import BgfConverter
+from europa1400_tools.converter.glb_writer import GlbWriter
 from europa1400_tools.decoder.baf_decoder import BafDecoder
 from europa1400_tools.decoder.bgf_decoder import BgfDecoder
-from europa1400_tools.helpers import (
-    bitmap_to_gltf_uri,
-    bytes_to_gltf_uri,
-    normalize,
-    png_to_gltf_uri,
-)
+from europa1400_tools.decoder.decoded_store import load_decoded
+from europa1400_tools.helpers import normalize
 from europa1400_tools.preprocessor.commands import preprocess_animations
 from europa1400_tools.preprocessor.objects_preprocessor import (
     ObjectMetadata,
@@ -81,6 +69,99 @@ class GltfMesh:
     primitives: list[GltfPrimitive]
 
 
+@dataclass
+class PrimitiveSplit:
+    """Faces of a texture with their vertices deduplicated by index and UV."""
+
+    indices: np.ndarray
+    vertex_indices: np.ndarray
+    uvs: np.ndarray
+
+
+def split_primitives(
+    faces: np.ndarray,
+    texture_indices: np.ndarray,
+    face_uvs: np.ndarray,
+    texture_count: int,
+) -> list[PrimitiveSplit | None]:
+    """Split the faces of a mesh into one primitive per texture.
+
+    glTF vertices have a single UV, so a mesh vertex is duplicated for every UV
+    it is used with. The corners of all faces are packed into integer keys of
+    texture, vertex index and UV and deduplicated with a single sort. Vertices
+    are numbered in the order their key first occurs among the faces of a
+    texture.
+    Textures without faces have no primitive.
+    """
+
+    corner_count = faces.size
+    corner_texture_indices = np.repeat(texture_indices.astype(np.uint32), 3)
+    corner_vertex_indices = faces.reshape(corner_count).astype(np.uint32)
+    corner_uvs = face_uvs.reshape(corner_count, 2).astype(np.float32) + np.float32(0)
+
+    # UVs are numbered by their bits first, which keeps the packed key small.
+    _, corner_uv_ids = np.unique(
+        corner_uvs.view(np.uint64).reshape(corner_count), return_inverse=True
+    )
+    vertex_count = int(corner_vertex_indices.max(initial=0)) + 1
+    uv_count = int(corner_uv_ids.max(initial=0)) + 1
+
+    corner_key_values = (
+        corner_texture_indices.astype(np.uint64) * np.uint64(vertex_count)
+        + corner_vertex_indices
+    ) * np.uint64(uv_count) + corner_uv_ids.reshape(corner_count).astype(np.uint64)
+
+    # Sorting the keys once and taking the smallest corner of every run gives
+    # the first occurrences without the stable sort of np.unique(return_index).
+    sorted_corners = np.argsort(corner_key_values)
+    is_new_key = np.ones(corner_count, dtype=bool)
+    is_new_key[1:] = np.diff(corner_key_values[sorted_corners]) != 0
+
+    first_corners = np.minimum.reduceat(sorted_corners, np.flatnonzero(is_new_key))
+    corner_keys = np.empty(corner_count, dtype=np.int64)
+    corner_keys[sorted_corners] = np.cumsum(is_new_key) - 1
+
+    key_textures = corner_texture_indices[first_corners]
+    key_order = np.argsort(key_textures.astype(np.int64) * corner_count + first_corners)
+    key_textures = key_textures[key_order]
+    key_starts = np.searchsorted(key_textures, np.arange(texture_count + 1))
+
+    key_positions = np.empty(len(key_order), dtype=np.int64)
+    key_positions[key_order] = (
+        np.arange(len(key_order)) - key_starts[np.minimum(key_textures, texture_count)]
+    )
+
+    corner_order = np.argsort(corner_texture_indices, kind="stable")
+    corner_starts = np.searchsorted(
+        corner_texture_indices[corner_order], np.arange(texture_count + 1)
+    )
+
+    primitive_splits: list[PrimitiveSplit | None] = []
+
+    for texture_index in range(texture_count):
+        corners = corner_order[
+            corner_starts[texture_index] : corner_starts[texture_index + 1]
+        ]
+
+        if len(corners) == 0:
+            primitive_splits.append(None)
+            continue
+
+        texture_first_corners = first_corners[
+            key_order[key_starts[texture_index] : key_starts[texture_index + 1]]
+        ]
+
+        primitive_splits.append(
+            PrimitiveSplit(
+                indices=key_positions[corner_keys[corners]].astype(np.uint32),
+                vertex_indices=corner_vertex_indices[texture_first_corners],
+                uvs=corner_uvs[texture_first_corners],
+            )
+        )
+
+    return primitive_splits
+
+
 class BgfGltfConverter(BgfConverter):
     """Class for converting BGF files to gLTF."""
 
@@ -119,22 +200,24 @@ class BgfGltfConverter(BgfConverter):
         reordered_textures = [None] * len(bgf.textures)
         missing_textures: list[BgfTexture] = []
 
-        footer_names = [
-            bgf_texture_name.name
-            for bgf_texture_name in bgf.footer.texture_names
-            if normalize(bgf_texture_name.name)
-            in [normalize(bgf_texture.name) for bgf_texture in bgf.textures]
-        ]
+        normalized_texture_names = {
+            normalize(bgf_texture.name) for bgf_texture in bgf.textures
+        }
+        footer_indices: dict[str, int] = {}
 
-        normalized_footer_names = [
-            normalize(footer_name) for footer_name in footer_names
-        ]
-        for i, bgf_texture in enumerate(bgf.textures):
-            if normalize(bgf_texture.name) not in normalized_footer_names:
+        for bgf_texture_name in bgf.footer.texture_names:
+            normalized_name = normalize(bgf_texture_name.name)
+
+            if normalized_name in normalized_texture_names:
+                footer_indices.setdefault(normalized_name, len(footer_indices))
+
+        for bgf_texture in bgf.textures:
+            texture_index = footer_indices.get(normalize(bgf_texture.name))
+
+            if texture_index is None:
                 missing_textures.append(bgf_texture)
                 continue
 
-            texture_index = normalized_footer_names.index(normalize(bgf_texture.name))
             reordered_textures[texture_index] = bgf_texture
 
         reordered_textures = [texture for texture in reordered_textures if texture]
@@ -143,6 +226,7 @@ class BgfGltfConverter(BgfConverter):
         name = bgf.path.stem
 
         gltf = GLTF2()
+        glb_writer = GlbWriter(gltf)
 
         bafs: list[Baf] = []
 
@@ -150,15 +234,13 @@ class BgfGltfConverter(BgfConverter):
             baf_paths = [
                 (
                     ConvertOptions.instance.decoded_animations_path / baf_path
-                ).with_suffix(PICKLE_EXTENSION)
+                ).with_suffix(ConvertOptions.instance.decoded_extension)
                 for baf_path, bgfs in self.baf_to_bgfs.items()
                 if any(bgf_path.stem.lower() == name.lower() for bgf_path in bgfs)
             ]
 
             for baf_path in baf_paths:
-                with open(baf_path, "rb") as input_file:
-                    baf = pickle.load(input_file)
-                    bafs.append(baf)
+                bafs.append(load_decoded(baf_path))
 
         gltf_mesh = self._convert_mesh(
             bgf, bafs, name, reordered_textures, object_metadata
@@ -191,7 +273,7 @@ class BgfGltfConverter(BgfConverter):
             primitives.append(primitive)
 
             self._add_gltf_data(
-                gltf=gltf,
+                glb_writer=glb_writer,
                 data=gltf_primitive.indices,
                 buffer_type=ELEMENT_ARRAY_BUFFER,
                 data_type=UNSIGNED_INT,
@@ -201,7 +283,7 @@ class BgfGltfConverter(BgfConverter):
             )
 
             self._add_gltf_data(
-                gltf=gltf,
+                glb_writer=glb_writer,
                 data=gltf_primitive.vertices,
                 buffer_type=ARRAY_BUFFER,
                 data_type=FLOAT,
@@ -210,7 +292,7 @@ class BgfGltfConverter(BgfConverter):
             )
 
             self._add_gltf_data(
-                gltf=gltf,
+                glb_writer=glb_writer,
                 data=gltf_primitive.normals,
                 buffer_type=ARRAY_BUFFER,
                 data_type=FLOAT,
@@ -219,7 +301,7 @@ class BgfGltfConverter(BgfConverter):
             )
 
             self._add_gltf_data(
-                gltf=gltf,
+                glb_writer=glb_writer,
                 data=gltf_primitive.uvs,
                 buffer_type=ARRAY_BUFFER,
                 data_type=FLOAT,
@@ -231,16 +313,13 @@ class BgfGltfConverter(BgfConverter):
                 ConvertOptions.instance.converted_textures_path
                 / gltf_primitive.texture_metadata.path
             )
-            texture_uri = png_to_gltf_uri(texture_path)
 
-            gltf.images.append(
-                Image(
-                    uri=texture_uri,
-                )
-            )
             gltf.textures.append(
                 GltfTexture(
-                    source=i,
+                    source=glb_writer.add_png_image(
+                        texture_path.read_bytes(),
+                        name=gltf_primitive.texture_metadata.name,
+                    ),
                     name=gltf_primitive.texture_metadata.name,
                 )
             )
@@ -270,7 +349,7 @@ class BgfGltfConverter(BgfConverter):
             for j, anim_vertices in enumerate(total_vertices_per_key):
                 relative_anim_vertices = anim_vertices - gltf_primitive.vertices
                 self._add_gltf_data(
-                    gltf=gltf,
+                    glb_writer=glb_writer,
                     data=relative_anim_vertices,
                     buffer_type=ARRAY_BUFFER,
                     data_type=FLOAT,
@@ -303,7 +382,7 @@ class BgfGltfConverter(BgfConverter):
                 ).flatten()
 
                 self._add_gltf_data(
-                    gltf=gltf,
+                    glb_writer=glb_writer,
                     data=weight_values_flattened,
                     data_type=FLOAT,
                     data_format=SCALAR,
@@ -320,7 +399,7 @@ class BgfGltfConverter(BgfConverter):
                     )
 
                 self._add_gltf_data(
-                    gltf=gltf,
+                    glb_writer=glb_writer,
                     data=time_values,
                     data_type=FLOAT,
                     data_format=SCALAR,
@@ -357,44 +436,26 @@ class BgfGltfConverter(BgfConverter):
         if not output_path.exists():
             output_path.mkdir(parents=True)
 
-        gltf.save_binary(glb_output_path)
+        glb_writer.write(glb_output_path)
 
         return [glb_output_path]
 
     def _add_gltf_data(
         self,
-        gltf: GLTF2,
+        glb_writer: GlbWriter,
         data: np.ndarray,
         data_type: int,
         data_format: str,
         name: str = "",
         minmax: bool = True,
         buffer_type: int | None = None,
-    ) -> tuple[Buffer, BufferView, Accessor]:
+    ) -> Accessor:
         if np.isnan(data).any():
             data = np.nan_to_num(data)
 
-        data_bytes = data.tobytes()
-
-        data_buffer = Buffer(
-            byteLength=len(data_bytes),
-            uri=bytes_to_gltf_uri(data_bytes),
-            extras={
-                "name": name,
-            },
-        )
-        gltf.buffers.append(data_buffer)
-
-        data_buffer_view = BufferView(
-            buffer=len(gltf.buffers) - 1,
-            byteLength=len(data_bytes),
-            byteOffset=0,
-            target=buffer_type,
-            extras={
-                "name": name,
-            },
+        buffer_view_index = glb_writer.add_buffer_view(
+            np.ascontiguousarray(data).tobytes(), target=buffer_type, name=name
         )
-        gltf.bufferViews.append(data_buffer_view)
 
         min: list[float] | None = None
         max: list[float] | None = None
@@ -408,7 +469,7 @@ class BgfGltfConverter(BgfConverter):
                 max = [float(np.max(data[:, i])) for i in range(data.shape[1])]
 
         data_accessor = Accessor(
-            bufferView=len(gltf.bufferViews) - 1,
+            bufferView=buffer_view_index,
             byteOffset=0,
             componentType=data_type,
             count=len(data),
@@ -419,9 +480,9 @@ class BgfGltfConverter(BgfConverter):
                 "name": name,
             },
         )
-        gltf.accessors.append(data_accessor)
+        glb_writer.gltf.accessors.append(data_accessor)
 
-        return data_buffer, data_buffer_view, data_accessor
+        return data_accessor
 
     def _convert_mesh(
         self,
@@ -439,80 +500,33 @@ class BgfGltfConverter(BgfConverter):
             primitives=gltf_primitives,
         )
 
-        faces = np.array(
-            [
-                [
-                    polygon.face.a,
-                    polygon.face.c,
-                    polygon.face.b,
-                ]
-                for polygon in bgf.mapping_object.polygons
-            ],
-            dtype=np.uint32,
-        )
+        mesh = bgf.mapping_object.get_mesh()
 
-        texture_indices = np.array(
-            [polygon.texture_index for polygon in bgf.mapping_object.polygons],
-            dtype=np.uint32,
-        )
+        faces = mesh.faces[:, [0, 2, 1]]
+        texture_indices = mesh.texture_indices
 
-        vertices = np.array(
-            [
-                [
-                    vertex_mapping.vertex1.x,
-                    vertex_mapping.vertex1.y,
-                    -vertex_mapping.vertex1.z,
-                ]
-                for vertex_mapping in bgf.mapping_object.vertex_mappings
-            ],
-            dtype=np.float32,
-        )
+        vertices = mesh.vertices.copy()
+        vertices[:, 2] *= -1
 
-        normals = np.array(
-            [
-                [
-                    vertex_mapping.vertex2.x,
-                    vertex_mapping.vertex2.y,
-                    -vertex_mapping.vertex2.z,
-                ]
-                for vertex_mapping in bgf.mapping_object.vertex_mappings
-            ],
-            dtype=np.float32,
-        )
+        normals = mesh.normals.copy()
+        normals[:, 2] *= -1
 
-        face_uvs = np.array(
-            [
-                [
-                    [
-                        polygon.texture_mapping.a.u,
-                        polygon.texture_mapping.a.v,
-                    ],
-                    [
-                        polygon.texture_mapping.c.u,
-                        polygon.texture_mapping.c.v,
-                    ],
-                    [
-                        polygon.texture_mapping.b.u,
-                        polygon.texture_mapping.b.v,
-                    ],
-                ]
-                for polygon in bgf.mapping_object.polygons
-            ]
-        )
+        face_uvs = mesh.uvs[:, [0, 2, 1]]
 
         # baf_to_bgf_vertices_per_key = []
         # for baf in bafs:
         #     bgf_vertices_per_key = baf.get_vertices_per_key()
         #     baf_to_bgf_vertices_per_key.append(bgf_vertices_per_key)
 
-        for texture_index, bgf_texture in enumerate(reordered_bgf_textures):
-            texture_metadata = next(
-                (
-                    texture_metadata
-                    for texture_metadata in object_metadata.textures
-                    if normalize(texture_metadata.name) == normalize(bgf_texture.name)
-                ),
-                None,
+        primitive_splits = split_primitives(
+            faces, texture_indices, face_uvs, len(reordered_bgf_textures)
+        )
+
+        for texture_index, (bgf_texture, primitive_split) in enumerate(
+            zip(reordered_bgf_textures, primitive_splits)
+        ):
+            texture_metadata = self.metadata_registry.get_texture_metadata(
+                object_metadata, bgf_texture.name
             )
 
             if texture_metadata is None:
@@ -520,100 +534,19 @@ class BgfGltfConverter(BgfConverter):
                     f"texture metadata not found for texture {bgf_texture.name}"
                 )
 
-            primitive = self.calculate_primitive(
-                faces,
-                texture_indices,
-                vertices,
-                normals,
-                face_uvs,
-                texture_index,
-                texture_metadata,
-            )
+            if primitive_split is None:
+                continue
 
-            if primitive is not None:
-                gltf_primitives.append(primitive)
+            gltf_primitives.append(
+                GltfPrimitive(
+                    indices=primitive_split.indices,
+                    vertices=vertices[primitive_split.vertex_indices],
+                    baf_to_vertices_per_key=[],
+                    normals=normals[primitive_split.vertex_indices],
+                    uvs=primitive_split.uvs,
+                    texture_index=texture_index,
+                    texture_metadata=texture_metadata,
+                )
+            )
 
         return gltf_mesh
-
-    def calculate_primitive(
-        self,
-        faces: np.ndarray,
-        texture_indices: np.ndarray,
-        vertices: np.ndarray,
-        normals: np.ndarray,
-        face_uvs: np.ndarray,
-        texture_index: int,
-        texture_metadata: TextureMetadata,
-    ) -> GltfPrimitive | None:
-        # each texture also has its own animation vertices
-        # vertices_per_key_per_anim = []
-        # for bgf_vertices_per_key in baf_to_bgf_vertices_per_key:
-        #     vertices_per_key = np.empty_like(bgf_vertices_per_key, dtype=np.float32)
-        #     vertices_per_key_per_anim.append(vertices_per_key)
-
-        selected_faces = faces[texture_indices == texture_index]
-        selected_face_uvs = face_uvs[texture_indices == texture_index]
-
-        if len(selected_faces) == 0 or len(selected_face_uvs) == 0:
-            return None
-
-        primitive_indices: list = []
-        primitive_face_uvs: list = []
-        primitive_vertices: list = []
-        primitive_normals: list = []
-
-        vertex_dict = {}
-
-        for selected_face, selected_face_uvs in zip(selected_faces, selected_face_uvs):
-            for selected_face_vertex_index, selected_face_uv in zip(
-                selected_face, selected_face_uvs
-            ):
-                selected_face_u = selected_face_uv[0]
-                selected_face_v = selected_face_uv[1]
-
-                key = (selected_face_vertex_index, selected_face_u, selected_face_v)
-
-                if key not in vertex_dict:
-                    primitive_index = len(primitive_vertices)
-                    vertex_dict[key] = primitive_index
-
-                    vertex = vertices[selected_face_vertex_index]
-                    normal = normals[selected_face_vertex_index]
-
-                    primitive_vertices.append(vertex)
-                    primitive_normals.append(normal)
-                    primitive_face_uvs.append(selected_face_uv)
-
-                    # for bgf_vertices_per_key, vertices_per_key in zip(
-                    #     baf_to_bgf_vertices_per_key, vertices_per_key_per_anim
-                    # ):
-                    #     for keyframe in range(bgf_vertices_per_key.shape[0]):
-                    #         vertex_per_key = bgf_vertices_per_key[keyframe][
-                    #             vertex_index
-                    #         ]
-                    #         vertices_per_key = np.append(
-                    #             vertices_per_key, vertex_per_key
-                    #         )
-
-                primitive_indices.append(vertex_dict[key])
-
-        primitive_indices_np = np.array(primitive_indices, dtype=np.uint32)
-        primitive_uvs_np = np.array(primitive_face_uvs, dtype=np.float32)
-        primitive_normals_np = np.array(primitive_normals, dtype=np.float32)
-        primitive_vertices_np = np.array(primitive_vertices, dtype=np.float32)
-
-        # for vertices_per_key in vertices_per_key_per_anim:
-        #     vertices_per_key = np.array(vertices_per_key, dtype=np.float32)
-
-        gltf_primitive = GltfPrimitive(
-            indices=primitive_indices_np,
-            vertices=primitive_vertices_np,
-            # baf_to_vertices_per_key=vertices_per_key_per_anim,
-            baf_to_vertices_per_key=[],
-            normals=primitive_normals_np,
-            uvs=primitive_uvs_np,
-            texture_index=texture_index,
-            texture_metadata=texture_metadata,
-        )
-
-        return gltf_primitive
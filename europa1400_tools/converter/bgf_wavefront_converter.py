@@ -1,17 +1,77 @@
-import shutil
 from pathlib import Path
 
+import numpy as np
+from numpy.lib.recfunctions import structured_to_unstructured
+
 from europa1400_tools.cli.convert_options import ConvertOptions
 from europa1400_tools.const import MTL_EXTENSION, OBJ_EXTENSION, TargetFormat
-from europa1400_tools.construct.baf import Vector3
-from europa1400_tools.construct.bgf import Bgf, BgfModel, Face, TextureMapping
+from europa1400_tools.construct.bgf import (
+    FACE_DTYPE,
+    TEXTURE_MAPPING_DTYPE,
+    Bgf,
+    BgfModel,
+    Polygon,
+)
+from europa1400_tools.construct.common import VECTOR3_DTYPE
 from europa1400_tools.converter.bgf_converter import BgfConverter
+from europa1400_tools.converter.wavefront_writer import (
+    WAVEFRONT_BUFFER_SIZE,
+    to_float_columns,
+    write_rows,
+)
+from europa1400_tools.helpers import link_or_copy
 from europa1400_tools.preprocessor.objects_preprocessor import ObjectMetadata
 
 
+def get_polygon_arrays(
+    polygons: list[Polygon],
+) -> tuple[np.recarray, np.recarray, np.recarray]:
+    """Pack the faces, texture mappings and normals of polygons into record arrays.
+
+    Polygons without a normal have no row in the normals.
+    """
+
+    faces = np.array(
+        [(polygon.face.a, polygon.face.b, polygon.face.c) for polygon in polygons],
+        dtype=FACE_DTYPE,
+    )
+    texture_mappings = np.array(
+        [
+            (
+                (mapping.vertex_u.x, mapping.vertex_u.y, mapping.vertex_u.z),
+                (mapping.vertex_v.x, mapping.vertex_v.y, mapping.vertex_v.z),
+                (mapping.vertex_w.x, mapping.vertex_w.y, mapping.vertex_w.z),
+            )
+            for mapping in (polygon.texture_mapping for polygon in polygons)
+        ],
+        dtype=TEXTURE_MAPPING_DTYPE,
+    )
+    normals = np.array(
+        [
+            (polygon.normal.x, polygon.normal.y, polygon.normal.z)
+            for polygon in polygons
+            if polygon.normal is not None
+        ],
+        dtype=VECTOR3_DTYPE,
+    )
+
+    return (
+        faces.view(np.recarray),
+        texture_mappings.view(np.recarray),
+        normals.view(np.recarray),
+    )
+
+
 class BgfWavefrontConverter(BgfConverter):
     """Class for converting BGF files to wavefront."""
 
+    copied_texture_paths: set[Path]
+
+    def __init__(self):
+        super().__init__()
+
+        self.copied_texture_paths = set()
+
     def _convert(
         self,
         bgf: Bgf,
@@ -24,11 +84,7 @@ class BgfWavefrontConverter(BgfConverter):
         if not output_path.exists():
             output_path.mkdir(parents=True)
 
-        obj_string: str = ""
         mtl_name = Path(bgf.name).with_suffix(MTL_EXTENSION)
-        mtl_string: str = ""
-
-        obj_string += f"mtllib {mtl_name}\n"
 
         models: list[BgfModel] = [
             game_object.model
@@ -39,77 +95,121 @@ class BgfWavefrontConverter(BgfConverter):
         if not models:
             raise ValueError("no models found")
 
-        face_offset = 0
-        tex_offset = 0
-
-        for i, model in enumerate(models):
-            texture_mappings: list[TextureMapping] = [
-                polygon.texture_mapping for polygon in model.polygons
-            ]
-            texture_indices: list[int] = [
-                polygon.texture_index
-                for polygon in model.polygons
-                if polygon.texture_index is not None
-            ]
-            vertices: list[Vector3] = [vertex for vertex in model.vertices]
-            faces: list[Face] = [polygon.face for polygon in model.polygons]
-            normals: list[Vector3] = [
-                polygon.normal
-                for polygon in model.polygons
-                if polygon.normal is not None
-            ]
-
-            materials: list[str] = [
-                Path(object_metadata.textures[texture_index].name).stem
-                for texture_index in texture_indices
-                if texture_index < len(bgf.textures)
-            ]
-
-            obj_string += f"o group{i}\n"
-
-            for vertex in vertices:
-                obj_string += f"v {vertex.x} {vertex.z} {-vertex.y}\n"
-
-            for normal in normals:
-                obj_string += f"vn {normal.x} {normal.z} {-normal.y}\n"
-
-            for texture_mapping in texture_mappings:
-                obj_string += f"vt {texture_mapping.a.u} {texture_mapping.a.v} 0\n"
-                obj_string += f"vt {texture_mapping.b.u} {texture_mapping.b.v} 0\n"
-                obj_string += f"vt {texture_mapping.c.u} {texture_mapping.c.v} 0\n"
-
-            for face_index, (face, material) in enumerate(zip(faces, materials)):
-                obj_string += f"usemtl {material}\n"
-                obj_string += (
-                    f"f {face.a + 1 + face_offset}/"
-                    + f"{face_index * 3 + 1 + tex_offset}/{face_index + 1} "
-                    + f"{face.b + 1 + face_offset}/"
-                    + f"{face_index * 3 + 2 + tex_offset}/{face_index + 1} "
-                    + f"{face.c + 1 + face_offset}/"
-                    + f"{face_index * 3 + 3 + tex_offset}/{face_index + 1}\n"
+        with open(obj_output_path, "w", buffering=WAVEFRONT_BUFFER_SIZE) as obj_file:
+            obj_file.write(f"mtllib {mtl_name}\n")
+
+            face_offset = 0
+            tex_offset = 0
+            material_names = np.array(
+                [
+                    Path(texture_metadata.name).stem
+                    for texture_metadata in object_metadata.textures
+                ],
+                dtype=object,
+            )
+
+            for i, model in enumerate(models):
+                faces, texture_mappings, normals = get_polygon_arrays(model.polygons)
+                vertices = model.vertices
+
+                texture_indices = np.array(
+                    [
+                        polygon.texture_index
+                        for polygon in model.polygons
+                        if polygon.texture_index is not None
+                    ],
+                    dtype=np.int64,
+                )
+                materials: list[str] = material_names[
+                    texture_indices[texture_indices < len(bgf.textures)]
+                ].tolist()
+
+                obj_file.write(f"o group{i}\n")
+
+                write_rows(
+                    obj_file,
+                    "v {} {} {}\n",
+                    *to_float_columns(
+                        np.column_stack((vertices["x"], vertices["z"], -vertices["y"]))
+                    ),
                 )
-            face_offset += len(vertices)
-            tex_offset += len(texture_mappings * 3)
 
-        for texture_metadata in object_metadata.textures:
-            texture_path = (
-                ConvertOptions.instance.converted_textures_path / texture_metadata.path
-            )
-            material_name = Path(texture_metadata.name).stem
-            material_path = Path(texture_metadata.name)
+                write_rows(
+                    obj_file,
+                    "vn {} {} {}\n",
+                    *to_float_columns(
+                        np.column_stack((normals["x"], normals["z"], -normals["y"]))
+                    ),
+                )
 
-            mtl_string += f"newmtl {material_name}\n"
-            mtl_string += "Ka 1.0 1.0 1.0\n"
-            mtl_string += "Kd 1.0 1.0 1.0\n"
-            mtl_string += "Ks 0.0 0.0 0.0\n"
-            mtl_string += f"map_Kd {material_path}\n"
+                # The UV of each corner of a face is spread over the same
+                # coordinate of the U and V vectors of its texture mapping.
+                write_rows(
+                    obj_file,
+                    "vt {} {} 0\n",
+                    *to_float_columns(
+                        np.stack(
+                            (
+                                structured_to_unstructured(texture_mappings.vertex_u),
+                                structured_to_unstructured(texture_mappings.vertex_v),
+                            ),
+                            axis=-1,
+                        ).reshape(-1, 2)
+                    ),
+                )
 
-            shutil.copy(texture_path, output_path)
+                face_indices = (
+                    structured_to_unstructured(faces, dtype=np.int64) + 1 + face_offset
+                )
+                uv_indices = np.arange(len(faces), dtype=np.int64) * 3 + 1 + tex_offset
+                normal_indices = np.arange(1, len(faces) + 1, dtype=np.int64).tolist()
+
+                write_rows(
+                    obj_file,
+                    "usemtl {}\nf {}/{}/{} {}/{}/{} {}/{}/{}\n",
+                    materials,
+                    face_indices[:, 0].tolist(),
+                    uv_indices.tolist(),
+                    normal_indices,
+                    face_indices[:, 1].tolist(),
+                    (uv_indices + 1).tolist(),
+                    normal_indices,
+                    face_indices[:, 2].tolist(),
+                    (uv_indices + 2).tolist(),
+                    normal_indices,
+                )
 
-        with open(obj_output_path, "w") as obj_file:
-            obj_file.write(obj_string)
+                face_offset += len(vertices)
+                tex_offset += len(texture_mappings) * 3
 
-        with open(mtl_output_path, "w") as mtl_file:
-            mtl_file.write(mtl_string)
+        with open(mtl_output_path, "w", buffering=WAVEFRONT_BUFFER_SIZE) as mtl_file:
+            for texture_metadata in object_metadata.textures:
+                texture_path = (
+                    ConvertOptions.instance.converted_textures_path
+                    / texture_metadata.path
+                )
+                material_name = Path(texture_metadata.name).stem
+                material_path = Path(texture_metadata.name)
+
+                mtl_file.write(
+                    f"newmtl {material_name}\n"
+                    + "Ka 1.0 1.0 1.0\n"
+                    + "Kd 1.0 1.0 1.0\n"
+                    + "Ks 0.0 0.0 0.0\n"
+                    + f"map_Kd {material_path}\n"
+                )
+
+                self._copy_texture(texture_path, output_path)
 
         return [obj_output_path]
+
+    def _copy_texture(self, texture_path: Path, output_path: Path) -> None:
+        """Link or copy a texture into an output directory once per conversion."""
+
+        texture_output_path = output_path / texture_path.name
+
+        if texture_output_path in self.copied_texture_paths:
+            return
+
+        link_or_copy(texture_path, texture_output_path)
+        self.copied_texture_paths.add(texture_output_path)
@@ -1,19 +1,16 @@
-"""Commands for converting files"""
+"""Commands for converting files
+
+Converters are imported by their commands, so only the dependencies of the
+command being run are loaded.
+"""
+
+# pylint: disable=import-outside-toplevel
 
 import typer
 
 from europa1400_tools.cli.command import command
 from europa1400_tools.cli.convert_options import ConvertOptions
 from europa1400_tools.const import TargetFormat
-from europa1400_tools.converter.ageb_converter import AGebConverter
-from europa1400_tools.converter.aobj_converter import AObjConverter
-from europa1400_tools.converter.bgf_gltf_converter import BgfGltfConverter
-from europa1400_tools.converter.bgf_wavefront_converter import BgfWavefrontConverter
-from europa1400_tools.converter.ed3_converter import Ed3Converter
-from europa1400_tools.converter.gfx_converter import GfxConverter
-from europa1400_tools.converter.ogr_converter import OgrConverter
-from europa1400_tools.converter.sbf_converter import SbfConverter
-from europa1400_tools.converter.txs_converter import TxsConverter
 
 app = typer.Typer()
 
@@ -24,6 +21,8 @@ def cmd_convert_groups(
 ):
     """Command to convert OGR files"""
 
+    from europa1400_tools.converter.ogr_converter import OgrConverter
+
     ogr_converter = OgrConverter()
     ogr_converter.convert_files()
 
@@ -34,6 +33,8 @@ def cmd_convert_scenes(
 ):
     """Command to convert ED3 files"""
 
+    from europa1400_tools.converter.ed3_converter import Ed3Converter
+
     ed3_converter = Ed3Converter()
     ed3_converter.convert_files()
 
@@ -44,6 +45,8 @@ def cmd_convert_sfx(
 ):
     """Command to convert SBF files"""
 
+    from europa1400_tools.converter.sbf_converter import SbfConverter
+
     if ConvertOptions.instance.target_format is None:
         ConvertOptions.instance.target_format = TargetFormat.WAV
 
@@ -57,6 +60,8 @@ def cmd_convert_gfx(
 ):
     """Command to convert GFX files"""
 
+    from europa1400_tools.converter.gfx_converter import GfxConverter
+
     gfx_converter = GfxConverter()
     gfx_converter.convert_files()
 
@@ -67,6 +72,8 @@ def cmd_convert_ageb(
 ):
     """Command to convert AGEB files"""
 
+    from europa1400_tools.converter.ageb_converter import AGebConverter
+
     ageb_converter = AGebConverter()
     ageb_converter.convert_files()
 
@@ -77,6 +84,8 @@ def cmd_convert_aobj(
 ):
     """Command to convert AOBJ files"""
 
+    from europa1400_tools.converter.aobj_converter import AObjConverter
+
     aobj_converter = AObjConverter()
     aobj_converter.convert_files()
 
@@ -87,6 +96,8 @@ def cmd_convert_txs(
 ):
     """Command to convert TXS files"""
 
+    from europa1400_tools.converter.txs_converter import TxsConverter
+
     txs_converter = TxsConverter()
     txs_converter.convert_files()
 
@@ -101,12 +112,18 @@ def cmd_convert_objects(
         ConvertOptions.instance.target_format = TargetFormat.WAVEFRONT
 
     if ConvertOptions.instance.target_format == TargetFormat.WAVEFRONT:
+        from europa1400_tools.converter.bgf_wavefront_converter import (
+            BgfWavefrontConverter,
+        )
+
         bgf_wavefront_converter = BgfWavefrontConverter()
         bgf_wavefront_converter.convert_files()
     elif (
         ConvertOptions.instance.target_format == TargetFormat.GLTF
         or ConvertOptions.instance.target_format == TargetFormat.GLTF_STATIC
     ):
+        from europa1400_tools.converter.bgf_gltf_converter import BgfGltfConverter
+
         bgf_gltf_converter = BgfGltfConverter()
         bgf_gltf_converter.convert_files()
 
@@ -1,15 +1,23 @@
 import logging
+from concurrent.futures import Future
 from pathlib import Path
-from typing import Type
+from typing import Iterable, Type
 
+import numpy as np
 from PIL import Image
 
 from europa1400_tools.cli.common_options import CommonOptions
 from europa1400_tools.cli.convert_options import ConvertOptions
-from europa1400_tools.const import PNG_EXTENSION, TargetFormat
+from europa1400_tools.const import GFX_EXTENSION, PNG_EXTENSION, TargetFormat
 from europa1400_tools.construct.gfx import Gfx, Graphic, ShapebankDefinition
 from europa1400_tools.converter.base_converter import BaseConverter, ConstructType
+from europa1400_tools.decoder.decoded_store import is_decoded_file
 from europa1400_tools.decoder.gfx_decoder import GfxDecoder
+from europa1400_tools.decoder.gfx_reader import get_gfx_reader
+from europa1400_tools.helpers import normalize
+from europa1400_tools.pool import run_in_process_pool
+from europa1400_tools.rich.common import console
+from europa1400_tools.rich.progress import Progress
 
 
 class GfxConverter(BaseConverter):
@@ -30,6 +38,126 @@ class GfxConverter(BaseConverter):
     def is_single_output_file(self) -> bool:
         return False
 
+    @property
+    def parses_mapped_source_files(self) -> bool:
+        return True
+
+    def convert_files(self, file_paths: list[Path] | None = None) -> list[Path]:
+        """Convert the graphics of the game GFX file.
+
+        The GFX file is read lazily, so only the requested shapebanks are decoded.
+        File paths are names of shapebanks or of single graphics such as
+        `<shapebank>_<index>`. GFX and decoded files are converted as a whole.
+        """
+
+        file_paths = file_paths or ConvertOptions.instance.file_paths or []
+
+        if any(
+            normalize(file_path.suffix) == normalize(GFX_EXTENSION)
+            or is_decoded_file(file_path)
+            for file_path in file_paths
+        ):
+            return super().convert_files(file_paths)
+
+        gfx_reader = get_gfx_reader(
+            ConvertOptions.instance.game_gfx_path, ConvertOptions.instance.compiled
+        )
+        requested_graphics: dict[str, list[int] | None] = {}
+
+        if not any(file_paths):
+            requested_graphics = dict.fromkeys(gfx_reader.shapebank_definitions)
+
+        for file_path in file_paths:
+            name = file_path.name
+            shapebank_name, _, index = name.rpartition("_")
+
+            if name in gfx_reader.shapebank_definitions:
+                requested_graphics[name] = None
+            elif shapebank_name in gfx_reader.shapebank_definitions and index.isdigit():
+                if requested_graphics.get(shapebank_name, []) is not None:
+                    requested_graphics.setdefault(shapebank_name, []).append(int(index))
+            else:
+                console.print(f"Skipping {name}: not a shapebank or graphic")
+
+        output_file_paths: list[Path] = []
+        failed_shapebank_names: dict[str, Exception] = {}
+
+        progress = Progress(
+            title=f"Converting {self.construct_type.__name__}",
+            total_file_count=len(requested_graphics),
+        )
+
+        with progress:
+            if CommonOptions.instance.jobs > 1 and len(requested_graphics) > 1:
+
+                def on_completed(future: Future) -> None:
+                    progress.completed_file_count += 1
+
+                futures = run_in_process_pool(
+                    self,
+                    "convert_shapebank_graphics",
+                    list(requested_graphics.items()),
+                    on_completed,
+                )
+
+                for shapebank_name, future in zip(requested_graphics, futures):
+                    if (exception := future.exception()) is not None:
+                        failed_shapebank_names[shapebank_name] = exception
+                        continue
+
+                    output_file_paths.extend(future.result())
+            else:
+                for shapebank_name, indices in requested_graphics.items():
+                    progress.file_path = shapebank_name
+
+                    try:
+                        output_file_paths.extend(
+                            self.convert_shapebank_graphics(shapebank_name, indices)
+                        )
+                    except Exception as exception:  # pylint: disable=broad-except
+                        failed_shapebank_names[shapebank_name] = exception
+
+                    progress.completed_file_count += 1
+
+        for shapebank_name, exception in failed_shapebank_names.items():
+            console.print(f"Failed to convert {shapebank_name}: {exception}")
+
+        return output_file_paths
+
+    def convert_shapebank_graphics(
+        self, shapebank_name: str, indices: list[int] | None = None
+    ) -> list[Path]:
+        """Read graphics of a shapebank from the game GFX file and save them.
+
+        Converts all graphics of the shapebank if no indices are given.
+        """
+
+        gfx_reader = get_gfx_reader(
+            ConvertOptions.instance.game_gfx_path, ConvertOptions.instance.compiled
+        )
+        shapebank_output_path = self.converted_path / shapebank_name
+        output_file_paths: list[Path] = []
+
+        graphics: Iterable[tuple[int, Graphic]] = (
+            enumerate(gfx_reader.iter_graphics(shapebank_name))
+            if indices is None
+            else (
+                (index, gfx_reader.read_graphic(shapebank_name, index))
+                for index in sorted(set(indices))
+            )
+        )
+
+        for index, graphic in graphics:
+            output_file_path = shapebank_output_path / Path(
+                f"{shapebank_name}_{index}"
+            ).with_suffix(PNG_EXTENSION)
+            output_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            self.convert_graphic(graphic).save(output_file_path)
+            output_file_paths.append(output_file_path)
+
+        return output_file_paths
+
     def convert(
         self,
         value: ConstructType,
@@ -82,45 +210,27 @@ class GfxConverter(BaseConverter):
         self,
         graphic: Graphic,
     ) -> Image.Image:
-        image = Image.new("RGBA", (graphic.width, graphic.height))
-
-        if graphic.pixel_data:
-            pixel_data_rgb = graphic.pixel_data
-            pixel_data_rgba: list[int] = [
-                int.from_bytes(pixel_data_rgb[i : i + 3], "little") + 0xFF000000
-                for i in range(0, len(pixel_data_rgb), 3)
-            ]
-            image.putdata(pixel_data_rgba)
-            return image
-
-        if graphic.graphic_rows:
-            const_transparent = int.from_bytes(b"\xFF\xFF\xFF\x00", "little")
-            image_data: list[int] = []
-            for i, graphic_row in enumerate(graphic.graphic_rows):
-                row_data: list[int] = []
-                for j, transparency_block in enumerate(graphic_row.transparency_blocks):
-                    block_data: list[int] = []
-                    for _ in range(transparency_block.size_transparent // 3):
-                        block_data += [const_transparent]
-                    pixel_data_rgba = [
-                        int.from_bytes(
-                            transparency_block.pixel_data[i : i + 3], "little"
-                        )
-                        + 0xFF000000
-                        for i in range(0, len(transparency_block.pixel_data), 3)
-                    ]
-                    block_data.extend(pixel_data_rgba)
-                    row_data.extend(block_data)
-                image_data.extend(row_data)
-
-            length_check = graphic.width * graphic.height
-            length_actual = len(image_data)
-            if length_check != length_actual:
-                logging.warning(
-                    f"Graphic has incorrect length: {length_actual} "
-                    + "instead of {length_check}"
-                )
-            image.putdata(image_data)
-            return image
-
-        raise ValueError("Graphic has no pixel data or graphic rows")
+        if not graphic.pixel_data and not graphic.graphic_rows:
+            raise ValueError("Graphic has no pixel data or graphic rows")
+
+        rgba_pixels = graphic.get_rgba_pixels()
+
+        length_check = graphic.width * graphic.height
+        length_actual = len(rgba_pixels)
+        if length_check != length_actual:
+            logging.warning(
+                f"Graphic has incorrect length: {length_actual} "
+                + f"instead of {length_check}"
+            )
+            rgba_pixels = np.resize(rgba_pixels[:length_check], (length_check, 4))
+            rgba_pixels[length_actual:] = 0
+
+        return Image.frombuffer(
+            "RGBA",
+            (graphic.width, graphic.height),
+            rgba_pixels.tobytes(),
+            "raw",
+            "RGBA",
+            0,
+            1,
+        )
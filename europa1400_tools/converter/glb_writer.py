@@ -0,0 +1,122 @@
+"""Writer for binary glTF files with all binary data in a single buffer."""
+
+import struct
+from pathlib import Path
+
+from pygltflib import GLTF2, Buffer, BufferView, Image
+
+GLB_MAGIC = b"glTF"
+GLB_VERSION = 2
+GLB_HEADER_FORMAT = "<4sII"
+GLB_CHUNK_HEADER_FORMAT = "<I4s"
+GLB_JSON_CHUNK_TYPE = b"JSON"
+GLB_BIN_CHUNK_TYPE = b"BIN\x00"
+GLB_ALIGNMENT = 4
+PNG_MIME_TYPE = "image/png"
+
+
+class GlbWriter:
+    """Builder of a GLB file whose accessors and images share one BIN chunk.
+
+    Data added to the writer is appended to the buffer of the glTF at offsets
+    aligned to four bytes, with a buffer view per addition. The data is kept as
+    separate chunks until the file is written, so nothing is base64 encoded or
+    copied into a single blob.
+    """
+
+    gltf: GLTF2
+
+    def __init__(self, gltf: GLTF2):
+        self.gltf = gltf
+        self._chunks: list[bytes] = []
+        self._byte_length = 0
+
+        self.gltf.buffers = [Buffer(byteLength=0)]
+
+    def add_buffer_view(
+        self, data: bytes, target: int | None = None, name: str = ""
+    ) -> int:
+        """Append data to the buffer and return the index of its buffer view."""
+
+        padding = -self._byte_length % GLB_ALIGNMENT
+
+        if padding > 0:
+            self._chunks.append(b"\0" * padding)
+            self._byte_length += padding
+
+        self.gltf.bufferViews.append(
+            BufferView(
+                buffer=0,
+                byteOffset=self._byte_length,
+                byteLength=len(data),
+                target=target,
+                extras={
+                    "name": name,
+                },
+            )
+        )
+
+        self._chunks.append(data)
+        self._byte_length += len(data)
+
+        return len(self.gltf.bufferViews) - 1
+
+    def add_png_image(self, data: bytes, name: str = "") -> int:
+        """Embed the bytes of a PNG file and return the index of the image."""
+
+        self.gltf.images.append(
+            Image(
+                bufferView=self.add_buffer_view(data, name=name),
+                mimeType=PNG_MIME_TYPE,
+                name=name,
+            )
+        )
+
+        return len(self.gltf.images) - 1
+
+    def write(self, file_path: Path) -> None:
+        """Write the glTF and its buffer as a GLB file."""
+
+        bin_padding = b"\0" * (-self._byte_length % GLB_ALIGNMENT)
+        bin_length = self._byte_length + len(bin_padding)
+
+        if self._byte_length > 0:
+            self.gltf.buffers[0].byteLength = self._byte_length
+        else:
+            self.gltf.buffers = []
+
+        json_data = self.gltf.gltf_to_json(separators=(",", ":"), indent=None).encode(
+            "utf-8"
+        )
+        json_data += b" " * (-len(json_data) % GLB_ALIGNMENT)
+
+        chunk_header_size = struct.calcsize(GLB_CHUNK_HEADER_FORMAT)
+        file_length = (
+            struct.calcsize(GLB_HEADER_FORMAT)
+            + chunk_header_size
+            + len(json_data)
+            + (chunk_header_size + bin_length if bin_length > 0 else 0)
+        )
+
+        with open(file_path, "wb") as file:
+            file.write(
+                struct.pack(GLB_HEADER_FORMAT, GLB_MAGIC, GLB_VERSION, file_length)
+            )
+            file.write(
+                struct.pack(
+                    GLB_CHUNK_HEADER_FORMAT, len(json_data), GLB_JSON_CHUNK_TYPE
+                )
+            )
+            file.write(json_data)
+
+            if bin_length == 0:
+                return
+
+            file.write(
+                struct.pack(GLB_CHUNK_HEADER_FORMAT, bin_length, GLB_BIN_CHUNK_TYPE)
+            )
+
+            for chunk in self._chunks:
+                file.write(chunk)
+
+            file.write(bin_padding)
@@ -0,0 +1,52 @@
+"""Registry of the object metadata used when converting BGF files."""
+
+from pathlib import Path
+
+from europa1400_tools.helpers import normalize
+from europa1400_tools.models.metadata import ObjectMetadata, TextureMetadata
+
+
+class ObjectMetadataRegistry:
+    """Object metadata indexed by the path of the object and its texture names.
+
+    Metadata listed more than once for the same path or texture name resolve to
+    the first one, like a search through the lists would.
+    """
+
+    object_metadatas: list[ObjectMetadata]
+
+    def __init__(self, object_metadatas: list[ObjectMetadata]):
+        self.object_metadatas = object_metadatas
+        self._object_metadatas_by_path: dict[Path, ObjectMetadata] = {}
+        self._texture_metadatas_by_path: dict[Path, dict[str, TextureMetadata]] = {}
+
+        for object_metadata in object_metadatas:
+            if object_metadata.path in self._object_metadatas_by_path:
+                continue
+
+            self._object_metadatas_by_path[object_metadata.path] = object_metadata
+            texture_metadatas: dict[str, TextureMetadata] = {}
+
+            for texture_metadata in object_metadata.textures:
+                texture_metadatas.setdefault(
+                    normalize(texture_metadata.name), texture_metadata
+                )
+
+            self._texture_metadatas_by_path[object_metadata.path] = texture_metadatas
+
+    def get_object_metadata(self, path: Path) -> ObjectMetadata | None:
+        """Return the metadata of the object at the relative path."""
+
+        return self._object_metadatas_by_path.get(path)
+
+    def get_texture_metadata(
+        self, object_metadata: ObjectMetadata, texture_name: str
+    ) -> TextureMetadata | None:
+        """Return the metadata of a texture of an object by its normalized name."""
+
+        texture_metadatas = self._texture_metadatas_by_path.get(object_metadata.path)
+
+        if texture_metadatas is None:
+            return None
+
+        return texture_metadatas.get(normalize(texture_name))
@@ -1,23 +1,38 @@
 """Class for converting SBF files."""
 
+import os
+from concurrent.futures import Future
 from pathlib import Path
-
-import ffmpeg
+from typing import Iterable
 
 from europa1400_tools.cli.common_options import CommonOptions
 from europa1400_tools.cli.convert_options import ConvertOptions
-from europa1400_tools.const import SoundType, TargetFormat
-from europa1400_tools.construct.sbf import Sbf
+from europa1400_tools.construct.sbf import Sbf, SbfReader, SbfSound
+from europa1400_tools.converter.audio_cache import AudioCache
+from europa1400_tools.converter.audio_transcoder import (
+    AudioTranscoder,
+    needs_transcoding,
+)
 from europa1400_tools.converter.base_converter import BaseConverter, ConstructType
+from europa1400_tools.decoder.decode_cache import get_fingerprint
+from europa1400_tools.decoder.decoded_store import is_decoded_file
 from europa1400_tools.decoder.sbf_decoder import SbfDecoder
+from europa1400_tools.helpers import link_or_copy
 
 
 class SbfConverter(BaseConverter):
     """Class for converting SBF files."""
 
+    audio_cache: AudioCache
+
     def __init__(self):
         super().__init__(Sbf, SbfDecoder)
 
+        self.audio_cache = AudioCache(
+            ConvertOptions.instance.cached_sfx_path,
+            get_fingerprint(AudioTranscoder.__module__),
+        )
+
     @property
     def decoded_path(self) -> Path:
         return ConvertOptions.instance.decoded_sfx_path
@@ -30,136 +45,108 @@ class SbfConverter(BaseConverter):
     def is_single_output_file(self) -> bool:
         return False
 
-    def convert(
-        self,
-        value: ConstructType,
-        output_path: Path,
-    ) -> list[Path]:
-        target_format = ConvertOptions.instance.target_format
-        audio_bytes_dict: dict[str, list[bytes]] = {}
-        audio_output_paths: list[Path] = []
-
-        if target_format == TargetFormat.MP3:
-            audio_bytes_dict = SbfConverter._convert_to_mp3(value)
-        else:
-            audio_bytes_dict = SbfConverter._convert_to_wav(value)
-
-        for soundbank in value.soundbanks:
-            audio_bytes_list: list[bytes] = []
-
-            for i, sound in enumerate(soundbank.sounds):
-                sound_definition = soundbank.sound_definitions[i]
-                audio_bytes: bytes = sound
-
-                if (
-                    sound_definition.sound_type == SoundType.WAV
-                    and target_format != TargetFormat.WAV
-                    or sound_definition.sound_type == SoundType.MP3
-                    and target_format != TargetFormat.MP3
-                ):
-                    if target_format == TargetFormat.MP3:
-                        audio_bytes = SbfConverter._convert_wav_to_mp3(sound)
-                    else:
-                        audio_bytes = SbfConverter._convert_mp3_to_wav(sound)
-
-                audio_bytes_list.append(audio_bytes)
-
-            audio_bytes_dict[soundbank.soundbank_definition.name] = audio_bytes_list
-
-        for soundbank_name, audio_bytes_list in audio_bytes_dict.items():
-            for i, audio_bytes in enumerate(audio_bytes_list):
-                name = f"{value.name}_{soundbank_name}"
-                if len(audio_bytes_list) > 1:
-                    name += f"_{i}"
-
-                audio_output_path = (
-                    output_path
-                    / soundbank_name
-                    / Path(name).with_suffix(target_format.extension)
-                )
+    @property
+    def parses_mapped_source_files(self) -> bool:
+        return True
 
-                if not audio_output_path.parent.exists():
-                    audio_output_path.parent.mkdir(parents=True)
+    def convert_file(self, file_path: Path) -> tuple[Path, list[Path]]:
+        """Convert a decoded file, or stream the sounds of a source file."""
 
-                with open(audio_output_path, "wb") as wav_output_file:
-                    wav_output_file.write(audio_bytes)
+        if is_decoded_file(file_path):
+            return super().convert_file(file_path)
 
-                audio_output_paths.append(audio_output_path)
+        value_path = self.get_source_value_path(file_path)
 
-        return audio_output_paths
+        with open(file_path, "rb") as file:
+            sbf_reader = SbfReader(file)
 
-    @staticmethod
-    def _convert_mp3_to_wav(mp3_bytes: bytes) -> bytes:
-        """Convert MP3 to WAV"""
+            return value_path, self.convert_sounds(
+                sbf_reader.name,
+                sbf_reader.iter_sounds(),
+                self.get_converted_output_path(value_path),
+            )
 
-        process = (
-            ffmpeg.input("pipe:")
-            .output("pipe:", format="wav")
-            .run_async(pipe_stdin=True, pipe_stdout=True, pipe_stderr=True)
-        )
-
-        wav_bytes, _ = process.communicate(input=mp3_bytes)
+    def convert(
+        self,
+        value: ConstructType,
+        output_path: Path,
+    ) -> list[Path]:
+        return self.convert_sounds(value.name, value.iter_sounds(), output_path)
 
-        return wav_bytes
+    def convert_sounds(
+        self,
+        name: str,
+        sounds: Iterable[tuple[SbfSound, bytes | memoryview]],
+        output_path: Path,
+    ) -> list[Path]:
+        """Write or transcode each sound as it is reached.
 
-    @staticmethod
-    def _convert_wav_to_mp3(wav_bytes: bytes):
-        """Convert WAV to MP3"""
+        At most twice as many sounds as there are transcoder workers wait for
+        their transcode, so memory use does not grow with the number of sounds.
+        """
 
-        process = (
-            ffmpeg.input("pipe:")
-            .output("pipe:", format="mp3")
-            .run_async(pipe_stdin=True, pipe_stdout=True, pipe_stderr=True)
+        target_format = ConvertOptions.instance.target_format
+        audio_transcoder = AudioTranscoder.shared(
+            max(1, (os.cpu_count() or 1) // CommonOptions.instance.jobs)
         )
+        max_pending_count = 2 * audio_transcoder.max_workers
+        pending_futures: dict[str, Future[bytes]] = {}
+        pending_output_paths: dict[str, list[Path]] = {}
+        audio_output_paths: list[Path] = []
 
-        mp3_bytes, _ = process.communicate(input=wav_bytes)
-
-        return mp3_bytes
-
-    @staticmethod
-    def _convert_to_wav(sbf: Sbf) -> dict[str, list[bytes]]:
-        """Convert SBF to WAV"""
-
-        wav_bytes_dict: dict[str, list[bytes]] = {}
+        def store_pending(key: str) -> None:
+            cached_path = self.audio_cache.store(
+                key, target_format, pending_futures.pop(key).result()
+            )
 
-        for soundbank in sbf.soundbanks:
-            wav_bytes_list: list[bytes] = []
+            for audio_output_path in pending_output_paths.pop(key):
+                link_or_copy(cached_path, audio_output_path)
 
-            for i, sound in enumerate(soundbank.sounds):
-                sound_definition = soundbank.sound_definitions[i]
+        for sound, audio_bytes in sounds:
+            sound_name = f"{name}_{sound.soundbank_name}"
+            if sound.sound_count > 1:
+                sound_name += f"_{sound.index}"
 
-                wav_bytes: bytes
-                if sound_definition.sound_type == SoundType.MP3:
-                    wav_bytes = SbfConverter._convert_mp3_to_wav(sound)
-                else:
-                    wav_bytes = sound
+            audio_output_path = (
+                output_path
+                / sound.soundbank_name
+                / Path(sound_name).with_suffix(target_format.extension)
+            )
 
-                wav_bytes_list.append(wav_bytes)
+            if not audio_output_path.parent.exists():
+                audio_output_path.parent.mkdir(parents=True)
 
-            wav_bytes_dict[soundbank.soundbank_definition.name] = wav_bytes_list
+            audio_output_paths.append(audio_output_path)
 
-        return wav_bytes_dict
+            if not needs_transcoding(sound.sound_type, target_format):
+                # The output may be a hardlink into the audio cache, writing it
+                # in place would change the cached sound.
+                audio_output_path.unlink(missing_ok=True)
 
-    @staticmethod
-    def _convert_to_mp3(sbf: Sbf) -> dict[str, list[bytes]]:
-        """Convert SBF to MP3"""
+                with open(audio_output_path, "wb") as audio_output_file:
+                    audio_output_file.write(audio_bytes)
+                continue
 
-        mp3_bytes_dict: dict[str, list[bytes]] = {}
+            key = self.audio_cache.get_key(audio_bytes, target_format)
+            cached_path = self.audio_cache.get(key, target_format)
 
-        for soundbank in sbf.soundbanks:
-            mp3_bytes_list: list[bytes] = []
+            if cached_path is not None:
+                link_or_copy(cached_path, audio_output_path)
+                continue
 
-            for i, sound in enumerate(soundbank.sounds):
-                sound_definition = soundbank.sound_definitions[i]
+            if key in pending_futures:
+                pending_output_paths[key].append(audio_output_path)
+                continue
 
-                mp3_bytes: bytes
-                if sound_definition.sound_type == SoundType.MP3:
-                    mp3_bytes = sound
-                else:
-                    mp3_bytes = SbfConverter._convert_wav_to_mp3(sound)
+            if len(pending_futures) >= max_pending_count:
+                store_pending(next(iter(pending_futures)))
 
-                mp3_bytes_list.append(mp3_bytes)
+            pending_futures[key] = audio_transcoder.transcode(
+                audio_bytes, sound.sound_type, target_format
+            )
+            pending_output_paths[key] = [audio_output_path]
 
-            mp3_bytes_dict[soundbank.soundbank_definition.name] = mp3_bytes_list
+        for key in list(pending_futures):
+            store_pending(key)
 
-        return mp3_bytes_dict
+        return audio_output_paths
@@ -0,0 +1,46 @@
+"""Buffered writing of Wavefront OBJ and MTL lines."""
+
+from typing import Sequence, TextIO
+
+import numpy as np
+
+WAVEFRONT_WRITE_CHUNK_ROWS = 65536
+WAVEFRONT_BUFFER_SIZE = 1024 * 1024
+
+
+def write_rows(file: TextIO, row_format: str, *columns: Sequence) -> None:
+    """Write one formatted line per row of the columns.
+
+    Rows are formatted with a single str.format per row and written in chunks,
+    so large models are neither concatenated line by line nor held in memory as
+    one string. Like zip, rows stop at the end of the shortest column.
+    """
+
+    row_count = min((len(column) for column in columns), default=0)
+
+    for start in range(0, row_count, WAVEFRONT_WRITE_CHUNK_ROWS):
+        end = start + WAVEFRONT_WRITE_CHUNK_ROWS
+        file.write(
+            "".join(map(row_format.format, *(column[start:end] for column in columns)))
+        )
+
+
+def to_float_columns(values: np.ndarray | list) -> list[list[str]]:
+    """Return the columns of a 2D array of floats as lists of formatted floats.
+
+    Floats are formatted like str(float(value)). Meshes repeat many coordinates,
+    normals and UVs, so each distinct value is formatted once. Values are told
+    apart by their bits to keep the sign of zero.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if values.size == 0:
+        return [[] for _ in range(values.shape[-1] if values.ndim == 2 else 0)]
+
+    unique_bits, inverse = np.unique(values.view(np.uint64), return_inverse=True)
+    unique_strings = np.array(
+        [str(value) for value in unique_bits.view(np.float64).tolist()], dtype=object
+    )
+
+    return unique_strings[inverse.reshape(values.shape)].T.tolist()
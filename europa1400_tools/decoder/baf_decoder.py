@@ -4,6 +4,7 @@ from europa1400_tools.cli.common_options import CommonOptions
 from europa1400_tools.const import BAF_EXTENSION, INI_EXTENSION
 from europa1400_tools.construct.baf import Baf, BafIni
 from europa1400_tools.decoder.base_decoder import BaseDecoder
+from europa1400_tools.extractor.archive_index import ArchiveIndex
 
 
 class BafDecoder(BaseDecoder[Baf]):
@@ -23,6 +24,36 @@ class BafDecoder(BaseDecoder[Baf]):
 
         return baf
 
+    def get_source_file_paths(self, file_path: Path) -> list[Path]:
+        baf_ini_file_path = file_path.with_suffix(INI_EXTENSION)
+
+        if baf_ini_file_path.exists():
+            return [file_path, baf_ini_file_path]
+
+        return [file_path]
+
+    def decode_member(self, archive_index: ArchiveIndex, member_path: Path) -> Baf:
+        baf = Baf.from_bytes(archive_index.read_file(member_path), member_path)
+
+        baf_ini_member_path = member_path.with_suffix(INI_EXTENSION)
+
+        if archive_index.contains(baf_ini_member_path):
+            baf.baf_ini = BafIni.from_bytes(
+                archive_index.read_file(baf_ini_member_path), baf_ini_member_path
+            )
+
+        return baf
+
+    def get_source_member_paths(
+        self, archive_index: ArchiveIndex, member_path: Path
+    ) -> list[Path]:
+        baf_ini_member_path = member_path.with_suffix(INI_EXTENSION)
+
+        if archive_index.contains(baf_ini_member_path):
+            return [member_path, baf_ini_member_path]
+
+        return [member_path]
+
     @property
     def file_suffix(self) -> str:
         return BAF_EXTENSION
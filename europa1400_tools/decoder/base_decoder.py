@@ -1,13 +1,18 @@
-import pickle
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from pathlib import Path
 from typing import Generic, Type, TypeVar
 
 from europa1400_tools.cli.common_options import CommonOptions
-from europa1400_tools.const import PICKLE_EXTENSION
+from europa1400_tools.const import JSON_EXTENSION
 from europa1400_tools.construct.base_construct import BaseConstruct
+from europa1400_tools.decoder.decode_cache import DecodeCache, get_fingerprint
+from europa1400_tools.decoder.decoded_store import dump_decoded
+from europa1400_tools.extractor.archive_index import ArchiveIndex, get_archive_index
 from europa1400_tools.extractor.file_extractor import FileExtractor
 from europa1400_tools.helpers import get_files, normalize
+from europa1400_tools.models.decode_manifest import DecodeManifestEntry
+from europa1400_tools.pool import run_in_process_pool
 from europa1400_tools.rich.common import console
 from europa1400_tools.rich.progress import Progress
 
@@ -26,10 +31,110 @@ class BaseDecoder(ABC, Generic[ConstructType]):
         """Decode files."""
 
         decoded_file_paths: list[Path] = []
+        extracted_file_paths = self.find_files(input_file_paths)
+
+        if len(extracted_file_paths) == 0:
+            return []
+
+        progress = Progress(
+            title=f"Decoding {self.construct_type.__name__}",
+            total_file_count=len(extracted_file_paths),
+        )
+
+        decodable_file_paths: list[tuple[Path, Path]] = []
+        decode_cache = DecodeCache(self.manifest_path, self.fingerprint)
+        manifest_entries: dict[Path, DecodeManifestEntry] = {}
+
+        with progress:
+            for extracted_file_path in extracted_file_paths:
+                if normalize(extracted_file_path.suffix) != normalize(self.file_suffix):
+                    continue
+
+                if extracted_file_path.is_relative_to(self.base_path):
+                    extracted_file_path = extracted_file_path.relative_to(
+                        self.base_path
+                    )
+
+                progress.file_path = extracted_file_path
+
+                decoded_output_path = (
+                    self.decoded_path
+                    if self.is_single_file
+                    else (self.decoded_path / extracted_file_path).with_suffix(
+                        CommonOptions.instance.decoded_extension
+                    )
+                )
+
+                decoded_file_paths.append(decoded_output_path)
+
+                if decoded_output_path.exists() and CommonOptions.instance.use_cache:
+                    progress.cached_file_count += 1
+                    continue
+
+                if self.is_streaming:
+                    archive_index = get_archive_index(self.game_path)
+                    manifest_entries[
+                        extracted_file_path
+                    ] = decode_cache.get_member_entry(
+                        extracted_file_path,
+                        archive_index,
+                        self.get_source_member_paths(
+                            archive_index, extracted_file_path
+                        ),
+                    )
+                else:
+                    manifest_entries[extracted_file_path] = decode_cache.get_entry(
+                        extracted_file_path,
+                        self.get_source_file_paths(
+                            self.base_path / extracted_file_path
+                        ),
+                    )
+
+                if decoded_output_path.exists() and decode_cache.is_up_to_date(
+                    extracted_file_path,
+                    manifest_entries[extracted_file_path],
+                    decoded_output_path,
+                ):
+                    progress.cached_file_count += 1
+                    continue
+
+                decodable_file_paths.append((extracted_file_path, decoded_output_path))
+
+            try:
+                if CommonOptions.instance.jobs > 1 and len(decodable_file_paths) > 1:
+                    self._decode_in_process_pool(
+                        decodable_file_paths, progress, decode_cache, manifest_entries
+                    )
+                else:
+                    for (
+                        extracted_file_path,
+                        decoded_output_path,
+                    ) in decodable_file_paths:
+                        progress.file_path = extracted_file_path
+                        self.decode_to_file(extracted_file_path, decoded_output_path)
+                        decode_cache.update(
+                            extracted_file_path,
+                            manifest_entries[extracted_file_path],
+                            decoded_output_path,
+                        )
+                        progress.completed_file_count += 1
+            finally:
+                decode_cache.save()
+
+        return decoded_file_paths
+
+    def find_files(self, input_file_paths: list[Path] | None = None) -> list[Path]:
+        """Return the paths of the files to decode, extracting them if necessary.
+
+        When streaming, the paths of the archive members are returned instead.
+        """
+
         extracted_file_paths: list[Path] = []
         file_extractor = FileExtractor()
 
-        if input_file_paths is None:
+        if self.is_streaming:
+            extracted_file_paths = self.get_member_paths(input_file_paths)
+        elif input_file_paths is None:
             if self.is_archive and self.extracted_path is not None:
                 extracted_file_paths = file_extractor.extract(
                     self.game_path, self.extracted_path, self.file_suffix
@@ -38,6 +143,12 @@ class BaseDecoder(ABC, Generic[ConstructType]):
                 extracted_file_paths = [self.game_path]
             else:
                 extracted_file_paths = get_files(self.game_path, self.file_suffix)
+        elif not self.is_archive:
+            extracted_file_paths = [
+                file_path.resolve()
+                for file_path in input_file_paths
+                if normalize(file_path.suffix) == normalize(self.file_suffix)
+            ]
         else:
             extractable_file_paths = [
                 file_path.resolve().relative_to(self.extracted_path)
@@ -54,68 +165,118 @@ class BaseDecoder(ABC, Generic[ConstructType]):
             )
             extracted_file_paths.extend(extracted_game_file_paths)
 
-        if len(extracted_file_paths) == 0:
-            return []
+        return extracted_file_paths
 
-        progress = Progress(
-            title=f"Decoding {self.construct_type.__name__}",
-            total_file_count=len(extracted_file_paths),
-        )
+    def _decode_in_process_pool(
+        self,
+        decodable_file_paths: list[tuple[Path, Path]],
+        progress: Progress,
+        decode_cache: DecodeCache,
+        manifest_entries: dict[Path, DecodeManifestEntry],
+    ) -> None:
+        """Decode files in a process pool."""
 
-        with progress:
-            for extracted_file_path in extracted_file_paths:
-                if normalize(extracted_file_path.suffix) != normalize(self.file_suffix):
-                    continue
+        decoded_output_paths = dict(decodable_file_paths)
 
-                if extracted_file_path.is_relative_to(self.extracted_path):
-                    extracted_file_path = extracted_file_path.relative_to(
-                        self.extracted_path
-                    )
+        def on_completed(future: Future) -> None:
+            if future.exception() is None:
+                file_path = future.result()
+                progress.file_path = file_path
+                decode_cache.update(
+                    file_path,
+                    manifest_entries[file_path],
+                    decoded_output_paths[file_path],
+                )
+            progress.completed_file_count += 1
 
-                progress.file_path = extracted_file_path
+        futures = run_in_process_pool(
+            self, "decode_to_file", decodable_file_paths, on_completed
+        )
 
-                decoded_output_path = (
-                    self.decoded_path
-                    if self.is_single_file
-                    else (self.decoded_path / extracted_file_path).with_suffix(
-                        PICKLE_EXTENSION
-                    )
-                )
+        for future in futures:
+            future.result()
 
-                if decoded_output_path.exists() and CommonOptions.instance.use_cache:
-                    decoded_file_paths.append(decoded_output_path)
-                    progress.cached_file_count += 1
-                    continue
+    def decode_to_file(self, file_path: Path, decoded_output_path: Path) -> Path:
+        """Decode a file relative to base_path and store it at decoded_output_path.
 
-                extracted_file_path = (
-                    self.extracted_path / extracted_file_path
-                    if not extracted_file_path.is_relative_to(self.extracted_path)
-                    else extracted_file_path
-                )
-                decoded_value = self.decode_file(extracted_file_path)
-                decoded_value.path = extracted_file_path.relative_to(
-                    self.extracted_path
-                )
+        When streaming, the file is an archive member and is read straight from the
+        archive instead.
+        """
 
-                if not decoded_output_path.parent.exists():
-                    decoded_output_path.parent.mkdir(parents=True)
+        if self.is_streaming:
+            decoded_value = self.decode_member(
+                get_archive_index(self.game_path), file_path
+            )
+        else:
+            decoded_value = self.decode_file(self.base_path / file_path)
 
-                with open(decoded_output_path, "wb") as decoded_output_file:
-                    pickle.dump(
-                        decoded_value,
-                        decoded_output_file,
-                    )
+        decoded_value.path = file_path
 
-                decoded_file_paths.append(decoded_output_path)
+        if not decoded_output_path.parent.exists():
+            decoded_output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                progress.completed_file_count += 1
+        dump_decoded(decoded_value, decoded_output_path)
 
-        return decoded_file_paths
+        return file_path
 
     def decode_file(self, file_path: Path) -> ConstructType:
         """Decode file."""
 
-        return self.construct_type.from_file(file_path)
+        return self.construct_type.from_file(
+            file_path, compiled=CommonOptions.instance.compiled
+        )
+
+    def decode_member(
+        self, archive_index: ArchiveIndex, member_path: Path
+    ) -> ConstructType:
+        """Decode archive member in memory."""
+
+        return self.construct_type.from_bytes(
+            archive_index.read_file(member_path),
+            member_path,
+            compiled=CommonOptions.instance.compiled,
+        )
+
+    def get_member_paths(self, input_file_paths: list[Path] | None) -> list[Path]:
+        """Return the paths of the archive members to decode."""
+
+        archive_index = get_archive_index(self.game_path)
+
+        if input_file_paths is None:
+            return [
+                Path(member.name)
+                for member in archive_index.get_members(self.file_suffix)
+            ]
+
+        member_paths: list[Path] = []
+
+        for file_path in input_file_paths:
+            if normalize(file_path.suffix) != normalize(self.file_suffix):
+                continue
+
+            if self.extracted_path is not None and file_path.resolve().is_relative_to(
+                self.extracted_path
+            ):
+                file_path = file_path.resolve().relative_to(self.extracted_path)
+
+            member = archive_index.find_member(file_path)
+
+            if member is not None:
+                member_paths.append(Path(member.name))
+
+        return member_paths
+
+    def get_source_file_paths(self, file_path: Path) -> list[Path]:
+        """Return the paths of the files a file is decoded from."""
+
+        return [file_path]
+
+    def get_source_member_paths(
+        self, archive_index: ArchiveIndex, member_path: Path
+    ) -> list[Path]:
+        """Return the paths of the archive members a member is decoded from."""
+
+        return [member_path]
 
     @property
     @abstractmethod
@@ -146,3 +307,41 @@ class BaseDecoder(ABC, Generic[ConstructType]):
     @abstractmethod
     def decoded_path(self) -> Path:
         """Path to the decoded assets."""
+
+    @property
+    def is_streaming(self) -> bool:
+        """Whether archive members are decoded without extracting them."""
+
+        return self.is_archive and CommonOptions.instance.stream
+
+    @property
+    def base_path(self) -> Path:
+        """Path the paths of the decoded assets are relative to."""
+
+        if self.extracted_path is not None:
+            return self.extracted_path
+
+        if self.is_single_file:
+            return self.game_path.parent
+
+        return self.game_path
+
+    @property
+    def manifest_path(self) -> Path:
+        """Path to the manifest of the decoded assets.
+
+        Pickled and columnar assets have separate manifests, so switching the
+        format never trusts a decoded file that the other manifest vouched for.
+        """
+
+        return CommonOptions.instance.decoded_manifests_path / (
+            self.construct_type.__name__.lower()
+            + CommonOptions.instance.decoded_extension
+            + JSON_EXTENSION
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """Fingerprint of the construct and decoder used to decode the assets."""
+
+        return get_fingerprint(self.construct_type.__module__, type(self).__module__)
@@ -1,4 +1,10 @@
-"""Commands for the decoder."""
+"""Commands for the decoder.
+
+Decoders are imported by their commands, so only the dependencies of the
+command being run are loaded.
+"""
+
+# pylint: disable=import-outside-toplevel
 
 from pathlib import Path
 from typing import Annotated, Optional
@@ -6,15 +12,6 @@ from typing import Annotated, Optional
 import typer
 
 from europa1400_tools.cli.common_options import CommonOptions
-from europa1400_tools.decoder.ageb_decoder import AGebDecoder
-from europa1400_tools.decoder.aobj_decoder import AObjDecoder
-from europa1400_tools.decoder.baf_decoder import BafDecoder
-from europa1400_tools.decoder.bgf_decoder import BgfDecoder
-from europa1400_tools.decoder.ed3_decoder import Ed3Decoder
-from europa1400_tools.decoder.gfx_decoder import GfxDecoder
-from europa1400_tools.decoder.ogr_decoder import OgrDecoder
-from europa1400_tools.decoder.sbf_decoder import SbfDecoder
-from europa1400_tools.decoder.txs_decoder import TxsDecoder
 
 app = typer.Typer()
 
@@ -43,6 +40,8 @@ def cmd_decode_animations(
 ) -> list[Path]:
     """Command to decode BAF files."""
 
+    from europa1400_tools.decoder.baf_decoder import BafDecoder
+
     common_options: CommonOptions = ctx.obj
 
     baf_decoder = BafDecoder(common_options)
@@ -59,6 +58,8 @@ def cmd_decode_objects(
 ) -> list[Path]:
     """Command to decode BGF files."""
 
+    from europa1400_tools.decoder.bgf_decoder import BgfDecoder
+
     common_options: CommonOptions = ctx.obj
 
     bgf_decoder = BgfDecoder(common_options)
@@ -75,6 +76,8 @@ def cmd_decode_txs(
 ) -> list[Path]:
     """Command to decode TXS files."""
 
+    from europa1400_tools.decoder.txs_decoder import TxsDecoder
+
     common_options: CommonOptions = ctx.obj
 
     txs_decoder = TxsDecoder(common_options)
@@ -91,6 +94,8 @@ def cmd_decode_scenes(
 ) -> list[Path]:
     """Decode ED3 files."""
 
+    from europa1400_tools.decoder.ed3_decoder import Ed3Decoder
+
     common_options: CommonOptions = ctx.obj
 
     ed3_decoder = Ed3Decoder(common_options)
@@ -107,6 +112,8 @@ def cmd_decode_groups(
 ):
     """Decode OGR files."""
 
+    from europa1400_tools.decoder.ogr_decoder import OgrDecoder
+
     common_options: CommonOptions = ctx.obj
 
     ogr_decoder = OgrDecoder(common_options)
@@ -123,6 +130,8 @@ def cmd_decode_ageb(
 ):
     """Decode A_Geb file."""
 
+    from europa1400_tools.decoder.ageb_decoder import AGebDecoder
+
     common_options: CommonOptions = ctx.obj
 
     ageb_decoder = AGebDecoder(common_options)
@@ -139,6 +148,8 @@ def cmd_decode_aobj(
 ) -> list[Path]:
     """Decode A_Obj file."""
 
+    from europa1400_tools.decoder.aobj_decoder import AObjDecoder
+
     common_options: CommonOptions = ctx.obj
 
     aobj_decoder = AObjDecoder(common_options)
@@ -154,6 +165,8 @@ def cmd_decode_gfx(
 ) -> list[Path]:
     """Decode GFX file."""
 
+    from europa1400_tools.decoder.gfx_decoder import GfxDecoder
+
     common_options: CommonOptions = ctx.obj
 
     gfx_decoder = GfxDecoder(common_options)
@@ -169,6 +182,8 @@ def cmd_decode_sfx(
 ) -> list[Path]:
     """Decode SFX files."""
 
+    from europa1400_tools.decoder.sbf_decoder import SbfDecoder
+
     common_options: CommonOptions = ctx.obj
 
     sbf_decoder = SbfDecoder(common_options)
@@ -0,0 +1,183 @@
+"""Cache deciding which files have to be decoded again."""
+
+import dataclasses
+import hashlib
+import importlib
+from pathlib import Path
+from types import ModuleType
+from typing import Callable, Iterator
+
+from europa1400_tools.extractor.archive_index import ArchiveIndex
+from europa1400_tools.models.decode_manifest import DecodeManifest, DecodeManifestEntry
+
+CONSTRUCT_PACKAGE = "europa1400_tools.construct"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_fingerprint(*module_names: str) -> str:
+    """Hash the source of the given modules and the construct modules they use.
+
+    The fingerprint only changes if the parser of a format changes, so fixing
+    one construct invalidates the decoded files of the formats using it only.
+    """
+
+    pending_module_names = list(module_names)
+    visited_module_names: set[str] = set()
+
+    while any(pending_module_names):
+        module_name = pending_module_names.pop()
+
+        if module_name in visited_module_names:
+            continue
+
+        visited_module_names.add(module_name)
+
+        module = importlib.import_module(module_name)
+
+        for value in vars(module).values():
+            dependency_name = (
+                value.__name__
+                if isinstance(value, ModuleType)
+                else getattr(value, "__module__", None)
+            )
+
+            if isinstance(dependency_name, str) and dependency_name.startswith(
+                CONSTRUCT_PACKAGE
+            ):
+                pending_module_names.append(dependency_name)
+
+    fingerprint = hashlib.sha256()
+
+    for module_name in sorted(visited_module_names):
+        module_file = importlib.import_module(module_name).__file__
+
+        if module_file is None:
+            continue
+
+        fingerprint.update(module_name.encode())
+        fingerprint.update(Path(module_file).read_bytes())
+
+    return fingerprint.hexdigest()
+
+
+class DecodeCache:
+    """Manifest of decoded files keyed on the hash of their sources.
+
+    A decoded file is up to date if the hash of its source files and the
+    fingerprint of its parser did not change since it was decoded. The size and
+    modification time of the sources are stored as well, so unchanged files do
+    not have to be hashed again.
+    """
+
+    manifest_path: Path
+    manifest: DecodeManifest
+
+    def __init__(self, manifest_path: Path, fingerprint: str):
+        self.manifest_path = manifest_path
+        self.manifest = DecodeManifest(fingerprint)
+
+        if not manifest_path.exists():
+            return
+
+        try:
+            manifest: DecodeManifest = DecodeManifest.from_json(
+                manifest_path.read_text(encoding="utf-8")
+            )
+        except (ValueError, KeyError, TypeError):
+            return
+
+        if manifest.fingerprint == fingerprint:
+            self.manifest = manifest
+
+    def get_entry(
+        self, key: Path, source_file_paths: list[Path]
+    ) -> DecodeManifestEntry:
+        """Return the manifest entry describing the current state of the sources."""
+
+        source_stamps: list[str] = []
+
+        for source_file_path in source_file_paths:
+            stat = source_file_path.stat()
+            source_stamps.append(
+                f"{source_file_path.name}:{stat.st_size}:{stat.st_mtime_ns}"
+            )
+
+        def read_sources() -> Iterator[bytes]:
+            for source_file_path in source_file_paths:
+                with open(source_file_path, "rb") as source_file:
+                    while chunk := source_file.read(HASH_CHUNK_SIZE):
+                        yield chunk
+
+        return self._get_entry(key, ";".join(source_stamps), read_sources)
+
+    def get_member_entry(
+        self, key: Path, archive_index: ArchiveIndex, member_paths: list[Path]
+    ) -> DecodeManifestEntry:
+        """Return the manifest entry describing the current state of archive members."""
+
+        source_stamps: list[str] = []
+
+        for member_path in member_paths:
+            member = archive_index.get_member(member_path)
+
+            if member is None:
+                raise KeyError(
+                    f"{member_path} not found in {archive_index.archive_path}"
+                )
+
+            source_stamps.append(
+                f"{member_path.name}:{member.file_size}:{member.crc:08x}"
+            )
+
+        def read_sources() -> Iterator[bytes]:
+            for member_path in member_paths:
+                yield archive_index.read_file(member_path)
+
+        return self._get_entry(key, ";".join(source_stamps), read_sources)
+
+    def _get_entry(
+        self,
+        key: Path,
+        source_stamp: str,
+        read_sources: Callable[[], Iterator[bytes]],
+    ) -> DecodeManifestEntry:
+        """Return the cached entry if the stamp matches, otherwise hash the sources."""
+
+        cached_entry = self.manifest.entries.get(key.as_posix())
+
+        if cached_entry is not None and cached_entry.source_stamp == source_stamp:
+            return cached_entry
+
+        source_hash = hashlib.sha256()
+
+        for chunk in read_sources():
+            source_hash.update(chunk)
+
+        return DecodeManifestEntry(source_hash.hexdigest(), source_stamp)
+
+    def is_up_to_date(
+        self, key: Path, entry: DecodeManifestEntry, output_path: Path
+    ) -> bool:
+        """Return whether the file was decoded to the output path from sources with
+        the same hash."""
+
+        cached_entry = self.manifest.entries.get(key.as_posix())
+
+        return (
+            cached_entry is not None
+            and cached_entry.source_hash == entry.source_hash
+            and cached_entry.output_path == output_path.as_posix()
+        )
+
+    def update(self, key: Path, entry: DecodeManifestEntry, output_path: Path) -> None:
+        """Record the state of the sources a file was decoded from."""
+
+        self.manifest.entries[key.as_posix()] = dataclasses.replace(
+            entry, output_path=output_path.as_posix()
+        )
+
+    def save(self) -> None:
+        """Write the manifest to disk."""
+
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(self.manifest.to_json(indent=4), encoding="utf-8")
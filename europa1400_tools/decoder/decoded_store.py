@@ -0,0 +1,153 @@
+"""Storage of decoded assets as pickles or in a columnar container.
+
+A columnar file starts with a small header holding the pickled construct without
+its geometry and the layout of the geometry arrays, followed by the raw arrays
+aligned to 16 bytes. Loading it is a single read, with the arrays being views into
+the data read instead of lists of dataclasses.
+"""
+
+import pickle
+import struct
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from europa1400_tools.const import COLUMNS_EXTENSION, PICKLE_EXTENSION
+from europa1400_tools.construct.base_construct import BaseConstruct
+from europa1400_tools.helpers import normalize
+
+COLUMNS_MAGIC = b"E1400COL"
+COLUMNS_VERSION = 1
+COLUMNS_HEADER_FORMAT = "<8sII"
+COLUMNS_HEADER_SIZE = struct.calcsize(COLUMNS_HEADER_FORMAT)
+COLUMNS_ALIGNMENT = 16
+
+DECODED_EXTENSIONS = [PICKLE_EXTENSION, COLUMNS_EXTENSION]
+
+
+def is_decoded_file(file_path: Path) -> bool:
+    """Check if a file is a decoded asset."""
+
+    return normalize(file_path.suffix) in [
+        normalize(extension) for extension in DECODED_EXTENSIONS
+    ]
+
+
+def dump_decoded(value: BaseConstruct, file_path: Path) -> None:
+    """Store a decoded construct in the format given by the suffix of file_path."""
+
+    if normalize(file_path.suffix) == normalize(COLUMNS_EXTENSION):
+        dump_columns(value, file_path)
+        return
+
+    with open(file_path, "wb") as file:
+        pickle.dump(value, file)
+
+
+def load_decoded(file_path: Path) -> Any:
+    """Load a decoded construct stored as a pickle or in a columnar file."""
+
+    if normalize(file_path.suffix) == normalize(COLUMNS_EXTENSION):
+        return load_columns(file_path)
+
+    with open(file_path, "rb") as file:
+        return pickle.load(file)
+
+
+def dump_columns(value: BaseConstruct, file_path: Path) -> None:
+    """Store a construct with its columns as raw arrays."""
+
+    columns = value.to_columns()
+    layout: list[tuple[str, np.dtype, tuple[int, ...], int]] = []
+    data_size = 0
+
+    for field_path, array in columns.items():
+        data_size = _align(data_size)
+        layout.append((field_path, array.dtype, array.shape, data_size))
+        data_size += array.nbytes
+
+    detached_values = {
+        field_path: _get_field(value, field_path) for field_path in columns
+    }
+
+    try:
+        for field_path in columns:
+            _set_field(value, field_path, None)
+
+        metadata = pickle.dumps((value, layout), protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        for field_path, detached_value in detached_values.items():
+            _set_field(value, field_path, detached_value)
+
+    with open(file_path, "wb") as file:
+        file.write(
+            struct.pack(
+                COLUMNS_HEADER_FORMAT, COLUMNS_MAGIC, COLUMNS_VERSION, len(metadata)
+            )
+        )
+        file.write(metadata)
+
+        data_start = _align(file.tell())
+
+        for (_, _, _, offset), array in zip(layout, columns.values()):
+            file.write(b"\0" * (data_start + offset - file.tell()))
+            file.write(np.ascontiguousarray(array).tobytes())
+
+
+def load_columns(file_path: Path) -> BaseConstruct:
+    """Load a construct stored with dump_columns."""
+
+    data = file_path.read_bytes()
+
+    magic, version, metadata_size = struct.unpack_from(COLUMNS_HEADER_FORMAT, data)
+
+    if magic != COLUMNS_MAGIC or version != COLUMNS_VERSION:
+        raise ValueError(f"{file_path} is not a columnar decoded file")
+
+    value, layout = pickle.loads(
+        data[COLUMNS_HEADER_SIZE : COLUMNS_HEADER_SIZE + metadata_size]
+    )
+    data_start = _align(COLUMNS_HEADER_SIZE + metadata_size)
+
+    for field_path, dtype, shape, offset in layout:
+        array = np.frombuffer(
+            data,
+            dtype=dtype,
+            count=int(np.prod(shape)),
+            offset=data_start + offset,
+        ).reshape(shape)
+
+        if dtype.names is not None:
+            array = array.view(np.recarray)
+
+        _set_field(value, field_path, array)
+
+    return value
+
+
+def _align(offset: int) -> int:
+    """Round an offset up to the alignment of columns."""
+
+    return -(-offset // COLUMNS_ALIGNMENT) * COLUMNS_ALIGNMENT
+
+
+def _get_field(obj: Any, field_path: str) -> Any:
+    """Return the value at a dotted path of attribute names and list indices."""
+
+    for name in field_path.split("."):
+        obj = obj[int(name)] if name.isdigit() else getattr(obj, name)
+
+    return obj
+
+
+def _set_field(obj: Any, field_path: str, value: Any) -> None:
+    """Set the value at a dotted path of attribute names and list indices."""
+
+    parent_path, _, name = field_path.rpartition(".")
+    parent = _get_field(obj, parent_path) if parent_path else obj
+
+    if name.isdigit():
+        parent[int(name)] = value
+    else:
+        setattr(parent, name, value)
@@ -0,0 +1,122 @@
+"""Lazy reader for GFX files."""
+
+import mmap
+from functools import cache
+from pathlib import Path
+from typing import Iterator
+
+from construct_typed import DataclassStruct
+
+from europa1400_tools.construct.gfx import (
+    LAZY_SHAPEBANKS_PARAM,
+    Gfx,
+    Graphic,
+    Shapebank,
+    ShapebankDefinition,
+    ShapebankHeader,
+)
+
+
+class GfxReader:
+    """Reader decoding the shapebanks and graphics of a GFX file on demand.
+
+    Only the table of shapebank definitions is parsed up front. Shapebank headers
+    and graphics are parsed from a memory map of the file when they are requested,
+    with the pixel data of graphics being views into the map instead of copies.
+    A graphic is read by seeking to its offset in the shapebank header, relative
+    to the address of the shapebank, without parsing the graphics before it.
+    """
+
+    file_path: Path
+    gfx: Gfx
+    shapebank_definitions: dict[str, ShapebankDefinition]
+
+    def __init__(self, file_path: Path, compiled: bool = False):
+        self.file_path = file_path
+
+        with open(file_path, "rb") as file:
+            self.gfx = Gfx.get_struct(compiled).parse_stream(
+                file, **{LAZY_SHAPEBANKS_PARAM: True}
+            )
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        self.shapebank_definitions = {
+            shapebank_definition.name: shapebank_definition
+            for shapebank_definition in self.gfx.shapebank_definitions
+            if shapebank_definition.is_main_shapebank
+        }
+        self._shapebank_headers: dict[str, ShapebankHeader] = {}
+        self._graphics_addresses: dict[str, int] = {}
+
+    def __enter__(self) -> "GfxReader":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the memory map of the file.
+
+        Pixel data of parsed graphics are views into the memory map. While such
+        graphics are still referenced the map stays open until they are released.
+        """
+
+        try:
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def read_shapebank_header(self, name: str) -> ShapebankHeader:
+        """Parse the header of a shapebank."""
+
+        if name not in self._shapebank_headers:
+            self._mmap.seek(self.shapebank_definitions[name].address)
+            self._shapebank_headers[name] = DataclassStruct(
+                ShapebankHeader
+            ).parse_stream(self._mmap)
+            self._graphics_addresses[name] = self._mmap.tell()
+
+        return self._shapebank_headers[name]
+
+    def read_shapebank(self, name: str) -> Shapebank:
+        """Parse a complete shapebank including all of its graphics."""
+
+        self._mmap.seek(self.shapebank_definitions[name].address)
+
+        return DataclassStruct(Shapebank).parse_stream(self._mmap)
+
+    def read_graphic(self, name: str, index: int) -> Graphic:
+        """Parse a single graphic of a shapebank at its offset."""
+
+        shapebank_header = self.read_shapebank_header(name)
+
+        if not 0 <= index < shapebank_header.graphics_count:
+            raise IndexError(f"Shapebank {name} has no graphic {index}")
+
+        shapebank_definition = self.shapebank_definitions[name]
+        graphic_address = shapebank_definition.address + shapebank_header.offsets[index]
+
+        if not self._graphics_addresses[name] <= graphic_address < len(self._mmap):
+            raise ValueError(
+                f"Offset {shapebank_header.offsets[index]} of graphic {index} "
+                + f"in shapebank {name} is outside of its graphics"
+            )
+
+        self._mmap.seek(graphic_address)
+
+        return DataclassStruct(Graphic).parse_stream(self._mmap)
+
+    def iter_graphics(self, name: str) -> Iterator[Graphic]:
+        """Parse the graphics of a shapebank one after another."""
+
+        shapebank_header = self.read_shapebank_header(name)
+
+        for index in range(shapebank_header.graphics_count):
+            yield self.read_graphic(name, index)
+
+
+@cache
+def get_gfx_reader(file_path: Path, compiled: bool = False) -> GfxReader:
+    """Return a reader for a GFX file, opening it once per process."""
+
+    return GfxReader(file_path, compiled)
@@ -0,0 +1,220 @@
+"""Index of the members of an archive, cached on disk."""
+
+import json
+import struct
+import zlib
+from dataclasses import astuple, dataclass
+from functools import cache
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZIP_STORED, BadZipFile, ZipFile
+
+from europa1400_tools.cli.common_options import CommonOptions
+from europa1400_tools.const import JSON_EXTENSION
+from europa1400_tools.helpers import normalize
+
+LOCAL_FILE_HEADER_FORMAT = "<4s5H3I2H"
+LOCAL_FILE_HEADER_SIZE = struct.calcsize(LOCAL_FILE_HEADER_FORMAT)
+LOCAL_FILE_HEADER_SIGNATURE = b"PK\x03\x04"
+ENCRYPTED_FLAG = 0x1
+
+
+@dataclass
+class ArchiveMember:
+    """Location and checksum of a member of an archive."""
+
+    name: str
+    normalized_name: str
+    offset: int
+    compressed_size: int
+    file_size: int
+    crc: int
+    compress_type: int
+
+
+class ArchiveIndex:
+    """Index mapping full paths and normalized names to archive members.
+
+    Members are read straight from their local file header, so an archive does
+    not have to be opened as a ZipFile once its index is cached.
+    """
+
+    archive_path: Path
+    members: list[ArchiveMember]
+    members_by_name: dict[str, ArchiveMember]
+    members_by_normalized_name: dict[str, ArchiveMember]
+
+    def __init__(self, archive_path: Path, members: list[ArchiveMember]):
+        self.archive_path = archive_path
+        self.members = members
+        self.members_by_name = {}
+        self.members_by_normalized_name = {}
+
+        for member in members:
+            self.members_by_name.setdefault(member.name, member)
+            self.members_by_normalized_name.setdefault(member.normalized_name, member)
+
+    @classmethod
+    def from_archive(cls, archive_path: Path) -> "ArchiveIndex":
+        """Build the index from the central directory of an archive."""
+
+        with ZipFile(archive_path, "r") as zip_file:
+            zip_infos = zip_file.infolist()
+
+        return cls(
+            archive_path,
+            [
+                ArchiveMember(
+                    zip_info.filename,
+                    normalize(zip_info.filename),
+                    zip_info.header_offset,
+                    zip_info.compress_size,
+                    zip_info.file_size,
+                    zip_info.CRC,
+                    zip_info.compress_type,
+                )
+                for zip_info in zip_infos
+                if not zip_info.is_dir()
+            ],
+        )
+
+    @classmethod
+    def load(cls, archive_path: Path, index_path: Path) -> "ArchiveIndex":
+        """Load the index cached at index_path or rebuild it if the archive changed."""
+
+        archive_stat = archive_path.stat()
+
+        if index_path.exists():
+            try:
+                index_dict = json.loads(index_path.read_text(encoding="utf-8"))
+
+                if (
+                    index_dict["archive_size"] == archive_stat.st_size
+                    and index_dict["archive_mtime_ns"] == archive_stat.st_mtime_ns
+                ):
+                    return cls(
+                        archive_path,
+                        [ArchiveMember(*member) for member in index_dict["members"]],
+                    )
+            except (ValueError, KeyError, TypeError):
+                pass
+
+        archive_index = cls.from_archive(archive_path)
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text(
+            json.dumps(
+                {
+                    "archive_size": archive_stat.st_size,
+                    "archive_mtime_ns": archive_stat.st_mtime_ns,
+                    "members": [astuple(member) for member in archive_index.members],
+                }
+            ),
+            encoding="utf-8",
+        )
+
+        return archive_index
+
+    def get_members(self, file_suffix: str | None = None) -> list[ArchiveMember]:
+        """Return the members, optionally only those with the given suffix."""
+
+        if file_suffix is None:
+            return self.members
+
+        normalized_file_suffix = normalize(file_suffix)
+
+        return [
+            member
+            for member in self.members
+            if normalize(Path(member.name).suffix) == normalized_file_suffix
+        ]
+
+    def get_member(self, file_path: Path) -> ArchiveMember | None:
+        """Return the member with the given path."""
+
+        return self.members_by_name.get(file_path.as_posix())
+
+    def find_member(self, file_path: Path) -> ArchiveMember | None:
+        """Return the member with the given path or the same normalized name."""
+
+        member = self.get_member(file_path)
+
+        if member is not None:
+            return member
+
+        return self.members_by_normalized_name.get(normalize(file_path))
+
+    def contains(self, file_path: Path) -> bool:
+        """Check if the archive contains a member with the given path."""
+
+        return file_path.as_posix() in self.members_by_name
+
+    def read(self, member: ArchiveMember) -> bytes:
+        """Read and decompress a member."""
+
+        with open(self.archive_path, "rb") as archive_file:
+            archive_file.seek(member.offset)
+            local_file_header = struct.unpack(
+                LOCAL_FILE_HEADER_FORMAT, archive_file.read(LOCAL_FILE_HEADER_SIZE)
+            )
+
+            if local_file_header[0] != LOCAL_FILE_HEADER_SIGNATURE:
+                raise BadZipFile(f"Bad local file header for {member.name}")
+
+            flags = local_file_header[2]
+            name_length, extra_length = local_file_header[-2:]
+
+            if flags & ENCRYPTED_FLAG or member.compress_type not in [
+                ZIP_STORED,
+                ZIP_DEFLATED,
+            ]:
+                with ZipFile(self.archive_path, "r") as zip_file:
+                    return zip_file.read(member.name)
+
+            archive_file.seek(name_length + extra_length, 1)
+            data = archive_file.read(member.compressed_size)
+
+        if member.compress_type == ZIP_DEFLATED:
+            data = zlib.decompress(data, -zlib.MAX_WBITS)
+
+        if zlib.crc32(data) != member.crc:
+            raise BadZipFile(f"Bad CRC-32 for {member.name}")
+
+        return data
+
+    def read_file(self, file_path: Path) -> bytes:
+        """Read and decompress the member with the given path."""
+
+        member = self.get_member(file_path)
+
+        if member is None:
+            raise KeyError(f"{file_path} not found in {self.archive_path}")
+
+        return self.read(member)
+
+    def extract(self, member: ArchiveMember, output_path: Path) -> Path:
+        """Extract a member to output_path and return the path of the file."""
+
+        member_path = Path(
+            *[
+                part
+                for part in Path(member.name).parts
+                if part not in ["", ".", ".."] and part != Path(member.name).anchor
+            ]
+        )
+        output_file_path = output_path / member_path
+
+        output_file_path.parent.mkdir(parents=True, exist_ok=True)
+        output_file_path.write_bytes(self.read(member))
+
+        return output_file_path
+
+
+@cache
+def get_archive_index(archive_path: Path) -> ArchiveIndex:
+    """Return the index of an archive, loading it once per process."""
+
+    return ArchiveIndex.load(
+        archive_path,
+        CommonOptions.instance.archive_indexes_path
+        / f"{archive_path.name}{JSON_EXTENSION}",
+    )
@@ -1,16 +1,26 @@
-import base64
-import io
+# pylint: disable=import-outside-toplevel
+# Heavy dependencies are imported by the functions using them to keep the CLI
+# startup fast.
+
+import json
 import os
 import re
+import shutil
 import struct
-import tkinter as tk
+import uuid
+from functools import cache
 from pathlib import Path
-from tkinter import filedialog
-from typing import Any, BinaryIO, Iterable
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterable
 
 import construct as cs
-from europa1400_tools.const import OBJECTS_STRING_ENCODING
-from PIL import Image
+from europa1400_tools.const import (
+    BAF_TO_BGFS_JSON,
+    OBJECTS_STRING_ENCODING,
+    PACKAGE_DATA_PATH,
+)
+
+if TYPE_CHECKING:
+    from PIL import Image
 
 
 def normalize(
@@ -44,6 +54,9 @@ def strip_non_ascii(input_string):
 def ask_for_game_path() -> Path:
     """Ask the user for the game path using a file dialog."""
 
+    import tkinter as tk
+    from tkinter import filedialog
+
     root = tk.Tk()
     root.withdraw()
 
@@ -68,36 +81,6 @@ def find_texture_path(texture_name: str, search_path: Path) -> Path | None:
     return None
 
 
-def bitmap_to_gltf_uri(bmp_path: Path) -> str:
-    bmp_image = Image.open(bmp_path)
-    bmp_image = bmp_image.convert("RGB")
-    image_bytes_buffer = io.BytesIO()
-
-    bmp_image.save(image_bytes_buffer, format="PNG")
-    image_bytes = image_bytes_buffer.getvalue()
-    encoded_data = base64.b64encode(image_bytes).decode("utf-8")
-    uri = f"data:image/png;base64,{encoded_data}"
-
-    return uri
-
-
-def png_to_gltf_uri(png_path: Path) -> str:
-    png_image = Image.open(png_path)
-    image_bytes_buffer = io.BytesIO()
-
-    png_image.save(image_bytes_buffer, format="PNG")
-    image_bytes = image_bytes_buffer.getvalue()
-    encoded_data = base64.b64encode(image_bytes).decode("utf-8")
-    uri = f"data:image/png;base64,{encoded_data}"
-
-    return uri
-
-
-def bytes_to_gltf_uri(data: bytes) -> str:
-    encoded_data = base64.b64encode(data).decode("utf-8")
-    return f"data:application/octet-stream;base64,{encoded_data}"
-
-
 def HexConst(hex_str: str) -> cs.Const:
     if len(hex_str) % 2 != 0:
         raise RuntimeError("Hex string must be of even size")
@@ -235,6 +218,32 @@ def rebase_path(path: Path, base_path: Path, target_path: Path) -> Path:
     return target_path / relative_path
 
 
+def link_or_copy(source_path: Path, target_path: Path) -> None:
+    """Hard-link the source file to the target path, or copy it if linking fails.
+
+    An existing target is replaced. Files on different drives or file systems
+    without hard links are copied instead. The link or copy is made under a
+    temporary name and renamed onto the target, so jobs writing the same target
+    never fail on each other and a copy never writes into a linked file.
+    """
+
+    if target_path.exists() and os.path.samefile(source_path, target_path):
+        return
+
+    temporary_path = target_path.with_name(f".{target_path.name}.{uuid.uuid4().hex}")
+
+    try:
+        try:
+            os.link(source_path, temporary_path)
+        except OSError:
+            shutil.copyfile(source_path, temporary_path)
+
+        os.replace(temporary_path, target_path)
+    finally:
+        # Renaming onto a link of the same file leaves the temporary link behind.
+        temporary_path.unlink(missing_ok=True)
+
+
 def sanitize_filename(path, replacement="_"):
     illegal_characters = r'<>:"/\|?*'
     if os.name == "nt":
@@ -269,27 +278,40 @@ def get_files(
 
 
 def load_image_with_transparency(filepath):
+    from PIL import Image
+
     # Load the image using Pillow
     img = Image.open(filepath)
 
     # Convert the image to RGBA mode (4 channels: Red, Green, Blue, Alpha)
     img = img.convert("RGBA")
 
-    # Get the pixel data as a list of tuples (r, g, b, a)
-    pixel_data = list(img.getdata())
+    return make_black_transparent(img)
+
+
+def make_black_transparent(image: "Image.Image") -> "Image.Image":
+    """Return an RGBA copy of the image with black pixels fully transparent.
+
+    Images without an alpha channel are made fully opaque otherwise.
+    """
+
+    import numpy as np
+    from PIL import Image
+
+    pixels = np.array(image.convert("RGBA"))
+    is_black = ~pixels[..., :3].any(axis=-1)
+    pixels[is_black] = 0
+
+    return Image.fromarray(pixels, "RGBA")
+
 
-    # Create a new pixel data list with transparency applied
-    new_pixel_data = []
-    for pixel in pixel_data:
-        # Check if the pixel is completely black (RGB: 0, 0, 0)
-        if pixel[:3] == (0, 0, 0):
-            # Make the pixel fully transparent (alpha: 0)
-            new_pixel_data.append((0, 0, 0, 0))
-        else:
-            # Keep the pixel as is
-            new_pixel_data.append(pixel)
+@cache
+def get_baf_to_bgfs() -> dict[str, list[str]]:
+    """Return the known mapping of animation files to object files.
 
-    # Update the image data with the new pixel data
-    img.putdata(new_pixel_data)
+    The mapping is large, so it is kept in a data file of the package and only
+    loaded when it is needed.
+    """
 
-    return img
+    with open(PACKAGE_DATA_PATH / BAF_TO_BGFS_JSON, encoding="utf-8") as file:
+        return json.load(file)
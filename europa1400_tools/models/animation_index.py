@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+from dataclasses_json import dataclass_json
+
+
+@dataclass_json
+@dataclass
+class AnimationIndexEntry:
+    """Name and vertex count of a file matched against animations."""
+
+    path: str
+    name: str
+    vertex_count: int
+    source_stamp: str = ""
+
+
+@dataclass_json
+@dataclass
+class AnimationIndexManifest:
+    """Entries of an animation index keyed by the file they were read from."""
+
+    entries: dict[str, AnimationIndexEntry] = field(default_factory=dict)
@@ -0,0 +1,22 @@
+from dataclasses import dataclass, field
+
+from dataclasses_json import dataclass_json
+
+
+@dataclass_json
+@dataclass
+class DecodeManifestEntry:
+    """Source state of a decoded file."""
+
+    source_hash: str
+    source_stamp: str
+    output_path: str = ""
+
+
+@dataclass_json
+@dataclass
+class DecodeManifest:
+    """Manifest of the files decoded by a decoder."""
+
+    fingerprint: str
+    entries: dict[str, DecodeManifestEntry] = field(default_factory=dict)
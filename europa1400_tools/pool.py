@@ -0,0 +1,63 @@
+"""Process pool for spreading work over multiple CPU cores."""
+
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Callable
+
+from europa1400_tools.cli.common_options import CommonOptions
+
+_worker_context: Any = None
+
+
+def _initialize_worker(
+    options_type: type[CommonOptions],
+    options_params: dict[str, Any],
+    context: Any,
+) -> None:
+    """Restore the CLI options and the shared context in a worker process."""
+
+    global _worker_context  # pylint: disable=global-statement
+
+    options_type(**options_params)
+    _worker_context = context
+
+
+def _call_worker_context(method_name: str, *args: Any) -> Any:
+    """Call a method of the shared context."""
+
+    return getattr(_worker_context, method_name)(*args)
+
+
+def run_in_process_pool(
+    context: Any,
+    method_name: str,
+    arguments: list[tuple],
+    on_completed: Callable[[Future], None] | None = None,
+) -> list[Future]:
+    """Call a method of the context once per argument tuple in a process pool.
+
+    The context is sent to each worker once when the worker starts, so shared
+    read-only state does not have to be pickled for every call. The returned
+    futures are in the same order as the arguments. `on_completed` is called in
+    the parent process whenever a call finishes.
+    """
+
+    if len(arguments) == 0:
+        return []
+
+    options = CommonOptions.instance
+
+    with ProcessPoolExecutor(
+        max_workers=min(options.jobs, len(arguments)),
+        initializer=_initialize_worker,
+        initargs=(type(options), dict(options.__dict__), context),
+    ) as executor:
+        futures = [
+            executor.submit(_call_worker_context, method_name, *args)
+            for args in arguments
+        ]
+
+        for future in as_completed(futures):
+            if on_completed is not None:
+                on_completed(future)
+
+    return futures
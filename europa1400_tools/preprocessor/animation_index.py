@@ -0,0 +1,114 @@
+"""Index matching animations and objects by vertex count and name."""
+
+from pathlib import Path
+from typing import Callable
+
+from europa1400_tools.helpers import normalize
+from europa1400_tools.models.animation_index import (
+    AnimationIndexEntry,
+    AnimationIndexManifest,
+)
+
+
+def get_name_tokens(name: str) -> set[str]:
+    """Return the normalized parts of a name separated by underscores."""
+
+    return set(normalize(name).split("_"))
+
+
+class AnimationIndex:
+    """Index bucketing files by vertex count and name tokens.
+
+    An animation belongs to an object if both have the same number of vertices
+    and share a part of their names. Matching a name only looks at the files in
+    the buckets of its vertex count and tokens instead of comparing it against
+    every indexed file. Matches are returned in the order the files were added.
+
+    Entries are keyed by the file they were read from together with the size and
+    modification time of that file, so a stored index is updated by reading only
+    the files that changed.
+    """
+
+    entries: dict[str, AnimationIndexEntry]
+    buckets: dict[tuple[int, str], list[str]]
+
+    def __init__(self, entries: dict[str, AnimationIndexEntry] | None = None):
+        self.entries = {}
+        self.buckets = {}
+        self._positions: dict[str, int] = {}
+
+        for key, entry in (entries or {}).items():
+            self.add(key, entry)
+
+    @classmethod
+    def load(cls, index_path: Path) -> "AnimationIndex":
+        """Load the index stored at index_path or return an empty index."""
+
+        if not index_path.exists():
+            return cls()
+
+        try:
+            manifest: AnimationIndexManifest = AnimationIndexManifest.from_json(
+                index_path.read_text(encoding="utf-8")
+            )
+        except (ValueError, KeyError, TypeError):
+            return cls()
+
+        return cls(manifest.entries)
+
+    def save(self, index_path: Path) -> None:
+        """Write the index to disk."""
+
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        index_path.write_text(
+            AnimationIndexManifest(self.entries).to_json(indent=4), encoding="utf-8"
+        )
+
+    def add(self, key: str, entry: AnimationIndexEntry) -> None:
+        """Add an entry to the buckets of its vertex count and name tokens."""
+
+        if key in self.entries:
+            raise KeyError(f"{key} is already indexed")
+
+        self.entries[key] = entry
+        self._positions[key] = len(self._positions)
+
+        for token in get_name_tokens(entry.name):
+            self.buckets.setdefault((entry.vertex_count, token), []).append(key)
+
+    def find(self, name: str, vertex_count: int) -> list[AnimationIndexEntry]:
+        """Return the entries with the vertex count sharing a token with the name."""
+
+        keys = {
+            key
+            for token in get_name_tokens(name)
+            for key in self.buckets.get((vertex_count, token), [])
+        }
+
+        return [self.entries[key] for key in sorted(keys, key=self._positions.get)]
+
+    def update(
+        self,
+        file_paths: list[Path],
+        read_entry: Callable[[Path], AnimationIndexEntry],
+    ) -> "AnimationIndex":
+        """Return an index of the files, reading only those that changed.
+
+        Entries of files no longer in file_paths are dropped.
+        """
+
+        index = AnimationIndex()
+
+        for file_path in file_paths:
+            key = file_path.as_posix()
+            stat = file_path.stat()
+            source_stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+            entry = self.entries.get(key)
+
+            if entry is None or entry.source_stamp != source_stamp:
+                entry = read_entry(file_path)
+                entry.source_stamp = source_stamp
+
+            index.add(key, entry)
+
+        return index
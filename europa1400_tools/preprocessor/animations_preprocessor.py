@@ -1,12 +1,13 @@
-import pickle
 from pathlib import Path
 
-import numpy as np
-
 from europa1400_tools.cli.common_options import CommonOptions
 from europa1400_tools.const import BAF_EXTENSION, JSON_EXTENSION, OUTPUT_META_DIR
-from europa1400_tools.construct.baf import Baf, Vector3
+from europa1400_tools.construct.baf import Baf
+from europa1400_tools.construct.bgf import Bgf
+from europa1400_tools.decoder.decoded_store import load_decoded
+from europa1400_tools.models.animation_index import AnimationIndexEntry
 from europa1400_tools.models.metadata import AnimationMetadata
+from europa1400_tools.preprocessor.animation_index import AnimationIndex
 from europa1400_tools.rich.progress import Progress
 
 
@@ -52,15 +53,12 @@ class AnimationsPreprocessor:
                     progress.cached_file_count += 1
                     continue
 
-                with open(animation_pickle_path, "rb") as file:
-                    baf: Baf = pickle.load(file)
-
-                vertices_per_key = baf.get_vertices_per_key()
+                baf: Baf = load_decoded(animation_pickle_path)
 
                 animation_metadata = AnimationMetadata(
                     name=baf.path.stem,
                     path=relative_path.with_suffix(BAF_EXTENSION),
-                    vertices_count=vertices_per_key.shape[1],
+                    vertices_count=baf.vertex_count,
                 )
 
                 animation_metadatas.append(animation_metadata)
@@ -71,45 +69,39 @@ class AnimationsPreprocessor:
         return animation_metadatas
 
     @staticmethod
-    def map_animation(baf: Baf, bgf_to_vertices: dict[Path, np.ndarray]) -> list[Path]:
-        """Map animation to object."""
-
-        mapped_bgfs: list[Path] = []
-        baf_vertices: list[Vector3] = []
-
-        for model in baf.body.keys[0].models:
-            baf_vertices.extend(model.vertices)
-
-        baf_vertices_np = np.array(
-            [[vertex.x, vertex.y, vertex.z] for vertex in baf_vertices],
-            dtype=np.float32,
-        )
+    def map_animation(baf: Baf, object_index: AnimationIndex) -> list[Path]:
+        """Map animation to the objects with its vertex count sharing a name part."""
 
-        if baf.path.stem.lower() == "sitzung1_kutte":
-            pass
+        return [
+            Path(entry.path)
+            for entry in object_index.find(baf.path.stem, baf.vertex_count)
+        ]
 
-        for bgf_path, bgf_vertices_np in bgf_to_vertices.items():
-            if bgf_vertices_np.shape[0] != baf_vertices_np.shape[0]:
-                continue
+    @staticmethod
+    def index_objects(decoded_object_paths: list[Path]) -> AnimationIndex:
+        """Return the index of objects animations are mapped to.
 
-            baf_name = baf.path.stem
-            bgf_name = bgf_path.stem
+        The index is stored with the decode manifests and its entries are checked
+        against the size and modification time of each decoded object, so only
+        objects decoded again since the last run have to be loaded.
+        """
 
-            baf_name_parts = [part.lower() for part in baf_name.split("_")]
-            bgf_name_parts = [part.lower() for part in bgf_name.split("_")]
+        index_path = CommonOptions.instance.objects_animation_index_path
+        object_index = AnimationIndex.load(index_path).update(
+            decoded_object_paths, AnimationsPreprocessor.read_object_entry
+        )
+        object_index.save(index_path)
 
-            baf_name_parts = [
-                "".join([char for char in part]) for part in baf_name_parts
-            ]
-            bgf_name_parts = [
-                "".join([char for char in part]) for part in bgf_name_parts
-            ]
+        return object_index
 
-            if not any(
-                baf_name_part in bgf_name_parts for baf_name_part in baf_name_parts
-            ):
-                continue
+    @staticmethod
+    def read_object_entry(decoded_object_path: Path) -> AnimationIndexEntry:
+        """Load a decoded object and return its entry in the object index."""
 
-            mapped_bgfs.append(bgf_path)
+        bgf: Bgf = load_decoded(decoded_object_path)
 
-        return mapped_bgfs
+        return AnimationIndexEntry(
+            path=bgf.path.as_posix(),
+            name=bgf.path.stem,
+            vertex_count=bgf.mapping_object.vertex_mapping_count,
+        )
@@ -1,10 +1,11 @@
 """Command line interface for europa1400_tools."""
 
+# pylint: disable=import-outside-toplevel
+
 import logging
 import pickle
 from pathlib import Path
 
-import numpy as np
 import typer
 
 from europa1400_tools.cli.common_options import CommonOptions
@@ -12,20 +13,13 @@ from europa1400_tools.const import (
     MAPPED_ANIMATONS_PICKLE,
     OUTPUT_ANIMATIONS_DIR,
     OUTPUT_OBJECTS_DIR,
-    PICKLE_EXTENSION,
 )
-from europa1400_tools.construct.baf import Baf
-from europa1400_tools.construct.bgf import Bgf
 from europa1400_tools.decoder.commands import (
     cmd_decode_animations,
     cmd_decode_objects,
     cmd_decode_txs,
 )
 from europa1400_tools.helpers import get_files
-from europa1400_tools.preprocessor.animations_preprocessor import (
-    AnimationsPreprocessor,
-)
-from europa1400_tools.preprocessor.objects_preprocessor import ObjectsPreprocessor
 
 app = typer.Typer()
 
@@ -34,6 +28,10 @@ app = typer.Typer()
 def cmd_preprocess_objects(
     ctx: typer.Context,
 ):
+    from europa1400_tools.preprocessor.objects_preprocessor import (
+        ObjectsPreprocessor,
+    )
+
     ObjectsPreprocessor.preprocess_objects()
 
 
@@ -57,14 +55,14 @@ def cmd_preprocess_animations(
 
     if common_options.decoded_animations_path.exists() and common_options.use_cache:
         animations_pickle_paths = get_files(
-            common_options.decoded_animations_path, PICKLE_EXTENSION
+            common_options.decoded_animations_path, common_options.decoded_extension
         )
     else:
         animations_pickle_paths = cmd_decode_animations(ctx)
 
     if common_options.decoded_objects_path.exists() and common_options.use_cache:
         objects_pickle_paths = get_files(
-            common_options.decoded_objects_path, PICKLE_EXTENSION
+            common_options.decoded_objects_path, common_options.decoded_extension
         )
     else:
         objects_pickle_paths = cmd_decode_objects(ctx)
@@ -94,37 +92,22 @@ def preprocess_animations(
 ) -> tuple[dict[Path, list[Path]], list[Path]]:
     """Map animation files to object files."""
 
+    from europa1400_tools.construct.baf import Baf
+    from europa1400_tools.decoder.decoded_store import load_decoded
+    from europa1400_tools.preprocessor.animations_preprocessor import (
+        AnimationsPreprocessor,
+    )
+
     bafs: list[Baf] = []
-    bgfs: list[Bgf] = []
 
-    logging.info("Loading animations and objects.")
+    logging.info("Loading animations.")
 
     for animation_pickle_path in decoded_animations_paths:
-        with open(animation_pickle_path, "rb") as animation_pickle_file:
-            baf: Baf = pickle.load(animation_pickle_file)
-            bafs.append(baf)
-
-    for object_pickle_path in decoded_objects_paths:
-        with open(object_pickle_path, "rb") as object_pickle_file:
-            bgf: Bgf = pickle.load(object_pickle_file)
-            bgfs.append(bgf)
-
-    bgf_to_vertices: dict[Path, np.ndarray] = {}
-
-    logging.info("Extracting vertices for objects.")
-
-    for bgf in bgfs:
-        bgf_to_vertices[bgf.path] = np.array(
-            [
-                [
-                    vertex_mapping.vertex1.x,
-                    vertex_mapping.vertex1.y,
-                    vertex_mapping.vertex1.z,
-                ]
-                for vertex_mapping in bgf.mapping_object.vertex_mappings
-            ],
-            dtype=np.float32,
-        )
+        bafs.append(load_decoded(animation_pickle_path))
+
+    logging.info("Indexing objects.")
+
+    object_index = AnimationsPreprocessor.index_objects(decoded_objects_paths)
 
     baf_path_to_bgf_paths: dict[Path, list[Path]] = {}
 
@@ -132,7 +115,7 @@ def preprocess_animations(
     missing_paths: list[Path] = []
     for baf in bafs:
         logging.debug(f"Mapping {baf.path}.")
-        mapped_bgf_paths = AnimationsPreprocessor.map_animation(baf, bgf_to_vertices)
+        mapped_bgf_paths = AnimationsPreprocessor.map_animation(baf, object_index)
 
         stripped_baf_path = baf.path.relative_to(extracted_animations_path)
 
@@ -1,6 +1,6 @@
 import json
 import logging
-import pickle
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -18,13 +18,22 @@ from europa1400_tools.const import (
 )
 from europa1400_tools.construct.bgf import Bgf
 from europa1400_tools.construct.txs import Txs
+from europa1400_tools.decoder.decoded_store import load_decoded
 from europa1400_tools.extractor.file_extractor import FileExtractor
-from europa1400_tools.helpers import get_files, normalize, rebase_path
+from europa1400_tools.helpers import (
+    get_files,
+    make_black_transparent,
+    normalize,
+    rebase_path,
+)
+from europa1400_tools.models.animation_index import AnimationIndexEntry
 from europa1400_tools.models.metadata import (
     AnimationMetadata,
     ObjectMetadata,
     TextureMetadata,
 )
+from europa1400_tools.pool import run_in_process_pool
+from europa1400_tools.preprocessor.animation_index import AnimationIndex
 from europa1400_tools.rich.progress import Progress
 
 
@@ -46,19 +55,52 @@ class ObjectsPreprocessor:
         )
 
         object_metadatas: list[ObjectMetadata] = []
-        texture_metadatas: list[TextureMetadata] = []
+        texture_metadatas: dict[str, TextureMetadata] = {}
+        texture_conversions: dict[Path, tuple[Path | None, Path, bool]] = {}
+
+        animation_index = AnimationIndex()
+        animation_metadatas_by_path: dict[str, AnimationMetadata] = {}
+
+        for animation_metadata in animation_metadatas:
+            animation_path = animation_metadata.path.as_posix()
+
+            if animation_path in animation_metadatas_by_path:
+                continue
+
+            animation_metadatas_by_path[animation_path] = animation_metadata
+            animation_index.add(
+                animation_path,
+                AnimationIndexEntry(
+                    path=animation_path,
+                    name=animation_metadata.name,
+                    vertex_count=animation_metadata.vertices_count,
+                ),
+            )
+
+        txs_pickle_paths_by_name: dict[str, Path] = {}
+        texture_paths_by_name: dict[str, Path] = {}
+
+        for txs_pickle_path in txs_pickle_paths:
+            txs_pickle_paths_by_name.setdefault(txs_pickle_path.stem, txs_pickle_path)
+
+        for texture_path in texture_paths:
+            texture_paths_by_name.setdefault(normalize(texture_path.stem), texture_path)
+
+        decoded_objects_path = CommonOptions.instance.decoded_objects_path
+        converted_objects_path = CommonOptions.instance.converted_objects_path
+        decoded_txs_path = CommonOptions.instance.decoded_txs_path
+        extracted_textures_path = CommonOptions.instance.extracted_textures_path
+        converted_textures_path = CommonOptions.instance.converted_textures_path
 
         with progress:
             for object_pickle_path in object_pickle_paths:
                 relative_path = object_pickle_path.relative_to(
-                    CommonOptions.instance.decoded_objects_path
+                    decoded_objects_path
                 ).with_suffix(BGF_EXTENSION)
 
                 progress.file_path = relative_path
                 object_metadata_path = (
-                    CommonOptions.instance.converted_objects_path
-                    / OUTPUT_META_DIR
-                    / relative_path
+                    converted_objects_path / OUTPUT_META_DIR / relative_path
                 ).with_suffix(JSON_EXTENSION)
 
                 if not object_metadata_path.parent.exists():
@@ -71,40 +113,29 @@ class ObjectsPreprocessor:
                     object_metadatas.append(object_metadata)
 
                     for texture_metadata in object_metadata.textures:
-                        if texture_metadata in texture_metadatas:
-                            continue
-
-                        texture_metadatas.append(texture_metadata)
+                        texture_metadatas.setdefault(
+                            texture_metadata.name, texture_metadata
+                        )
 
                     progress.cached_file_count += 1
                     continue
 
-                with open(object_pickle_path, "rb") as object_pickle_file:
-                    bgf: Bgf = pickle.load(object_pickle_file)
+                bgf: Bgf = load_decoded(object_pickle_path)
 
-                txs_pickle_path = next(
-                    (
-                        txs_pickle_path
-                        for txs_pickle_path in txs_pickle_paths
-                        if txs_pickle_path.stem == bgf.name
-                    ),
-                    None,
-                )
+                txs_pickle_path = txs_pickle_paths_by_name.get(bgf.name)
                 relative_txs_path: Path | None = None
+                txs: Txs | None = None
 
                 if txs_pickle_path is not None:
-                    relative_txs_path = txs_pickle_path.relative_to(
-                        CommonOptions.instance.decoded_txs_path
-                    )
-                    with open(txs_pickle_path, "rb") as txs_pickle_file:
-                        txs = pickle.load(txs_pickle_file)
+                    relative_txs_path = txs_pickle_path.relative_to(decoded_txs_path)
+                    txs = load_decoded(txs_pickle_path)
 
-                txs: Txs | None = None
-
-                txs_main_texture_name = None
+                txs_main_texture_path: Path | None = None
 
                 if txs is not None and len(txs.texture_names) > 0:
-                    txs_main_texture_name = list(txs.texture_names)[0]
+                    txs_main_texture_path = texture_paths_by_name.get(
+                        normalize(list(txs.texture_names)[0])
+                    )
 
                 object_metadata = ObjectMetadata(
                     name=bgf.name,
@@ -115,39 +146,16 @@ class ObjectsPreprocessor:
                 )
 
                 for texture in bgf.textures:
-                    texture_metadata = next(
-                        (
-                            texture_metadata
-                            for texture_metadata in texture_metadatas
-                            if texture_metadata.name == texture.name
-                        ),
-                        None,
-                    )
+                    texture_metadata = texture_metadatas.get(texture.name)
 
                     if texture_metadata is not None:
                         object_metadata.textures.append(texture_metadata)
                         continue
 
-                    texture_path = next(
-                        (
-                            texture_path
-                            for texture_path in texture_paths
-                            if normalize(texture_path.stem) == normalize(texture.name)
-                        ),
-                        None,
+                    texture_path = texture_paths_by_name.get(
+                        normalize(texture.name), txs_main_texture_path
                     )
 
-                    if texture_path is None and txs is not None:
-                        texture_path = next(
-                            (
-                                texture_path
-                                for texture_path in texture_paths
-                                if normalize(texture_path.stem)
-                                == normalize(txs_main_texture_name)
-                            ),
-                            None,
-                        )
-
                     texture_metadata = TextureMetadata(
                         name=Path(texture.name).stem,
                         path=texture_path,
@@ -155,75 +163,103 @@ class ObjectsPreprocessor:
                     )
 
                     if texture_metadata.path is None:
-                        bmp_path = (
-                            CommonOptions.instance.extracted_textures_path
-                            / Path(texture_metadata.name).with_suffix(BMP_EXTENSION)
-                        )
-                        png_path = (
-                            CommonOptions.instance.converted_textures_path
-                            / Path(texture_metadata.name).with_suffix(PNG_EXTENSION)
-                        )
+                        bmp_path = extracted_textures_path / Path(
+                            texture_metadata.name
+                        ).with_suffix(BMP_EXTENSION)
+                        png_path = converted_textures_path / Path(
+                            texture_metadata.name
+                        ).with_suffix(PNG_EXTENSION)
                     else:
                         bmp_path = texture_metadata.path
                         png_path = (
                             rebase_path(
                                 texture_path,
-                                CommonOptions.instance.extracted_textures_path,
-                                CommonOptions.instance.converted_textures_path,
+                                extracted_textures_path,
+                                converted_textures_path,
                             )
                             .with_stem(texture_metadata.name)
                             .with_suffix(PNG_EXTENSION)
                         )
 
-                    if not png_path.parent.exists():
-                        png_path.parent.mkdir(parents=True)
+                    texture_conversions[png_path] = (
+                        bmp_path if texture_metadata.path is not None else None,
+                        png_path,
+                        texture_metadata.has_transparency,
+                    )
 
-                    if texture_metadata.has_transparency:
-                        pass
+                    relative_png_path = png_path.relative_to(converted_textures_path)
+                    texture_metadata.path = relative_png_path
 
-                    if texture_metadata.path is None:
-                        self.create_dummy_texture(png_path)
-                    elif texture_metadata.has_transparency:
-                        self.convert_bmp_to_png_with_transparency(bmp_path, png_path)
-                    else:
-                        self.convert_bmp_to_png(bmp_path, png_path)
+                    object_metadata.textures.append(texture_metadata)
+                    texture_metadatas.setdefault(
+                        texture_metadata.name, texture_metadata
+                    )
 
-                    relative_png_path = png_path.relative_to(
-                        CommonOptions.instance.converted_textures_path
+                object_metadata.animations = [
+                    animation_metadatas_by_path[entry.path]
+                    for entry in animation_index.find(
+                        object_metadata.name, bgf.mapping_object.vertex_mapping_count
                     )
-                    texture_metadata.path = relative_png_path
+                ]
 
-                    object_metadata.textures.append(texture_metadata)
-                    texture_metadatas.append(texture_metadata)
+                object_metadatas.append(object_metadata)
+                object_metadata_path.write_text(object_metadata.to_json(indent=4))
 
-                for animation_metadata in animation_metadatas:
-                    normalized_baf_name = normalize(animation_metadata.name)
-                    normalized_object_name = normalize(object_metadata.name)
+                progress.completed_file_count += 1
 
-                    split_baf_name = normalized_baf_name.split("_")
-                    split_object_name = normalized_object_name.split("_")
+        self.convert_textures(list(texture_conversions.values()))
 
-                    has_identical_part: bool = False
+        return object_metadatas
 
-                    for baf_name_part in split_baf_name:
-                        if baf_name_part in split_object_name:
-                            has_identical_part = True
-                            break
+    def convert_textures(
+        self, texture_conversions: list[tuple[Path | None, Path, bool]]
+    ) -> None:
+        """Convert each texture used by the objects once."""
 
-                    has_identical_vertices_count: bool = (
-                        bgf.mapping_object.vertex_mapping_count
-                        == animation_metadata.vertices_count
-                    )
+        progress = Progress(
+            title="Converting textures",
+            total_file_count=len(texture_conversions),
+        )
 
-                    if has_identical_part and has_identical_vertices_count:
-                        object_metadata.animations.append(animation_metadata)
+        with progress:
+            if CommonOptions.instance.jobs > 1 and len(texture_conversions) > 1:
 
-                object_metadatas.append(object_metadata)
-                object_metadata_path.write_text(object_metadata.to_json(indent=4))
+                def on_completed(future: Future) -> None:
+                    if future.exception() is None:
+                        progress.file_path = future.result()
+                    progress.completed_file_count += 1
+
+                futures = run_in_process_pool(
+                    self, "convert_texture", texture_conversions, on_completed
+                )
+
+                for future in futures:
+                    future.result()
 
+                return
+
+            for bmp_path, png_path, has_transparency in texture_conversions:
+                progress.file_path = self.convert_texture(
+                    bmp_path, png_path, has_transparency
+                )
                 progress.completed_file_count += 1
 
-        return object_metadatas
+    def convert_texture(
+        self, bmp_path: Path | None, png_path: Path, has_transparency: bool
+    ) -> Path:
+        """Convert a BMP texture to PNG or create a dummy texture without a BMP."""
+
+        if not png_path.parent.exists():
+            png_path.parent.mkdir(parents=True, exist_ok=True)
+
+        if bmp_path is None:
+            self.create_dummy_texture(png_path)
+        elif has_transparency:
+            self.convert_bmp_to_png_with_transparency(bmp_path, png_path)
+        else:
+            self.convert_bmp_to_png(bmp_path, png_path)
+
+        return png_path.relative_to(CommonOptions.instance.converted_textures_path)
 
     @staticmethod
     def create_dummy_texture(
@@ -243,16 +279,7 @@ class ObjectsPreprocessor:
 
         bmp_image = Image.open(bmp_path)
         bmp_image = bmp_image.convert("RGB")
-        png_image = Image.new("RGBA", bmp_image.size)
-
-        for x in range(bmp_image.width):
-            for y in range(bmp_image.height):
-                r, g, b = bmp_image.getpixel((x, y))
-
-                if r == 0 and g == 0 and b == 0:
-                    png_image.putpixel((x, y), (0, 0, 0, 0))
-                else:
-                    png_image.putpixel((x, y), (r, g, b, 255))
+        png_image = make_black_transparent(bmp_image)
 
         png_image.save(output_path, format="png")
 
@@ -262,11 +289,6 @@ class ObjectsPreprocessor:
 
         bmp_image = Image.open(bmp_path)
         bmp_image = bmp_image.convert("RGB")
-        png_image = Image.new("RGBA", bmp_image.size)
-
-        for x in range(bmp_image.width):
-            for y in range(bmp_image.height):
-                r, g, b = bmp_image.getpixel((x, y))
-                png_image.putpixel((x, y), (r, g, b, 255))
+        png_image = bmp_image.convert("RGBA")
 
         png_image.save(output_path, format="png")
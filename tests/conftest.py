@@ -0,0 +1,141 @@
+"""Factories of game files and benchmark reporting shared by the tests.
+
+Each factory is provided by a fixture of the same name. Tests marked as
+benchmarks are deselected by default, `pytest -m benchmark` runs them and prints
+what they report after the test session.
+"""
+
+import struct
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from europa1400_tools.const import SoundbankType, SoundType
+
+BENCHMARK_RESULTS_KEY = pytest.StashKey[list[str]]()
+
+
+@pytest.fixture(name="report_benchmark")
+def fixture_report_benchmark(request: pytest.FixtureRequest) -> Callable[[str], None]:
+    """Return a function adding a line to the benchmark summary."""
+
+    results = request.config.stash.setdefault(BENCHMARK_RESULTS_KEY, [])
+
+    def report_benchmark(line: str) -> None:
+        results.append(f"{request.node.name}: {line}")
+
+    return report_benchmark
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config) -> None:
+    results = config.stash.get(BENCHMARK_RESULTS_KEY, [])
+
+    if results:
+        terminalreporter.section("benchmarks")
+
+        for line in results:
+            terminalreporter.write_line(line)
+
+
+def create_mapping_object_bytes(vertex_mapping_count: int, polygon_count: int) -> bytes:
+    data = b"\x2F\x2D" + struct.pack("<BHxH", 1, 2, 3) + b"\xB5\xFA"
+    data += struct.pack("<3I", 1, vertex_mapping_count, polygon_count)
+
+    for index in range(vertex_mapping_count + 8):
+        data += struct.pack("<6f", *[index + offset / 8 for offset in range(6)])
+
+    data += struct.pack("<f", 0.5)
+
+    for index in range(polygon_count):
+        data += struct.pack("<3I", index, index + 1, index + 2)
+        data += struct.pack("<9f", *[index - offset / 4 for offset in range(9)])
+        data += struct.pack("<B", index % 3)
+
+    return data
+
+
+@pytest.fixture(name="create_mapping_object_bytes")
+def fixture_create_mapping_object_bytes() -> Callable[[int, int], bytes]:
+    return create_mapping_object_bytes
+
+
+def create_gfx_file(
+    file_path: Path,
+    graphics: list[tuple[int, int, bytes]],
+    file_order: list[int] | None = None,
+) -> None:
+    """Write a GFX file with one shapebank of opaque graphics.
+
+    The graphics are stored in `file_order` and found through the offsets table
+    of the shapebank header, relative to the start of the shapebank.
+    """
+
+    definition_size = 84
+    address = 4 + definition_size
+    shapebank_header_size = 8 + 34 + struct.calcsize("<H2HII6sH3sH") + 0x800
+    file_order = file_order or list(range(len(graphics)))
+
+    graphic_datas = [
+        struct.pack("<I17H3I", 0, 0, width, 0, height, *[0] * 13, 0, 0, 0) + pixel_data
+        for width, height, pixel_data in graphics
+    ]
+    offsets = [0] * len(graphics)
+    offset = shapebank_header_size
+
+    for index in file_order:
+        offsets[index] = offset
+        offset += len(graphic_datas[index])
+
+    shapebank_data = (
+        b"SHAPBANK"
+        + bytes(34)
+        + struct.pack("<H2HII6sH3sH", len(graphics), 0, 0, 0, 0, b"", 0, b"", 0)
+        + struct.pack(f"<{len(offsets)}I", *offsets).ljust(0x800, b"\x00")
+        + b"".join(graphic_datas[index] for index in file_order)
+    )
+    definition_data = b"Icons".ljust(48, b"\x00") + struct.pack(
+        "<I4sII4sB7sIHH", address, b"", len(shapebank_data), 0, b"", 0, b"", 0, 1, 1
+    )
+
+    file_path.write_bytes(struct.pack("<I", 1) + definition_data + shapebank_data)
+
+
+@pytest.fixture(name="create_gfx_file")
+def fixture_create_gfx_file() -> Callable[..., None]:
+    return create_gfx_file
+
+
+def create_sbf_file(file_path: Path, soundbanks: dict[str, list[bytes]]) -> None:
+    definitions_data = b""
+    soundbanks_data = b""
+
+    for name, sounds in soundbanks.items():
+        soundbank_type = (
+            SoundbankType.MULTI if len(sounds) > 1 else SoundbankType.SINGLE
+        )
+        definitions_data += (
+            struct.pack("<I", 0)
+            + name.encode("ascii").ljust(50, b"\x00")
+            + struct.pack("<H8s", soundbank_type, b"")
+        )
+
+        if soundbank_type == SoundbankType.MULTI:
+            soundbanks_data += struct.pack("<3I", len(sounds), 0, 0)
+
+        for sound in sounds:
+            soundbanks_data += struct.pack("<3I", SoundType.WAV, len(sound), 0)
+
+        soundbanks_data += b"".join(sounds)
+
+    file_path.write_bytes(
+        b"test".ljust(308, b"\x00")
+        + struct.pack("<I4s8s", len(soundbanks), b"", b"")
+        + definitions_data
+        + soundbanks_data
+    )
+
+
+@pytest.fixture(name="create_sbf_file")
+def fixture_create_sbf_file() -> Callable[[Path, dict[str, list[bytes]]], None]:
+    return create_sbf_file
@@ -0,0 +1,68 @@
+import random
+from pathlib import Path
+
+from europa1400_tools.helpers import normalize
+from europa1400_tools.models.animation_index import AnimationIndexEntry
+from europa1400_tools.preprocessor.animation_index import AnimationIndex
+
+NAME_PARTS = ["Mann", "Frau", "Kind", "Soldat", "low", "Lauf", "steh"]
+
+
+def match_all_pairs(
+    name: str, vertex_count: int, entries: list[AnimationIndexEntry]
+) -> list[AnimationIndexEntry]:
+    name_parts = normalize(name).split("_")
+
+    return [
+        entry
+        for entry in entries
+        if entry.vertex_count == vertex_count
+        and any(part in normalize(entry.name).split("_") for part in name_parts)
+    ]
+
+
+def test_animation_index_matches_all_pairs_comparison():
+    rng = random.Random(1400)
+    entries = [
+        AnimationIndexEntry(
+            path=f"objects/{index}.bgf",
+            name="_".join(rng.sample(NAME_PARTS, rng.randint(1, 3))),
+            vertex_count=rng.choice([8, 12, 20]),
+        )
+        for index in range(200)
+    ]
+    animation_index = AnimationIndex({entry.path: entry for entry in entries})
+
+    for _ in range(50):
+        name = "_".join(rng.sample(NAME_PARTS, rng.randint(1, 3)))
+        vertex_count = rng.choice([8, 12, 20])
+
+        assert animation_index.find(name, vertex_count) == match_all_pairs(
+            name, vertex_count, entries
+        )
+
+
+def test_animation_index_update_reads_changed_files_only(tmp_path: Path):
+    file_paths = [tmp_path / "Mann_low.bgf", tmp_path / "Frau_low.bgf"]
+    read_paths: list[Path] = []
+
+    for file_path in file_paths:
+        file_path.write_bytes(b"\x00" * 8)
+
+    def read_entry(file_path: Path) -> AnimationIndexEntry:
+        read_paths.append(file_path)
+        return AnimationIndexEntry(
+            path=file_path.as_posix(),
+            name=file_path.stem,
+            vertex_count=file_path.stat().st_size,
+        )
+
+    index_path = tmp_path / "index.json"
+    AnimationIndex().update(file_paths, read_entry).save(index_path)
+
+    file_paths[1].write_bytes(b"\x00" * 12)
+    animation_index = AnimationIndex.load(index_path).update(file_paths, read_entry)
+
+    assert read_paths == [file_paths[0], file_paths[1], file_paths[1]]
+    assert [entry.name for entry in animation_index.find("low", 8)] == ["Mann_low"]
+    assert [entry.name for entry in animation_index.find("frau", 12)] == ["Frau_low"]
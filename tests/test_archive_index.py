@@ -0,0 +1,46 @@
+from pathlib import Path
+from zipfile import ZIP_DEFLATED, ZipFile
+
+from europa1400_tools.extractor.archive_index import ArchiveIndex
+
+
+def create_archive(archive_path: Path) -> None:
+    with ZipFile(archive_path, "w", compression=ZIP_DEFLATED) as zip_file:
+        zip_file.writestr("Houses/House_01.bgf", b"bgf" * 100)
+        zip_file.writestr("Houses/House_01.txs", b"txs")
+        zip_file.writestr("Misc/Barrel.bgf", b"barrel", compress_type=0)
+
+
+def test_archive_index_resolves_members(tmp_path: Path):
+    archive_path = tmp_path / "objects.bin"
+    create_archive(archive_path)
+
+    archive_index = ArchiveIndex.from_archive(archive_path)
+
+    assert archive_index.contains(Path("Misc/Barrel.bgf"))
+    assert not archive_index.contains(Path("Barrel.bgf"))
+    assert archive_index.get_member(Path("Barrel.bgf")) is None
+    assert archive_index.find_member(Path("barrel.bgf")).name == "Misc/Barrel.bgf"
+    assert [member.name for member in archive_index.get_members(".bgf")] == [
+        "Houses/House_01.bgf",
+        "Misc/Barrel.bgf",
+    ]
+
+
+def test_archive_index_reads_members_from_cached_index(tmp_path: Path):
+    archive_path = tmp_path / "objects.bin"
+    index_path = tmp_path / "index.json"
+    create_archive(archive_path)
+
+    ArchiveIndex.load(archive_path, index_path)
+    archive_index = ArchiveIndex.load(archive_path, index_path)
+
+    assert index_path.exists()
+    assert archive_index.read_file(Path("Houses/House_01.bgf")) == b"bgf" * 100
+    assert archive_index.read_file(Path("Misc/Barrel.bgf")) == b"barrel"
+
+    extracted_path = archive_index.extract(
+        archive_index.get_member(Path("Houses/House_01.txs")), tmp_path / "extracted"
+    )
+    assert extracted_path == tmp_path / "extracted" / "Houses" / "House_01.txs"
+    assert extracted_path.read_bytes() == b"txs"
@@ -0,0 +1,265 @@
+import io
+import wave
+from concurrent.futures import Future
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+import ffmpeg
+import pytest
+
+from europa1400_tools.cli.convert_options import ConvertOptions
+from europa1400_tools.const import SoundType, TargetFormat
+from europa1400_tools.construct.sbf import Sbf
+from europa1400_tools.converter import audio_transcoder
+from europa1400_tools.converter.audio_cache import AudioCache
+from europa1400_tools.converter.audio_transcoder import (
+    AudioTranscoder,
+    read_mp3_format,
+    run_ffmpeg,
+    write_wav,
+)
+from europa1400_tools.converter.sbf_converter import SbfConverter
+
+
+def test_write_wav_writes_valid_sizes():
+    pcm_bytes = bytes(range(16)) * 10
+    wav_bytes = write_wav(pcm_bytes, channel_count=2, sample_rate=22050)
+
+    with wave.open(io.BytesIO(wav_bytes), "rb") as wav_file:
+        assert wav_file.getnchannels() == 2
+        assert wav_file.getframerate() == 22050
+        assert wav_file.getnframes() == len(pcm_bytes) // 4
+        assert wav_file.readframes(wav_file.getnframes()) == pcm_bytes
+
+
+def test_read_mp3_format_skips_id3_tag():
+    id3_tag = b"ID3\x04\x00\x00\x00\x00\x00\x05" + b"\x00" * 5
+
+    assert read_mp3_format(b"\xff\xfb\x90\xc4" + b"\x00" * 8) == (44100, 1)
+    assert read_mp3_format(id3_tag + b"\xff\xf3\x84\x00") == (24000, 2)
+    assert read_mp3_format(b"RIFF" + b"\x00" * 8) is None
+
+
+class FakeFfmpegProcess:
+    """ffmpeg process returning fixed output without running ffmpeg."""
+
+    def __init__(self, returncode: int, output_bytes: bytes, error_bytes: bytes):
+        self.returncode = returncode
+        self.output_bytes = output_bytes
+        self.error_bytes = error_bytes
+
+    def communicate(self, input: bytes) -> tuple[bytes, bytes]:
+        return self.output_bytes, self.error_bytes
+
+
+@pytest.mark.parametrize(("returncode", "output_bytes"), [(1, b"partial"), (0, b"")])
+def test_run_ffmpeg_raises_on_failure(
+    monkeypatch: pytest.MonkeyPatch, returncode: int, output_bytes: bytes
+):
+    process = FakeFfmpegProcess(returncode, output_bytes, b"Invalid data found")
+    stream = SimpleNamespace(
+        output=lambda *args, **kwargs: SimpleNamespace(
+            run_async=lambda **kwargs: process
+        )
+    )
+    monkeypatch.setattr(ffmpeg, "input", lambda *args, **kwargs: stream)
+
+    with pytest.raises(RuntimeError, match="Invalid data found"):
+        run_ffmpeg(b"RIFF", format="mp3")
+
+
+@pytest.mark.parametrize(
+    ("target_format", "expected_sounds"),
+    [("mp3", [b"mp3:RIFF-step-1", b"mp3:RIFF-step-22"]), ("wav", [])],
+)
+def test_sbf_converter_transcodes_each_sound_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    target_format: str,
+    expected_sounds: list[bytes],
+    create_sbf_file: Callable[..., None],
+):
+    transcoded_sounds: list[bytes] = []
+
+    def convert_wav_to_mp3(wav_bytes: bytes) -> bytes:
+        transcoded_sounds.append(b"mp3:" + wav_bytes)
+        return b"mp3:" + wav_bytes
+
+    monkeypatch.setattr(audio_transcoder, "convert_wav_to_mp3", convert_wav_to_mp3)
+    ConvertOptions(_output_path=str(tmp_path / "output"), _target_format=target_format)
+
+    sbf_path = tmp_path / "test.sbf"
+    create_sbf_file(sbf_path, {"steps": [b"RIFF-step-1", b"RIFF-step-22"]})
+
+    output_paths = SbfConverter().convert(
+        Sbf.from_file(sbf_path, mapped=True), tmp_path / "converted"
+    )
+
+    assert sorted(transcoded_sounds) == expected_sounds
+    assert [output_path.name for output_path in output_paths] == [
+        f"test_steps_0.{target_format}",
+        f"test_steps_1.{target_format}",
+    ]
+    assert [output_path.read_bytes() for output_path in output_paths] == (
+        expected_sounds or [b"RIFF-step-1", b"RIFF-step-22"]
+    )
+
+
+def test_sbf_converter_transcodes_duplicate_sounds_once_across_runs(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_sbf_file: Callable[..., None],
+):
+    transcoded_sounds: list[bytes] = []
+
+    def convert_wav_to_mp3(wav_bytes: bytes) -> bytes:
+        transcoded_sounds.append(wav_bytes)
+        return b"mp3:" + wav_bytes
+
+    monkeypatch.setattr(audio_transcoder, "convert_wav_to_mp3", convert_wav_to_mp3)
+    ConvertOptions(_output_path=str(tmp_path / "output"), _target_format="mp3")
+
+    sbf_path = tmp_path / "test.sbf"
+    create_sbf_file(
+        sbf_path,
+        {"steps": [b"RIFF-step", b"RIFF-step"], "door": [b"RIFF-step"]},
+    )
+
+    for run in range(2):
+        output_paths = SbfConverter().convert(
+            Sbf.from_file(sbf_path, mapped=True), tmp_path / f"converted_{run}"
+        )
+
+        assert len(output_paths) == 3
+        assert all(
+            output_path.read_bytes() == b"mp3:RIFF-step" for output_path in output_paths
+        )
+
+    assert transcoded_sounds == [b"RIFF-step"]
+
+
+class PendingCountingTranscoder(AudioTranscoder):
+    """Transcoder counting the transcodes whose result was not taken yet."""
+
+    def __init__(self):
+        super().__init__(max_workers=1)
+        self.pending_count = 0
+        self.max_pending_count = 0
+
+    def transcode(
+        self,
+        audio_bytes: bytes | memoryview,
+        sound_type: SoundType,
+        target_format: TargetFormat,
+    ) -> Future[bytes]:
+        transcoder = self
+        mp3_bytes = b"mp3:" + bytes(audio_bytes)
+
+        class PendingFuture(Future):
+            def result(self, timeout=None):
+                transcoder.pending_count -= 1
+                return mp3_bytes
+
+        self.pending_count += 1
+        self.max_pending_count = max(self.max_pending_count, self.pending_count)
+
+        return PendingFuture()
+
+
+def test_sbf_converter_streams_sounds_with_bounded_pending_transcodes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_sbf_file: Callable[..., None],
+):
+    counting_transcoder = PendingCountingTranscoder()
+    monkeypatch.setattr(AudioTranscoder, "_shared", counting_transcoder)
+    ConvertOptions(
+        _game_path=str(tmp_path / "game"),
+        _output_path=str(tmp_path / "output"),
+        _target_format="mp3",
+    )
+
+    sounds = [f"RIFF-step-{index}".encode() for index in range(10)]
+    sbf_path = tmp_path / "test.sbf"
+    create_sbf_file(sbf_path, {"steps": sounds})
+
+    value_path, output_paths = SbfConverter().convert_file(sbf_path)
+
+    assert value_path == Path("test.sbf")
+    assert [output_path.read_bytes() for output_path in output_paths] == [
+        b"mp3:" + sound for sound in sounds
+    ]
+    assert counting_transcoder.pending_count == 0
+    assert counting_transcoder.max_pending_count == 2
+
+
+def test_sbf_converter_does_not_cache_failed_transcodes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_sbf_file: Callable[..., None],
+):
+    def convert_wav_to_mp3(wav_bytes: bytes) -> bytes:
+        raise RuntimeError("ffmpeg failed")
+
+    monkeypatch.setattr(audio_transcoder, "convert_wav_to_mp3", convert_wav_to_mp3)
+    ConvertOptions(_output_path=str(tmp_path / "output"), _target_format="mp3")
+
+    sbf_path = tmp_path / "test.sbf"
+    create_sbf_file(sbf_path, {"steps": [b"RIFF-step"]})
+    sbf_converter = SbfConverter()
+
+    with pytest.raises(RuntimeError, match="ffmpeg failed"):
+        sbf_converter.convert(
+            Sbf.from_file(sbf_path, mapped=True), tmp_path / "converted"
+        )
+
+    key = sbf_converter.audio_cache.get_key(b"RIFF-step", TargetFormat.MP3)
+    assert sbf_converter.audio_cache.get(key, TargetFormat.MP3) is None
+
+
+def test_audio_cache_rejects_empty_sounds(tmp_path: Path):
+    audio_cache = AudioCache(tmp_path, "fingerprint")
+    key = audio_cache.get_key(b"RIFF-step", TargetFormat.MP3)
+
+    with pytest.raises(ValueError):
+        audio_cache.store(key, TargetFormat.MP3, b"")
+
+    assert audio_cache.get(key, TargetFormat.MP3) is None
+    assert not list(tmp_path.rglob("*.tmp"))
+
+
+def test_sbf_converter_does_not_write_through_cached_sounds(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    create_sbf_file: Callable[..., None],
+):
+    monkeypatch.setattr(
+        audio_transcoder, "convert_wav_to_mp3", lambda wav_bytes: b"mp3:" + wav_bytes
+    )
+    sbf_path = tmp_path / "test.sbf"
+    create_sbf_file(sbf_path, {"steps": [b"RIFF-step"]})
+
+    ConvertOptions(_output_path=str(tmp_path / "output"), _target_format="mp3")
+    sbf_converter = SbfConverter()
+    (output_path,) = sbf_converter.convert(
+        Sbf.from_file(sbf_path, mapped=True), tmp_path / "converted"
+    )
+    linked_output_path = output_path.with_suffix(".wav")
+    output_path.rename(linked_output_path)
+
+    ConvertOptions(_output_path=str(tmp_path / "output"), _target_format="wav")
+    SbfConverter().convert(Sbf.from_file(sbf_path, mapped=True), tmp_path / "converted")
+
+    key = sbf_converter.audio_cache.get_key(b"RIFF-step", TargetFormat.MP3)
+    cached_path = sbf_converter.audio_cache.get(key, TargetFormat.MP3)
+    assert cached_path is not None
+    assert cached_path.read_bytes() == b"mp3:RIFF-step"
+    assert linked_output_path.read_bytes() == b"RIFF-step"
+
+
+def test_audio_transcoder_rejects_sounds_in_the_target_format():
+    with pytest.raises(ValueError):
+        AudioTranscoder(max_workers=1).transcode(
+            b"RIFF-step", SoundType.WAV, TargetFormat.WAV
+        )
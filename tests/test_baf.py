@@ -0,0 +1,79 @@
+import struct
+from pathlib import Path
+from zipfile import ZipFile
+
+import numpy as np
+
+from europa1400_tools.construct.baf import Baf, BafIni
+from europa1400_tools.decoder.baf_decoder import BafDecoder
+from europa1400_tools.extractor.archive_index import ArchiveIndex
+
+BAF_INI_BYTES = (
+    b"[4HEAD Studios Animation-Settings]\r\n"
+    + b"NumKeys=4\r\nKeys=0,80,160,240\r\nLoopIn=1\r\nLoopOut=3\r\n"
+)
+
+
+def create_baf_bytes(vertex_counts: list[int], key_count: int) -> bytes:
+    data = b"BGF\0\x30" + struct.pack("<I", 0) + b"\x01" + struct.pack("<H", 0)
+    data += b"\xCD\xAB\x23" + struct.pack("<I", key_count)
+    data += b"\x36" + struct.pack("<I", len(vertex_counts))
+
+    for key_index in range(key_count):
+        for model_index, vertex_count in enumerate(vertex_counts):
+            data += b"\x18" + struct.pack("<I", model_index)
+            data += b"\x19" + struct.pack("<I", vertex_count) + b"\x21"
+
+            for vertex_index in range(vertex_count):
+                data += struct.pack("<3f", key_index, model_index, vertex_index + 0.5)
+
+            data += b"\x28"
+
+    return data + b"\x2F"
+
+
+def test_vertices_per_key_are_read_without_vertex_objects():
+    baf = Baf.from_bytes(create_baf_bytes([2, 3], 4), Path("test.baf"))
+
+    vertices_per_key = baf.get_vertices_per_key()
+
+    assert baf.vertex_count == 5
+    assert vertices_per_key.shape == (4, 5, 3)
+    assert vertices_per_key.dtype == np.float32
+    assert vertices_per_key[3, 4].tolist() == [3.0, 1.0, 2.5]
+    assert baf.get_key_vertices(2).tolist() == vertices_per_key[2].tolist()
+    assert baf.body.keys[1].models[0].vertices[1].z == 1.5
+
+
+def test_baf_ini_from_bytes_matches_from_file(tmp_path: Path):
+    baf_ini_path = tmp_path / "Mann_lauf.ini"
+    baf_ini_path.write_bytes(BAF_INI_BYTES)
+
+    baf_ini = BafIni.from_bytes(BAF_INI_BYTES, Path("Mann_lauf.ini"))
+
+    assert baf_ini == BafIni.from_file(baf_ini_path)
+    assert baf_ini.num_keys == 4
+    assert baf_ini.key_times == [0.0, 1.0, 2.0, 3.0]
+    assert (baf_ini.loop_in, baf_ini.loop_out) == (1, 3)
+
+
+def test_baf_decoder_decodes_members_with_ini_from_the_archive(tmp_path: Path):
+    archive_path = tmp_path / "animations.bin"
+
+    with ZipFile(archive_path, "w") as zip_file:
+        zip_file.writestr("Mann/Mann_lauf.baf", create_baf_bytes([2], 4))
+        zip_file.writestr("Mann/Mann_lauf.ini", BAF_INI_BYTES)
+        zip_file.writestr("Mann/Mann_steh.baf", create_baf_bytes([2], 1))
+
+    archive_index = ArchiveIndex.from_archive(archive_path)
+    baf_decoder = BafDecoder()
+
+    baf = baf_decoder.decode_member(archive_index, Path("Mann/Mann_lauf.baf"))
+    baf_without_ini = baf_decoder.decode_member(
+        archive_index, Path("Mann/Mann_steh.baf")
+    )
+
+    assert baf.vertex_count == 2
+    assert baf.baf_ini is not None
+    assert baf.baf_ini.key_times == [0.0, 1.0, 2.0, 3.0]
+    assert baf_without_ini.baf_ini is None
@@ -0,0 +1,38 @@
+from typing import Callable
+
+import construct as cs
+from construct_typed import DataclassStruct
+
+from europa1400_tools.construct.bgf import BgfMappingObject, PolygonMapping
+
+
+def test_mapping_object_mesh_matches_parsed_polygons(
+    create_mapping_object_bytes: Callable[[int, int], bytes],
+):
+    data = create_mapping_object_bytes(4, 5)
+    mapping_object = DataclassStruct(BgfMappingObject).parse(data)
+    mesh = mapping_object.get_mesh()
+
+    polygons_offset = len(data) - 5 * 49
+    polygons = cs.Array(5, DataclassStruct(PolygonMapping)).parse(
+        data[polygons_offset:]
+    )
+
+    assert mesh.vertices.shape == (4, 3)
+    assert mesh.vertices[3].tolist() == [3.0, 3.125, 3.25]
+    assert mesh.normals[3].tolist() == [3.375, 3.5, 3.625]
+
+    for index, polygon in enumerate(polygons):
+        assert mesh.faces[index].tolist() == [
+            polygon.face.a,
+            polygon.face.b,
+            polygon.face.c,
+        ]
+        assert mesh.uvs[index].tolist() == [
+            [polygon.texture_mapping.a.u, polygon.texture_mapping.a.v],
+            [polygon.texture_mapping.b.u, polygon.texture_mapping.b.v],
+            [polygon.texture_mapping.c.u, polygon.texture_mapping.c.v],
+        ]
+        assert mesh.texture_indices[index] == polygon.texture_index
+
+    assert DataclassStruct(BgfMappingObject).build(mapping_object) == data
@@ -0,0 +1,105 @@
+import time
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from europa1400_tools.converter.bgf_gltf_converter import split_primitives
+
+
+def split_primitive_per_corner(
+    faces: np.ndarray,
+    texture_indices: np.ndarray,
+    face_uvs: np.ndarray,
+    texture_index: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray] | None:
+    """Split the faces of a texture like the dict-based splitting did."""
+
+    selected_faces = faces[texture_indices == texture_index]
+    selected_face_uvs = face_uvs[texture_indices == texture_index]
+
+    if len(selected_faces) == 0:
+        return None
+
+    indices: list[int] = []
+    vertex_indices: list[int] = []
+    uvs: list[np.ndarray] = []
+    vertex_dict: dict[tuple, int] = {}
+
+    for face, uvs_of_face in zip(selected_faces, selected_face_uvs):
+        for vertex_index, uv in zip(face, uvs_of_face):
+            key = (vertex_index, uv[0], uv[1])
+
+            if key not in vertex_dict:
+                vertex_dict[key] = len(vertex_indices)
+                vertex_indices.append(vertex_index)
+                uvs.append(uv)
+
+            indices.append(vertex_dict[key])
+
+    return (
+        np.array(indices, dtype=np.uint32),
+        np.array(vertex_indices, dtype=np.uint32),
+        np.array(uvs, dtype=np.float32),
+    )
+
+
+def create_mesh(
+    face_count: int, vertex_count: int, texture_count: int, seed: int = 1400
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Create faces sharing vertices and UVs like those of a building."""
+
+    rng = np.random.default_rng(seed)
+    faces = rng.integers(0, vertex_count, size=(face_count, 3), dtype=np.uint32)
+    texture_indices = rng.integers(0, texture_count, size=face_count, dtype=np.uint32)
+    face_uvs = rng.integers(0, 4, size=(face_count, 3, 2)).astype(np.float32) / 4
+
+    return faces, texture_indices, face_uvs
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_split_primitives_matches_splitting_per_corner(seed: int):
+    texture_count = 5
+    faces, texture_indices, face_uvs = create_mesh(300, 60, texture_count - 1, seed)
+    face_uvs[0, 0] = [-0.0, 0.5]
+    face_uvs[1, 0] = [0.0, 0.5]
+
+    primitive_splits = split_primitives(faces, texture_indices, face_uvs, texture_count)
+
+    assert primitive_splits[-1] is None
+
+    for texture_index, primitive_split in enumerate(primitive_splits):
+        expected = split_primitive_per_corner(
+            faces, texture_indices, face_uvs, texture_index
+        )
+
+        if expected is None:
+            assert primitive_split is None
+            continue
+
+        assert primitive_split is not None
+        assert np.array_equal(primitive_split.indices, expected[0])
+        assert np.array_equal(primitive_split.vertex_indices, expected[1])
+        assert np.array_equal(primitive_split.uvs, expected[2])
+
+
+@pytest.mark.benchmark
+def test_benchmark_split_primitives(report_benchmark: Callable[[str], None]):
+    face_count = 200_000
+    texture_count = 16
+    faces, texture_indices, face_uvs = create_mesh(face_count, 60_000, texture_count)
+
+    start = time.perf_counter()
+    for texture_index in range(texture_count):
+        split_primitive_per_corner(faces, texture_indices, face_uvs, texture_index)
+    per_corner_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    split_primitives(faces, texture_indices, face_uvs, texture_count)
+    vectorized_elapsed = time.perf_counter() - start
+
+    report_benchmark(
+        f"{face_count} faces, {texture_count} textures: "
+        + f"per corner {per_corner_elapsed:.2f} s, "
+        + f"vectorized {vectorized_elapsed:.2f} s"
+    )
@@ -0,0 +1,220 @@
+import random
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+import numpy as np
+import pytest
+
+from europa1400_tools.cli.convert_options import ConvertOptions
+from europa1400_tools.construct.common import VECTOR3_DTYPE
+from europa1400_tools.converter.bgf_wavefront_converter import BgfWavefrontConverter
+from europa1400_tools.converter.wavefront_writer import to_float_columns
+
+
+def create_bgf(
+    model_count: int,
+    vertex_count: int,
+    polygon_count: int,
+    texture_count: int,
+    float_count: int | None = None,
+) -> SimpleNamespace:
+    """Create a BGF with the fields read by the wavefront converter.
+
+    Floats are drawn from `float_count` distinct values if given, like the
+    coordinates, normals and UVs repeated throughout the meshes of buildings.
+    """
+
+    rng = random.Random(1400)
+    float_pool = (
+        None
+        if float_count is None
+        else [float(np.float32(rng.uniform(-100, 100))) for _ in range(float_count)]
+    )
+
+    def create_float(rng: random.Random) -> float:
+        if float_pool is not None:
+            return rng.choice(float_pool)
+
+        return float(np.float32(rng.uniform(-100, 100)))
+
+    def create_vector3() -> SimpleNamespace:
+        return SimpleNamespace(
+            x=create_float(rng), y=create_float(rng), z=create_float(rng)
+        )
+
+    def create_texture_mapping() -> SimpleNamespace:
+        vertex_u, vertex_v, vertex_w = (
+            create_vector3(),
+            create_vector3(),
+            create_vector3(),
+        )
+
+        return SimpleNamespace(
+            vertex_u=vertex_u,
+            vertex_v=vertex_v,
+            vertex_w=vertex_w,
+            a=SimpleNamespace(u=vertex_u.x, v=vertex_v.x),
+            b=SimpleNamespace(u=vertex_u.y, v=vertex_v.y),
+            c=SimpleNamespace(u=vertex_u.z, v=vertex_v.z),
+        )
+
+    def create_polygon(index: int) -> SimpleNamespace:
+        return SimpleNamespace(
+            face=SimpleNamespace(
+                a=rng.randrange(vertex_count),
+                b=rng.randrange(vertex_count),
+                c=rng.randrange(vertex_count),
+            ),
+            texture_mapping=create_texture_mapping(),
+            normal=create_vector3() if index % 5 else None,
+            texture_index=rng.randrange(texture_count + 1) if index % 7 else None,
+        )
+
+    models = [
+        SimpleNamespace(
+            vertices=np.array(
+                [
+                    (create_float(rng), create_float(rng), create_float(rng) or -0.0)
+                    for _ in range(vertex_count)
+                ],
+                dtype=VECTOR3_DTYPE,
+            ).view(np.recarray),
+            polygons=[create_polygon(index) for index in range(polygon_count)],
+        )
+        for _ in range(model_count)
+    ]
+
+    return SimpleNamespace(
+        name="test.bgf",
+        game_objects=[SimpleNamespace(model=model) for model in models]
+        + [SimpleNamespace(model=None)],
+        textures=[None] * texture_count,
+    )
+
+
+def create_obj_string(bgf: SimpleNamespace, object_metadata: SimpleNamespace) -> str:
+    """Build the OBJ like the converter did by concatenating strings."""
+
+    obj_string = f"mtllib {Path(bgf.name).with_suffix('.mtl')}\n"
+    models = [
+        game_object.model
+        for game_object in bgf.game_objects
+        if game_object.model is not None
+    ]
+    face_offset = 0
+    tex_offset = 0
+
+    for i, model in enumerate(models):
+        texture_mappings = [polygon.texture_mapping for polygon in model.polygons]
+        texture_indices = [
+            polygon.texture_index
+            for polygon in model.polygons
+            if polygon.texture_index is not None
+        ]
+        vertices = [vertex for vertex in model.vertices]
+        faces = [polygon.face for polygon in model.polygons]
+        normals = [
+            polygon.normal for polygon in model.polygons if polygon.normal is not None
+        ]
+        materials = [
+            Path(object_metadata.textures[texture_index].name).stem
+            for texture_index in texture_indices
+            if texture_index < len(bgf.textures)
+        ]
+
+        obj_string += f"o group{i}\n"
+
+        for vertex in vertices:
+            obj_string += f"v {float(vertex.x)} {float(vertex.z)} {-float(vertex.y)}\n"
+
+        for normal in normals:
+            obj_string += f"vn {normal.x} {normal.z} {-normal.y}\n"
+
+        for texture_mapping in texture_mappings:
+            obj_string += f"vt {texture_mapping.a.u} {texture_mapping.a.v} 0\n"
+            obj_string += f"vt {texture_mapping.b.u} {texture_mapping.b.v} 0\n"
+            obj_string += f"vt {texture_mapping.c.u} {texture_mapping.c.v} 0\n"
+
+        for face_index, (face, material) in enumerate(zip(faces, materials)):
+            obj_string += f"usemtl {material}\n"
+            obj_string += (
+                f"f {face.a + 1 + face_offset}/"
+                + f"{face_index * 3 + 1 + tex_offset}/{face_index + 1} "
+                + f"{face.b + 1 + face_offset}/"
+                + f"{face_index * 3 + 2 + tex_offset}/{face_index + 1} "
+                + f"{face.c + 1 + face_offset}/"
+                + f"{face_index * 3 + 3 + tex_offset}/{face_index + 1}\n"
+            )
+        face_offset += len(vertices)
+        tex_offset += len(texture_mappings * 3)
+
+    return obj_string
+
+
+def create_object_metadata(output_path: Path, texture_count: int) -> SimpleNamespace:
+    """Create converted textures and the object metadata referencing them."""
+
+    ConvertOptions(_output_path=str(output_path), _target_format="wavefront")
+    converted_textures_path = ConvertOptions.instance.converted_textures_path
+    converted_textures_path.mkdir(parents=True)
+    textures: list[SimpleNamespace] = []
+
+    for index in range(texture_count):
+        texture_path = Path(f"Textur_{index}.png")
+        (converted_textures_path / texture_path).write_bytes(b"png")
+        textures.append(SimpleNamespace(name=texture_path.name, path=texture_path))
+
+    return SimpleNamespace(textures=textures)
+
+
+def test_wavefront_converter_writes_the_concatenated_obj(tmp_path: Path):
+    object_metadata = create_object_metadata(tmp_path / "output", 4)
+    bgf = create_bgf(model_count=3, vertex_count=40, polygon_count=60, texture_count=3)
+    converter = BgfWavefrontConverter()
+
+    for object_name in ["a", "b"]:
+        output_path = tmp_path / "converted" / object_name
+        (obj_output_path,) = converter._convert(bgf, output_path, object_metadata)
+
+        assert obj_output_path.read_text() == create_obj_string(bgf, object_metadata)
+        assert (output_path / "test.mtl").read_text().count("newmtl") == 4
+        assert (output_path / "Textur_0.png").read_bytes() == b"png"
+
+    assert len(converter.copied_texture_paths) == 8
+
+
+def test_to_float_columns_formats_like_str_of_float():
+    values = [(0.0, -0.0, 0.1), (float(np.float32(0.1)), 0.0, -0.0)]
+
+    assert to_float_columns(values) == [
+        [str(row[column]) for row in values] for column in range(3)
+    ]
+    assert to_float_columns(np.empty((0, 2))) == [[], []]
+
+
+@pytest.mark.benchmark
+def test_benchmark_wavefront_converter(
+    tmp_path: Path, report_benchmark: Callable[[str], None]
+):
+    model_count = 10
+    polygon_count = 20_000
+    float_count = 5_000
+    texture_count = 16
+    bgf = create_bgf(model_count, 20_000, polygon_count, texture_count, float_count)
+    object_metadata = create_object_metadata(tmp_path, texture_count)
+
+    start = time.perf_counter()
+    create_obj_string(bgf, object_metadata)
+    concatenated_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    BgfWavefrontConverter()._convert(bgf, tmp_path / "converted", object_metadata)
+    buffered_elapsed = time.perf_counter() - start
+
+    report_benchmark(
+        f"{model_count * polygon_count} polygons, {float_count} distinct floats: "
+        + f"concatenated {concatenated_elapsed:.2f} s, "
+        + f"buffered {buffered_elapsed:.2f} s"
+    )
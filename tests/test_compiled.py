@@ -0,0 +1,158 @@
+import io
+import struct
+import timeit
+from pathlib import Path
+from typing import Callable
+
+import pytest
+from construct_typed import DataclassStruct
+
+from europa1400_tools.construct.ageb import AGeb
+from europa1400_tools.construct.aobj import AObj
+from europa1400_tools.construct.compiled import CompiledDataclassStruct
+from europa1400_tools.construct.gfx import LAZY_SHAPEBANKS_PARAM, Gfx
+from europa1400_tools.construct.sbf import Sbf
+from europa1400_tools.construct.txs import Txs
+
+
+def create_ageb_bytes() -> bytes:
+    data = b""
+
+    for index in range(88):
+        size_data = index % 40
+        data += struct.pack(
+            "<B32sBB", index % 7, f"Building {index}".encode(), 1, size_data
+        )
+        data += struct.pack(f"<{size_data}H", *range(size_data)).ljust(136, b"\0")
+        data += struct.pack(f"<{size_data}I", *range(size_data)).ljust(248, b"\0")
+        data += bytes(range(size_data)).ljust(65, b"\0")
+        data += bytes(range(size_data)).ljust(63, b"\0")
+        data += bytes(26) + bytes([1, 2, 3, 4, 5, 6])
+        data += struct.pack("<IBBI", index * 10, index % 4, 2, index * 100)
+
+    return data
+
+
+def create_aobj_bytes() -> bytes:
+    return b"".join(
+        struct.pack(
+            "<B32sBI4H4HHH2sH2sB",
+            index % 5,
+            f"Object {index}".encode(),
+            index % 3,
+            index,
+            *range(4),
+            *range(4, 8),
+            1,
+            index * 2,
+            b"",
+            2,
+            b"",
+            3,
+        )
+        for index in range(732)
+    )
+
+
+def create_txs_bytes() -> bytes:
+    names = [f"Texture_{index}.bmp".encode("latin-1") for index in range(60)]
+    names.append("Tür.bmp".encode("latin-1"))
+
+    return struct.pack("<3I", 0, 1, len(names)) + b"".join(
+        name + b"\0" for name in names
+    )
+
+
+@pytest.fixture(name="ageb_bytes")
+def fixture_ageb_bytes() -> bytes:
+    return create_ageb_bytes()
+
+
+@pytest.fixture(name="aobj_bytes")
+def fixture_aobj_bytes() -> bytes:
+    return create_aobj_bytes()
+
+
+@pytest.fixture(name="txs_bytes")
+def fixture_txs_bytes() -> bytes:
+    return create_txs_bytes()
+
+
+@pytest.fixture(name="gfx_bytes")
+def fixture_gfx_bytes(tmp_path: Path, create_gfx_file: Callable[..., None]) -> bytes:
+    gfx_path = tmp_path / "test.gfx"
+    create_gfx_file(gfx_path, [(2, 1, bytes(range(6))), (1, 1, bytes(3))])
+
+    return gfx_path.read_bytes()
+
+
+@pytest.fixture(name="sbf_bytes")
+def fixture_sbf_bytes(tmp_path: Path, create_sbf_file: Callable[..., None]) -> bytes:
+    sbf_path = tmp_path / "test.sbf"
+    create_sbf_file(sbf_path, {"steps": [b"abc", b"defg"], "bell": [b"dong"]})
+
+    return sbf_path.read_bytes()
+
+
+FORMATS = [
+    (AGeb, "ageb_bytes", {}),
+    (AObj, "aobj_bytes", {}),
+    (Txs, "txs_bytes", {}),
+    (Gfx, "gfx_bytes", {}),
+    (Gfx, "gfx_bytes", {LAZY_SHAPEBANKS_PARAM: True}),
+    (Sbf, "sbf_bytes", {}),
+]
+FORMAT_IDS = ["AGeb", "AObj", "Txs", "Gfx", "Gfx (definitions)", "Sbf"]
+
+
+def parse(parser, data: bytes, **contextkw):
+    stream = io.BytesIO(data)
+    stream.name = "test"
+
+    return parser.parse_stream(stream, **contextkw)
+
+
+@pytest.mark.parametrize(
+    "construct_type, bytes_fixture, contextkw", FORMATS, ids=FORMAT_IDS
+)
+def test_compiled_parser_matches_interpreted_parser(
+    request: pytest.FixtureRequest, construct_type, bytes_fixture, contextkw
+):
+    data = request.getfixturevalue(bytes_fixture)
+
+    interpreted = parse(DataclassStruct(construct_type), data, **contextkw)
+    compiled = parse(construct_type.get_struct(compiled=True), data, **contextkw)
+
+    assert isinstance(construct_type.get_struct(compiled=True), CompiledDataclassStruct)
+    assert compiled == interpreted
+    assert compiled.to_json() == interpreted.to_json()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "construct_type, bytes_fixture, contextkw", FORMATS, ids=FORMAT_IDS
+)
+def test_benchmark_compiled_parser(
+    request: pytest.FixtureRequest,
+    report_benchmark: Callable[[str], None],
+    construct_type,
+    bytes_fixture,
+    contextkw,
+):
+    data = request.getfixturevalue(bytes_fixture)
+    interpreted_parser = DataclassStruct(construct_type)
+    compiled_parser = construct_type.get_struct(compiled=True)
+    number = max(1, 20_000 // len(data))
+
+    interpreted_time = timeit.timeit(
+        lambda: parse(interpreted_parser, data, **contextkw), number=number
+    )
+    compiled_time = timeit.timeit(
+        lambda: parse(compiled_parser, data, **contextkw), number=number
+    )
+
+    report_benchmark(
+        f"interpreted {interpreted_time / number * 1000:.3f} ms, "
+        + f"compiled {compiled_time / number * 1000:.3f} ms, "
+        + f"speedup {interpreted_time / compiled_time:.2f}x"
+    )
@@ -0,0 +1,58 @@
+from pathlib import Path
+
+from europa1400_tools.decoder.decode_cache import DecodeCache, get_fingerprint
+
+
+def test_decode_cache_detects_changed_sources(tmp_path: Path):
+    manifest_path = tmp_path / "manifest.json"
+    source_path = tmp_path / "source.bin"
+    output_path = tmp_path / "source.pickle"
+    key = Path("source.bin")
+    source_path.write_bytes(b"original")
+
+    decode_cache = DecodeCache(manifest_path, "fingerprint")
+    entry = decode_cache.get_entry(key, [source_path])
+    assert not decode_cache.is_up_to_date(key, entry, output_path)
+    decode_cache.update(key, entry, output_path)
+    decode_cache.save()
+
+    decode_cache = DecodeCache(manifest_path, "fingerprint")
+    assert decode_cache.is_up_to_date(
+        key, decode_cache.get_entry(key, [source_path]), output_path
+    )
+
+    source_path.write_bytes(b"modified")
+    assert not decode_cache.is_up_to_date(
+        key, decode_cache.get_entry(key, [source_path]), output_path
+    )
+
+    decode_cache = DecodeCache(manifest_path, "other fingerprint")
+    source_path.write_bytes(b"original")
+    assert not decode_cache.is_up_to_date(
+        key, decode_cache.get_entry(key, [source_path]), output_path
+    )
+
+
+def test_decode_cache_detects_changed_output_path(tmp_path: Path):
+    manifest_path = tmp_path / "manifest.json"
+    source_path = tmp_path / "source.bin"
+    key = Path("source.bin")
+    source_path.write_bytes(b"original")
+
+    decode_cache = DecodeCache(manifest_path, "fingerprint")
+    decode_cache.update(
+        key, decode_cache.get_entry(key, [source_path]), tmp_path / "source.pickle"
+    )
+    decode_cache.save()
+
+    decode_cache = DecodeCache(manifest_path, "fingerprint")
+    entry = decode_cache.get_entry(key, [source_path])
+    assert decode_cache.is_up_to_date(key, entry, tmp_path / "source.pickle")
+    assert not decode_cache.is_up_to_date(key, entry, tmp_path / "source.npz")
+
+
+def test_fingerprint_includes_construct_dependencies():
+    fingerprint = get_fingerprint("europa1400_tools.construct.txs")
+
+    assert fingerprint == get_fingerprint("europa1400_tools.construct.txs")
+    assert fingerprint != get_fingerprint("europa1400_tools.construct.bgf")
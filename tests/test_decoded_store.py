@@ -0,0 +1,44 @@
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+from construct_typed import DataclassStruct
+
+from europa1400_tools.construct.bgf import Bgf, BgfMappingObject
+from europa1400_tools.decoder.decoded_store import dump_decoded, load_decoded
+
+
+def test_columnar_store_round_trips_bgf_geometry(
+    tmp_path: Path, create_mapping_object_bytes: Callable[[int, int], bytes]
+):
+    bgf = Bgf.__new__(Bgf)
+    bgf.path = Path("objects/test.bgf")
+    bgf.game_objects = []
+    bgf.mapping_object = DataclassStruct(BgfMappingObject).parse(
+        create_mapping_object_bytes(4, 3)
+    )
+
+    decoded_path = tmp_path / "test.columns"
+    dump_decoded(bgf, decoded_path)
+    loaded_bgf = load_decoded(decoded_path)
+
+    assert isinstance(loaded_bgf.mapping_object.vertex_mappings, np.recarray)
+    assert loaded_bgf.path == bgf.path
+    assert loaded_bgf.mapping_object.some_float == 0.5
+
+    for vertex_mapping, loaded_vertex_mapping in zip(
+        bgf.mapping_object.vertex_mappings,
+        loaded_bgf.mapping_object.vertex_mappings,
+        strict=True,
+    ):
+        assert vertex_mapping.vertex2.z == loaded_vertex_mapping.vertex2.z
+
+    for polygon, loaded_polygon in zip(
+        bgf.mapping_object.polygons, loaded_bgf.mapping_object.polygons, strict=True
+    ):
+        assert polygon.face.c == loaded_polygon.face.c
+        assert (
+            polygon.texture_mapping.vertex_w.y
+            == loaded_polygon.texture_mapping.vertex_w.y
+        )
+        assert polygon.texture_index == loaded_polygon.texture_index
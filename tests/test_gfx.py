@@ -0,0 +1,154 @@
+import struct
+from dataclasses import fields
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from europa1400_tools.construct.gfx import Gfx, Graphic, GraphicRow, TransparencyBlock
+from europa1400_tools.converter.gfx_converter import GfxConverter
+from europa1400_tools.decoder.gfx_reader import GfxReader
+
+
+def create_graphic(
+    width: int,
+    height: int,
+    pixel_data: bytes | None = None,
+    graphic_rows: list[GraphicRow] | None = None,
+) -> Graphic:
+    values = {field.name: 0 for field in fields(Graphic) if field.init}
+    values.update(
+        width=width,
+        height=height,
+        pixel_data=pixel_data,
+        graphic_rows=graphic_rows,
+    )
+    return Graphic(**values)
+
+
+def create_graphic_row(blocks: list[tuple[int, bytes]]) -> GraphicRow:
+    return GraphicRow(
+        block_count=len(blocks),
+        transparency_blocks=[
+            TransparencyBlock(
+                size_transparent=transparent_count * 3,
+                count_pixels=len(pixel_data) // 3,
+                pixel_data=pixel_data,
+            )
+            for transparent_count, pixel_data in blocks
+        ],
+    )
+
+
+def convert_graphic_per_pixel(graphic: Graphic) -> Image.Image:
+    image = Image.new("RGBA", (graphic.width, graphic.height))
+    pixel_data: list[int] = []
+
+    if graphic.pixel_data:
+        pixel_data = [
+            int.from_bytes(graphic.pixel_data[i : i + 3], "little") + 0xFF000000
+            for i in range(0, len(graphic.pixel_data), 3)
+        ]
+    else:
+        for graphic_row in graphic.graphic_rows:
+            for transparency_block in graphic_row.transparency_blocks:
+                pixel_data += [0x00FFFFFF] * (transparency_block.size_transparent // 3)
+                pixel_data += [
+                    int.from_bytes(transparency_block.pixel_data[i : i + 3], "little")
+                    + 0xFF000000
+                    for i in range(0, len(transparency_block.pixel_data), 3)
+                ]
+
+    image.putdata(pixel_data)
+    return image
+
+
+def test_convert_graphic_matches_per_pixel_conversion():
+    rng = np.random.default_rng(1400)
+    opaque_graphic = create_graphic(5, 4, rng.bytes(5 * 4 * 3))
+    transparent_graphic = create_graphic(
+        4,
+        3,
+        graphic_rows=[
+            create_graphic_row([(1, rng.bytes(6)), (1, b"")]),
+            create_graphic_row([(0, rng.bytes(12))]),
+            create_graphic_row([(2, rng.bytes(3))]),
+        ],
+    )
+    short_graphic = create_graphic(
+        3, 2, graphic_rows=[create_graphic_row([(1, rng.bytes(6))])]
+    )
+
+    gfx_converter = GfxConverter()
+
+    for graphic in [opaque_graphic, transparent_graphic, short_graphic]:
+        image = gfx_converter.convert_graphic(graphic)
+        expected_image = convert_graphic_per_pixel(graphic)
+
+        assert image.size == expected_image.size
+        assert image.tobytes() == expected_image.tobytes()
+
+
+def test_gfx_reader_reads_graphics_on_demand(
+    tmp_path: Path, create_gfx_file: Callable[..., None]
+):
+    gfx_path = tmp_path / "test.gfx"
+    rng = np.random.default_rng(1400)
+    create_gfx_file(
+        gfx_path,
+        [
+            (width, height, rng.bytes(width * height * 3))
+            for width, height in [(2, 3), (4, 1), (3, 3)]
+        ],
+    )
+
+    with GfxReader(gfx_path) as gfx_reader:
+        assert list(gfx_reader.shapebank_definitions) == ["Icons"]
+        assert gfx_reader.gfx.shapebank_definitions[0].shapebank is None
+
+        last_graphic = gfx_reader.read_graphic("Icons", 2)
+        graphics = list(gfx_reader.iter_graphics("Icons"))
+        shapebank = gfx_reader.read_shapebank("Icons")
+
+    assert graphics == shapebank.graphics
+    assert last_graphic == shapebank.graphics[2]
+    assert [(graphic.width, graphic.height) for graphic in graphics] == [
+        (2, 3),
+        (4, 1),
+        (3, 3),
+    ]
+    assert Gfx.from_file(gfx_path).shapebank_definitions[0].shapebank == shapebank
+
+
+def test_gfx_reader_seeks_to_graphics_through_the_offsets_table(
+    tmp_path: Path, create_gfx_file: Callable[..., None]
+):
+    gfx_path = tmp_path / "test.gfx"
+    sizes = [(2, 3), (4, 1), (3, 3)]
+    create_gfx_file(
+        gfx_path,
+        [(width, height, bytes(width * height * 3)) for width, height in sizes],
+        file_order=[2, 0, 1],
+    )
+
+    with GfxReader(gfx_path) as gfx_reader:
+        graphics = [gfx_reader.read_graphic("Icons", index) for index in [1, 2, 0]]
+
+        assert [(graphic.width, graphic.height) for graphic in graphics] == [
+            sizes[1],
+            sizes[2],
+            sizes[0],
+        ]
+
+    data = bytearray(gfx_path.read_bytes())
+    first_offset_address = 4 + 84 + 8 + 34 + struct.calcsize("<H2HII6sH3sH")
+    data[first_offset_address : first_offset_address + 4] = struct.pack("<I", 16)
+    gfx_path.write_bytes(data)
+
+    with GfxReader(gfx_path) as gfx_reader:
+        with pytest.raises(ValueError):
+            gfx_reader.read_graphic("Icons", 0)
+
+        assert gfx_reader.read_graphic("Icons", 2).width == 3
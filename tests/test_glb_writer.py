@@ -0,0 +1,54 @@
+import io
+from pathlib import Path
+
+import numpy as np
+from PIL import Image
+from pygltflib import ARRAY_BUFFER, ELEMENT_ARRAY_BUFFER, GLTF2
+
+from europa1400_tools.converter.glb_writer import GlbWriter
+
+
+def create_png_bytes() -> bytes:
+    png_buffer = io.BytesIO()
+    Image.new("RGBA", (3, 2), (255, 0, 0, 128)).save(png_buffer, format="PNG")
+
+    return png_buffer.getvalue()
+
+
+def test_glb_writer_stores_views_and_images_in_one_aligned_buffer(tmp_path: Path):
+    indices = np.array([0, 1, 2], dtype=np.uint32)
+    vertices = np.arange(9, dtype=np.float32).reshape(3, 3)
+    png_data = create_png_bytes()
+    glb_path = tmp_path / "model.glb"
+
+    glb_writer = GlbWriter(GLTF2())
+    glb_writer.add_buffer_view(b"\x01\x02\x03", name="unaligned")
+    indices_view = glb_writer.add_buffer_view(
+        indices.tobytes(), target=ELEMENT_ARRAY_BUFFER
+    )
+    image_index = glb_writer.add_png_image(png_data, name="texture")
+    vertices_view = glb_writer.add_buffer_view(vertices.tobytes(), target=ARRAY_BUFFER)
+    glb_writer.write(glb_path)
+
+    gltf = GLTF2.load_binary(glb_path)
+    blob = gltf.binary_blob()
+
+    def read_view(view_index: int) -> bytes:
+        buffer_view = gltf.bufferViews[view_index]
+        return blob[
+            buffer_view.byteOffset : buffer_view.byteOffset + buffer_view.byteLength
+        ]
+
+    image = gltf.images[image_index]
+
+    assert len(gltf.buffers) == 1
+    assert gltf.buffers[0].uri is None
+    assert glb_path.stat().st_size % 4 == 0
+    assert all(buffer_view.byteOffset % 4 == 0 for buffer_view in gltf.bufferViews)
+    assert gltf.bufferViews[indices_view].target == ELEMENT_ARRAY_BUFFER
+    assert np.array_equal(np.frombuffer(read_view(indices_view), np.uint32), indices)
+    assert np.array_equal(
+        np.frombuffer(read_view(vertices_view), np.float32).reshape(3, 3), vertices
+    )
+    assert image.uri is None and image.mimeType == "image/png"
+    assert read_view(image.bufferView) == png_data
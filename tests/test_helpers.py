@@ -0,0 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from europa1400_tools.helpers import link_or_copy
+
+
+def test_link_or_copy_replaces_the_target_from_concurrent_jobs(tmp_path: Path):
+    source_path = tmp_path / "source.mp3"
+    target_path = tmp_path / "output" / "target.mp3"
+    source_path.write_bytes(b"mp3:RIFF-step")
+    target_path.parent.mkdir()
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        for future in [
+            executor.submit(link_or_copy, source_path, target_path) for _ in range(64)
+        ]:
+            future.result()
+
+    link_or_copy(source_path, target_path)
+
+    assert source_path.read_bytes() == b"mp3:RIFF-step"
+    assert target_path.read_bytes() == b"mp3:RIFF-step"
+    assert list(target_path.parent.iterdir()) == [target_path]
@@ -0,0 +1,64 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Callable
+
+import pytest
+
+from europa1400_tools.const import BAF_TO_BGFS_JSON, PACKAGE_DATA_PATH
+from europa1400_tools.helpers import get_baf_to_bgfs
+
+HEAVY_MODULES = ["numpy", "PIL", "pygltflib", "ffmpeg", "tkinter"]
+REPOSITORY_PATH = Path(__file__).parent.parent
+
+IMPORT_SCRIPT = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+import europa1400_tools.commands
+
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "modules": [name for name in %r if name in sys.modules],
+}))
+"""
+
+
+def import_commands() -> dict:
+    """Import the CLI in a fresh interpreter and return its import time and the
+    heavy modules it loaded."""
+
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT % HEAVY_MODULES],
+        capture_output=True,
+        check=True,
+        cwd=REPOSITORY_PATH,
+        text=True,
+    )
+
+    return json.loads(result.stdout)
+
+
+def test_cli_import_does_not_load_heavy_modules():
+    assert import_commands()["modules"] == []
+
+
+@pytest.mark.benchmark
+def test_benchmark_cli_import(report_benchmark: Callable[[str], None]):
+    report_benchmark(
+        f"europa1400_tools.commands imported in {import_commands()['seconds']:.3f} s"
+    )
+
+
+def test_baf_to_bgfs_is_loaded_from_package_data():
+    baf_to_bgfs = get_baf_to_bgfs()
+
+    assert (PACKAGE_DATA_PATH / BAF_TO_BGFS_JSON).is_file()
+    assert get_baf_to_bgfs() is baf_to_bgfs
+    assert all(
+        baf_path.lower().endswith(".baf") and isinstance(bgf_paths, list)
+        for baf_path, bgf_paths in baf_to_bgfs.items()
+    )
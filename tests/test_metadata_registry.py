@@ -0,0 +1,39 @@
+from pathlib import Path
+
+from europa1400_tools.converter.metadata_registry import ObjectMetadataRegistry
+from europa1400_tools.models.metadata import ObjectMetadata, TextureMetadata
+
+
+def create_object_metadata(index: int, texture_names: list[str]) -> ObjectMetadata:
+    return ObjectMetadata(
+        name=f"Objekt_{index}",
+        path=Path(f"objekte/Objekt_{index}.bgf"),
+        textures=[
+            TextureMetadata(name=name, path=Path(f"{name}.png"), has_transparency=False)
+            for name in texture_names
+        ],
+        animations=[],
+        txs_path=None,
+    )
+
+
+def test_registry_finds_objects_by_path_and_textures_by_normalized_name():
+    object_metadatas = [
+        create_object_metadata(index, [f"Textur_{index}", "Holz", "holz"])
+        for index in range(3)
+    ]
+    registry = ObjectMetadataRegistry(object_metadatas)
+
+    object_metadata = registry.get_object_metadata(Path("objekte/Objekt_1.bgf"))
+
+    assert object_metadata is object_metadatas[1]
+    assert registry.get_object_metadata(Path("objekte/Objekt_3.bgf")) is None
+    assert (
+        registry.get_texture_metadata(object_metadata, "TEXTUR_1.bmp")
+        is object_metadata.textures[0]
+    )
+    assert (
+        registry.get_texture_metadata(object_metadata, "HOLZ.bmp")
+        is object_metadata.textures[1]
+    )
+    assert registry.get_texture_metadata(object_metadata, "Textur_0") is None
@@ -0,0 +1,141 @@
+import pickle
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Callable
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from europa1400_tools.cli.common_options import CommonOptions
+from europa1400_tools.preprocessor.objects_preprocessor import ObjectsPreprocessor
+
+
+def test_convert_bmp_to_png_with_transparency(tmp_path: Path):
+    rng = np.random.default_rng(1400)
+    pixels = rng.integers(0, 4, size=(8, 6, 3), dtype=np.uint8)
+    bmp_path = tmp_path / "texture.bmp"
+    png_path = tmp_path / "texture.png"
+    Image.fromarray(pixels, "RGB").save(bmp_path)
+
+    ObjectsPreprocessor.convert_bmp_to_png_with_transparency(bmp_path, png_path)
+    transparent_pixels = np.array(Image.open(png_path))
+
+    ObjectsPreprocessor.convert_bmp_to_png(bmp_path, png_path)
+    opaque_pixels = np.array(Image.open(png_path))
+
+    is_black = (pixels == 0).all(axis=-1)
+    assert is_black.any()
+    assert (transparent_pixels[is_black] == 0).all()
+    assert (transparent_pixels[~is_black, :3] == pixels[~is_black]).all()
+    assert (transparent_pixels[~is_black, 3] == 255).all()
+    assert (opaque_pixels[..., :3] == pixels).all()
+    assert (opaque_pixels[..., 3] == 255).all()
+
+
+class ObjectsPreprocessorWithoutTextures(ObjectsPreprocessor):
+    def convert_textures(self, texture_conversions):
+        self.texture_conversions = texture_conversions
+
+
+def create_objects_corpus(
+    output_path: Path, object_count: int, texture_count: int
+) -> tuple[list[Path], list[Path], list[Path]]:
+    """Write decoded objects and TXS files with textures named like the game's."""
+
+    common_options = CommonOptions(_output_path=str(output_path))
+    texture_paths = [
+        common_options.extracted_textures_path / f"Textur_{index}.bmp"
+        for index in range(texture_count)
+    ]
+    object_pickle_paths: list[Path] = []
+    txs_pickle_paths: list[Path] = []
+
+    common_options.extracted_textures_path.mkdir(parents=True)
+
+    for texture_path in texture_paths:
+        texture_path.touch()
+
+    for index in range(object_count):
+        name = f"Objekt_{index}"
+        textures = [
+            SimpleNamespace(
+                name=f"TEXTUR_{(index + offset) % texture_count}.bmp", num0B=0
+            )
+            for offset in range(3)
+        ]
+
+        if index % 10 == 0:
+            textures.append(SimpleNamespace(name=f"Fehlt_{index}.bmp", num0B=1))
+
+            txs_pickle_path = common_options.decoded_txs_path / f"{name}.pickle"
+            txs_pickle_path.parent.mkdir(parents=True, exist_ok=True)
+            txs_pickle_path.write_bytes(
+                pickle.dumps(
+                    SimpleNamespace(texture_names=[f"textur_{index % texture_count}"])
+                )
+            )
+            txs_pickle_paths.append(txs_pickle_path)
+
+        bgf = SimpleNamespace(
+            name=name,
+            textures=textures,
+            mapping_object=SimpleNamespace(vertex_mapping_count=8),
+        )
+        object_pickle_path = common_options.decoded_objects_path / f"{name}.pickle"
+        object_pickle_path.parent.mkdir(parents=True, exist_ok=True)
+        object_pickle_path.write_bytes(pickle.dumps(bgf))
+        object_pickle_paths.append(object_pickle_path)
+
+    return texture_paths, object_pickle_paths, txs_pickle_paths
+
+
+def test_preprocess_objects_falls_back_to_txs_main_texture(tmp_path: Path):
+    texture_paths, object_pickle_paths, txs_pickle_paths = create_objects_corpus(
+        tmp_path, 20, 5
+    )
+    objects_preprocessor = ObjectsPreprocessorWithoutTextures()
+
+    object_metadatas = objects_preprocessor.preprocess_objects(
+        texture_paths, object_pickle_paths, txs_pickle_paths, []
+    )
+    texture_paths_by_name = {
+        texture_metadata.name: texture_metadata.path
+        for texture_metadata in object_metadatas[10].textures
+    }
+
+    assert object_metadatas[10].txs_path == Path("Objekt_10.pickle")
+    assert texture_paths_by_name == {
+        "TEXTUR_0": Path("TEXTUR_0.png"),
+        "TEXTUR_1": Path("TEXTUR_1.png"),
+        "TEXTUR_2": Path("TEXTUR_2.png"),
+        "Fehlt_10": Path("Fehlt_10.png"),
+    }
+    assert (
+        texture_paths[0],
+        tmp_path / "converted" / "textures" / "Fehlt_10.png",
+        True,
+    ) in objects_preprocessor.texture_conversions
+
+
+@pytest.mark.benchmark
+def test_benchmark_preprocess_objects(
+    tmp_path: Path, report_benchmark: Callable[[str], None]
+):
+    object_count = 10_000
+    texture_count = 5_000
+    texture_paths, object_pickle_paths, txs_pickle_paths = create_objects_corpus(
+        tmp_path, object_count, texture_count
+    )
+
+    start = time.perf_counter()
+    ObjectsPreprocessorWithoutTextures().preprocess_objects(
+        texture_paths, object_pickle_paths, txs_pickle_paths, []
+    )
+    elapsed = time.perf_counter() - start
+
+    report_benchmark(
+        f"{object_count} objects, {texture_count} textures: "
+        + f"preprocessed in {elapsed:.2f} s"
+    )
@@ -0,0 +1,49 @@
+from pathlib import Path
+from typing import Callable
+
+from europa1400_tools.construct.sbf import Sbf, SbfReader
+
+
+def test_sbf_mapped_sounds_are_views_into_the_file(
+    tmp_path: Path, create_sbf_file: Callable[..., None]
+):
+    sbf_path = tmp_path / "test.sbf"
+    create_sbf_file(
+        sbf_path, {"steps": [b"RIFF-step-1", b"RIFF-step-22"], "door": [b"RIFF-door"]}
+    )
+
+    sbf = Sbf.from_file(sbf_path)
+    mapped_sbf = Sbf.from_file(sbf_path, mapped=True)
+
+    assert [soundbank.sounds for soundbank in sbf.soundbanks] == [
+        [b"RIFF-step-1", b"RIFF-step-22"],
+        [b"RIFF-door"],
+    ]
+    assert all(
+        isinstance(sound, memoryview)
+        for soundbank in mapped_sbf.soundbanks
+        for sound in soundbank.sounds
+    )
+    assert [soundbank.sounds for soundbank in mapped_sbf.soundbanks] == [
+        soundbank.sounds for soundbank in sbf.soundbanks
+    ]
+    assert mapped_sbf.path == sbf.path
+
+
+def test_sbf_reader_reads_the_sounds_of_the_parsed_sbf(
+    tmp_path: Path, create_sbf_file: Callable[..., None]
+):
+    sbf_path = tmp_path / "test.sbf"
+    create_sbf_file(
+        sbf_path, {"steps": [b"RIFF-step-1", b"RIFF-step-22"], "door": [b"RIFF-door"]}
+    )
+
+    sbf = Sbf.from_file(sbf_path)
+
+    with open(sbf_path, "rb") as file:
+        sbf_reader = SbfReader(file)
+        sounds = list(sbf_reader.iter_sounds())
+
+    assert sbf_reader.name == sbf.name
+    assert sounds == list(sbf.iter_sounds())
+    assert [sound.sound_count for sound, _ in sounds] == [2, 2, 1]
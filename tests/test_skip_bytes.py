@@ -0,0 +1,45 @@
+import io
+
+import construct as cs
+import pytest
+
+from europa1400_tools.construct.common import SKIP_BYTES_CHUNK_SIZE, SkipBytes
+
+
+def skip_greedily(data: bytes, values: set[int]) -> tuple[bytes, int]:
+    def cancel_on_unacceptable(obj, ctx):
+        if obj not in values:
+            raise cs.CancelParsing
+
+    stream = io.BytesIO(data)
+    skipped = cs.GreedyRange(cs.Byte * cancel_on_unacceptable).parse_stream(stream)
+
+    return bytes(skipped), stream.tell()
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"\x28",
+        b"\x00\x01\x00\x28\x00",
+        b"\x00" * 10,
+        b"\x01" * (SKIP_BYTES_CHUNK_SIZE - 1) + b"\x28",
+        b"\x00" * SKIP_BYTES_CHUNK_SIZE,
+        b"\x01" * (SKIP_BYTES_CHUNK_SIZE * 2 + 3) + b"\x05\x00",
+    ],
+)
+def test_skip_bytes_matches_greedy_range(data: bytes):
+    values = {0, 1}
+    stream = io.BytesIO(data)
+
+    skipped = SkipBytes(values).parse_stream(stream)
+
+    assert (skipped, stream.tell()) == skip_greedily(data, values)
+
+
+def test_skip_bytes_builds_skipped_bytes():
+    assert SkipBytes([0]).build(b"\x00\x00") == b"\x00\x00"
+
+    with pytest.raises(cs.ValidationError):
+        SkipBytes([0]).build(b"\x00\x01")